@@ -34,7 +34,7 @@ from ..const.base import (
   DAUTH_NONCE, dAuth,
 )
 
-from .evm import _EVMMixin, Web3, EE_VPN_IMPL
+from .evm import _EVMMixin, EE_VPN_IMPL
 from .chain import _ChainMixin
 
 EVM_COMMENT = " # "
@@ -505,6 +505,23 @@ class BaseBlockEngine(
       **kwargs
     )
     return
+
+
+  def is_verbose(self, verbosity=1):
+    """
+    Check if a message logged with the given `verbosity` passes the engine threshold.
+
+    Parameters
+    ----------
+    verbosity : int, optional
+        The verbosity level of the message. The default is 1.
+
+    Returns
+    -------
+    bool
+        True if `self.P(..., verbosity=verbosity)` would display the message.
+    """
+    return verbosity <= self.__verbosity
   
   
   @property
@@ -1,14 +1,18 @@
 import json
 import os
+import time
 
 from collections import namedtuple
 from copy import deepcopy
+from functools import lru_cache
+from threading import Lock
 
 from datetime import timezone, datetime
 
-from eth_account import Account
-from eth_utils import keccak, to_checksum_address
-from eth_account.messages import encode_defunct
+# `eth_hash` resolves its backend on the first hash, so this import is cheap; the
+# heavy `eth_account`/`eth_utils`/`web3` packages are imported on first use only
+from eth_hash.auto import keccak
+from cryptography.hazmat.primitives import serialization
 
 from ..const.base import EE_VPN_IMPL_ENV_KEY, dAuth, BCctbase, ETHVarTypes, EVM_ABI_DATA
 from ..const.evm_net import EVM_NET_DATA, EvmNetData
@@ -31,19 +35,497 @@ Web3Vars = namedtuple(
     "poai_manager_address",
     "attestation_registry_address",
     "dauth_oracle_registry_address",
+    "genesis_ts",
   ]
 )
 
+# `getNodeLicenseDetails` result (the `LicenseDetails` struct) plus the lookup network and
+# the derived validity flag; `_asdict()` gives the `web3_get_node_info` dictionary
+NodeLicenseDetails = namedtuple(
+  "NodeLicenseDetails", [
+    "network",
+    "licenseType",
+    "licenseId",
+    "owner",
+    "nodeAddress",
+    "totalAssignedAmount",
+    "totalClaimedAmount",
+    "lastClaimEpoch",
+    "assignTimestamp",
+    "lastClaimOracle",
+    "isBanned",
+    "isValid",
+  ]
+)
 
-if not EE_VPN_IMPL:
-  from web3 import Web3
-  from web3.logs import DISCARD
-else:
+
+if EE_VPN_IMPL:
   class Web3:
     """
     VPS enabled. Web3 is not available.
     """
 
+# names that used to be imported at module level, kept reachable as module attributes
+_LAZY_EVM_IMPORTS = {
+  "Account": ("eth_account", "Account"),
+  "encode_defunct": ("eth_account.messages", "encode_defunct"),
+  "to_checksum_address": ("eth_utils", "to_checksum_address"),
+  "Web3": ("web3", "Web3"),
+  "DISCARD": ("web3.logs", "DISCARD"),
+}
+
+
+def __getattr__(name):
+  """
+  Resolve the heavy EVM dependencies (`eth_account`, `eth_utils`, `web3`) on first access.
+
+  Importing them costs several hundred ms and a lot of resident memory, which tools that
+  never touch the EVM paths should not pay. The mixin methods import what they need
+  locally; this hook keeps the former module attributes (e.g. `evm.Account`) available.
+  """
+  if name in _LAZY_EVM_IMPORTS:
+    from importlib import import_module
+    module_name, attr_name = _LAZY_EVM_IMPORTS[name]
+    value = getattr(import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+WEB3_HTTP_TIMEOUT = 30 # seconds, applied to every JSON-RPC request
+WEB3_HTTP_POOL_CONNECTIONS = 8
+WEB3_HTTP_POOL_MAXSIZE = 64 # per RPC host, sized for concurrent (threaded) lookups
+# transport level retries, only where the request was surely not processed (connection
+# errors, rate limiting) so they are safe for transaction sends as well - the only retry
+# layer, web3's own `exception_retry_configuration` is disabled on our providers
+WEB3_HTTP_MAX_RETRIES = 3
+WEB3_HTTP_RETRY_BACKOFF = 0.3
+
+WEB3_ASYNC_MAX_CONCURRENCY = 32 # in-flight requests per batched async lookup
+
+_WEB3_LOCK = Lock()
+_WEB3_HTTP_SESSION = None
+_ASYNC_WEB3_INSTANCES = {}
+
+# below this many uncached conversions the thread hand-off costs more than it saves
+EVM_CRYPTO_POOL_MIN_BATCH = 32
+EVM_CRYPTO_POOL_MAX_WORKERS = 8
+
+_CRYPTO_POOL_LOCK = Lock()
+_CRYPTO_POOL = None
+
+# all digits, so the lowercase and the checksum forms are the same string
+EVM_ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_CHUNK_SIZE = 500 # sub-calls per `aggregate3`, keeps each eth_call under the RPC gas cap
+JSON_RPC_BATCH_CHUNK_SIZE = 100 # requests per JSON-RPC batch, many public RPCs cap batches at 100
+
+# `getNodeLicenseDetails(address)`: 4-byte selector, ABI output (the `LicenseDetails` struct)
+# and the indices of its address fields
+_NODE_LICENSE_DETAILS_SELECTOR = bytes.fromhex("292ef0d7")
+_NODE_LICENSE_DETAILS_TYPE = (
+  "(uint8,uint256,address,address,uint256,uint256,uint256,uint256,address,bool,uint256,uint256)"
+)
+_NODE_LICENSE_ADDRESS_FIELDS = (2, 3, 8)
+NODE_INFO_CACHE_TTL = 30 # seconds, licenses only change on claims / epoch boundaries
+NODE_INFO_CACHE_MAXSIZE = 4096
+
+# guards the per-engine node info caches, read and written from several threads
+# and from the async lookups
+_NODE_INFO_CACHE_LOCK = Lock()
+_ABI_ADDRESS_PADDING = bytes(12)
+
+
+def _get_shared_web3_session():
+  """
+  Return the process-wide pooled `requests.Session` used by every `Web3` provider.
+
+  Sharing the session keeps the TCP/TLS connection to each RPC endpoint alive and
+  reuses it, instead of re-establishing it for every new (temporary) `Web3` object.
+  Only the transport is shared: the providers and `Web3` instances built on top of it
+  stay per engine, so middleware, `default_account` and batching state do not leak.
+
+  Returns
+  -------
+  requests.Session
+      The lazily created session with the pooled, retrying HTTP adapter mounted.
+  """
+  global _WEB3_HTTP_SESSION
+  if _WEB3_HTTP_SESSION is None:
+    with _WEB3_LOCK:
+      if _WEB3_HTTP_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        session = requests.Session()
+        adapter = HTTPAdapter(
+          pool_connections=WEB3_HTTP_POOL_CONNECTIONS,
+          pool_maxsize=WEB3_HTTP_POOL_MAXSIZE,
+          max_retries=Retry(
+            total=WEB3_HTTP_MAX_RETRIES,
+            connect=WEB3_HTTP_MAX_RETRIES,
+            read=0,
+            status=WEB3_HTTP_MAX_RETRIES,
+            status_forcelist=(429,),
+            allowed_methods=None, # JSON-RPC is always POST
+            backoff_factor=WEB3_HTTP_RETRY_BACKOFF,
+            raise_on_status=False,
+          ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _WEB3_HTTP_SESSION = session
+      #end if session
+  #end if session
+  return _WEB3_HTTP_SESSION
+
+
+def _new_web3(rpc_url: str):
+  """
+  Build a new `Web3` instance for `rpc_url` on top of the shared pooled session.
+
+  web3's own `exception_retry_configuration` is disabled: the session adapter already
+  retries connection errors and rate limiting, and stacking both layers would multiply
+  the attempts (and the worst case latency) of every failing request.
+
+  Parameters
+  ----------
+  rpc_url : str
+      The JSON-RPC HTTP endpoint.
+
+  Returns
+  -------
+  Web3
+      A `Web3` instance owned by the caller, with its own `HTTPProvider`.
+  """
+  from web3 import Web3
+  return Web3(Web3.HTTPProvider(
+    rpc_url,
+    request_kwargs={"timeout": WEB3_HTTP_TIMEOUT},
+    session=_get_shared_web3_session(),
+    exception_retry_configuration=None,
+  ))
+
+
+def _get_crypto_pool():
+  """
+  Return the process-wide thread pool used for batched node -> EVM address derivations.
+
+  The keccak backends run in C and release the GIL, so independent derivations can
+  overlap. Returns None on single-core hosts where a pool only adds overhead.
+
+  Returns
+  -------
+  ThreadPoolExecutor or None
+      The shared pool, created on first use.
+  """
+  global _CRYPTO_POOL
+  n_workers = min(os.cpu_count() or 1, EVM_CRYPTO_POOL_MAX_WORKERS)
+  if n_workers < 2:
+    return None
+  if _CRYPTO_POOL is None:
+    with _CRYPTO_POOL_LOCK:
+      if _CRYPTO_POOL is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _CRYPTO_POOL = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="evm_crypto")
+  return _CRYPTO_POOL
+
+
+def _get_shared_async_web3(rpc_url: str):
+  """
+  Return the process-wide `AsyncWeb3` instance for `rpc_url`.
+
+  The `aiohttp` sessions are cached by web3 per endpoint and event loop, so one
+  instance per RPC is enough for any number of loops/threads.
+
+  Parameters
+  ----------
+  rpc_url : str
+      The JSON-RPC HTTP endpoint.
+
+  Returns
+  -------
+  AsyncWeb3
+      The cached `AsyncWeb3` instance bound to `rpc_url`.
+  """
+  w3 = _ASYNC_WEB3_INSTANCES.get(rpc_url)
+  if w3 is None:
+    with _WEB3_LOCK:
+      w3 = _ASYNC_WEB3_INSTANCES.get(rpc_url)
+      if w3 is None:
+        from aiohttp import ClientTimeout
+        from web3 import AsyncHTTPProvider, AsyncWeb3
+        w3 = AsyncWeb3(AsyncHTTPProvider(
+          rpc_url,
+          request_kwargs={"timeout": ClientTimeout(total=WEB3_HTTP_TIMEOUT)},
+        ))
+        _ASYNC_WEB3_INSTANCES[rpc_url] = w3
+      #end if w3
+  #end if w3
+  return w3
+
+
+@lru_cache(maxsize=8192)
+def _is_valid_evm_address_cached(address: str) -> bool:
+  """
+  Memoized core of `_EVMMixin.is_valid_evm_address`.
+
+  Oracle and node flows validate the same handful of addresses over and over,
+  so the result is cached per (immutable) address string.
+
+  Parameters
+  ----------
+  address : str
+      The address string to verify. Must be hashable (already checked to be a `str`).
+
+  Returns
+  -------
+  bool
+      True if `address` is `0x` followed by exactly 40 hex digits.
+  """
+  # Basic checks:
+  # A) Must start with '0x'
+  # B) Must be exactly 42 characters in total
+  # C) All remaining characters must be valid hexadecimal digits
+  if not address.startswith("0x"):
+    return False
+  if len(address) != 42:
+    return False
+  try:
+    # `bytes.fromhex` tolerates whitespace between byte pairs, so the decoded
+    # length must be checked as well in order to reject padded inputs
+    return len(bytes.fromhex(address[2:])) == 20
+  except ValueError:
+    return False
+
+_CHECKSUM_UPPER_NIBBLES = frozenset("89abcdef")
+
+def _checksum_hex_address(addr_hex: str) -> str:
+  """
+  EIP-55 checksum encoding for an already lowercase, unprefixed 40-char hex address.
+
+  Equivalent to `eth_utils.to_checksum_address("0x" + addr_hex)` but skips the input
+  validation/normalization layers, which is safe for internally derived addresses.
+
+  Parameters
+  ----------
+  addr_hex : str
+      The 40 lowercase hex characters of the address (no `0x` prefix).
+
+  Returns
+  -------
+  str
+      The `0x`-prefixed checksum address.
+  """
+  # a letter is upper-cased when the matching nibble of keccak(address) is >= 8
+  hash_hex = keccak(addr_hex.encode("ascii")).hex()
+  return "0x" + "".join([
+    c.upper() if h in _CHECKSUM_UPPER_NIBBLES else c
+    for c, h in zip(addr_hex, hash_hex)
+  ])
+
+@lru_cache(maxsize=8192)
+def _checksum_decoded_address(address: str) -> str:
+  """
+  Memoized checksum of an ABI-decoded (lowercase, `0x`-prefixed) address.
+
+  Decoded owners, oracles and the zero address repeat across lookups, so the Keccak
+  pass of `_checksum_hex_address` is paid once per distinct address.
+
+  Parameters
+  ----------
+  address : str
+      The lowercase `0x` + 40 hex chars address as returned by eth_abi.
+
+  Returns
+  -------
+  str
+      The `0x`-prefixed checksum address.
+  """
+  return _checksum_hex_address(address[2:])
+
+@lru_cache(maxsize=8192)
+def _is_checksum_evm_address(address: str) -> bool:
+  """
+  Memoized EIP-55 check, the same acceptance rule as web3's ABI address validation.
+
+  Parameters
+  ----------
+  address : str
+      The address string.
+
+  Returns
+  -------
+  bool
+      True if `address` is a valid, correctly checksummed EVM address.
+  """
+  if not _is_valid_evm_address_cached(address):
+    return False
+  return _checksum_hex_address(address[2:].lower()) == address
+
+
+class _PackedFallback(Exception):
+  """
+  Raised by the packed encoders for values they do not handle - `Web3.solidity_keccak`
+  is used instead (including its validation errors).
+  """
+
+
+_UINT256_LIMIT = 2 ** 256
+
+def _packed_uint256(value) -> bytes:
+  if type(value) is not int or not (0 <= value < _UINT256_LIMIT):
+    raise _PackedFallback()
+  return value.to_bytes(32, 'big')
+
+def _packed_uint256_array(value) -> bytes:
+  if not isinstance(value, (list, tuple)):
+    raise _PackedFallback()
+  # solidity pads each array element to 32 bytes even in packed mode
+  return b"".join([_packed_uint256(v) for v in value])
+
+def _packed_string(value) -> bytes:
+  if type(value) is not str:
+    raise _PackedFallback()
+  return value.encode('utf-8')
+
+def _packed_address(value) -> bytes:
+  if type(value) is not str or not _is_checksum_evm_address(value):
+    raise _PackedFallback()
+  return bytes.fromhex(value[2:])
+
+def _packed_bytes(value) -> bytes:
+  if isinstance(value, (bytes, bytearray)):
+    return bytes(value)
+  if type(value) is not str or not value.startswith("0x") or len(value) % 2:
+    raise _PackedFallback()
+  try:
+    return bytes.fromhex(value[2:])
+  except ValueError:
+    raise _PackedFallback()
+
+_PACKED_ENCODERS = {
+  ETHVarTypes.ETH_ADDR: _packed_address,
+  ETHVarTypes.ETH_INT: _packed_uint256,
+  ETHVarTypes.ETH_BYTES: _packed_bytes,
+  ETHVarTypes.ETH_STR: _packed_string,
+  ETHVarTypes.ETH_ARRAY_INT: _packed_uint256_array,
+}
+
+
+@lru_cache(maxsize=256)
+def _get_packed_encoders(types: tuple):
+  """
+  Resolve (once per type signature) the specialized packed encoders of `types`.
+
+  Parameters
+  ----------
+  types : tuple of str
+      The solidity types (e.g. `("address", "uint256", "uint256", "bytes")`).
+
+  Returns
+  -------
+  tuple of callable or None
+      The per-value encoders, or None if any type is not specialized.
+  """
+  encoders = tuple(_PACKED_ENCODERS.get(t) for t in types)
+  if None in encoders:
+    return None
+  return encoders
+
+
+def _solidity_keccak(types, values) -> bytes:
+  """
+  `Web3.solidity_keccak` with specialized encoders for the signatures used by the SDK.
+
+  The packed encoding of the common types is emitted directly and hashed once; any
+  other type or any value outside the plain fast-path shape goes through
+  `Web3.solidity_keccak` so results (and errors) are identical.
+
+  Parameters
+  ----------
+  types : list of str
+      The solidity types.
+
+  values : list
+      The values to hash.
+
+  Returns
+  -------
+  bytes
+      The keccak256 digest of the packed values.
+  """
+  if len(types) == len(values):
+    encoders = _get_packed_encoders(tuple(types))
+    if encoders is not None:
+      try:
+        return keccak(b"".join([enc(v) for enc, v in zip(encoders, values)]))
+      except _PackedFallback:
+        pass
+  from web3 import Web3
+  return Web3.solidity_keccak(types, values)
+
+
+def _encode_node_license_details_call(node_address: str) -> bytes:
+  """
+  Build the `getNodeLicenseDetails(address)` calldata without the web3 contract wrapper.
+
+  Parameters
+  ----------
+  node_address : str
+      An already validated `0x` + 40 hex chars address (any casing).
+
+  Returns
+  -------
+  bytes
+      The selector followed by the left-padded address word.
+  """
+  return _NODE_LICENSE_DETAILS_SELECTOR + _ABI_ADDRESS_PADDING + bytes.fromhex(node_address[2:])
+
+
+@lru_cache(maxsize=1)
+def _get_node_license_decoder():
+  """
+  Build (once) the eth_abi decoder of the `getNodeLicenseDetails` output struct.
+
+  `eth_abi.decode` re-validates the type list and assembles a new tuple decoder on
+  every call, which is about half of the decoding time of this struct.
+
+  Returns
+  -------
+  tuple
+      The `(stream_class, decoder)` pair, `decoder(stream_class(raw))` decodes the struct.
+  """
+  from eth_abi.abi import default_codec
+  from eth_abi.registry import registry
+  return default_codec.stream_class, registry.get_decoder(_NODE_LICENSE_DETAILS_TYPE)
+
+
+def _decode_node_license_details(raw: bytes) -> list:
+  """
+  Decode the raw `getNodeLicenseDetails` return data with a prebuilt eth_abi decoder.
+
+  The address fields are checksummed so the result matches what the web3 contract
+  `.call()` returns (eth_abi yields lowercase addresses). The node address argument
+  itself is never checksummed on this path, only validated.
+
+  Parameters
+  ----------
+  raw : bytes
+      The `eth_call` return data.
+
+  Returns
+  -------
+  list
+      The `LicenseDetails` struct fields.
+  """
+  stream_class, decoder = _get_node_license_decoder()
+  result = list(decoder(stream_class(raw)))
+  for idx in _NODE_LICENSE_ADDRESS_FIELDS:
+    result[idx] = _checksum_decoded_address(result[idx])
+  return result
 
 
 class _EVMMixin:
@@ -63,8 +545,52 @@ class _EVMMixin:
     }
   ]
 
+  def is_verbose(self, verbosity: int = 1) -> bool:
+    """
+    Check if a message logged via `self.P(..., verbosity=verbosity)` would be displayed.
+
+    Used to skip building expensive log strings (e.g. JSON dumps of transactions).
+    Hosts with a verbosity threshold (such as `BaseBlockEngine`) override this; the
+    default assumes every message is displayed.
+
+    Parameters
+    ----------
+    verbosity : int, optional
+        The verbosity level of the message. The default is 1.
+
+    Returns
+    -------
+    bool
+        True if the message would be displayed.
+    """
+    return True
+
+
   # EVM address methods
   if True:
+    def _get_evm_cache(self, name: str) -> dict:
+      """
+      Return the per-instance cache dict stored under `name`, creating it on first use.
+
+      The caches are created lazily because the mixin does not own `__init__`
+      (hosts such as `BaseBlockEngine` build their state in `_build`).
+
+      Parameters
+      ----------
+      name : str
+          The attribute name of the cache (e.g. `"_node_to_eth_cache"`).
+
+      Returns
+      -------
+      dict
+          The cache dictionary.
+      """
+      cache = self.__dict__.get(name)
+      if cache is None:
+        cache = {}
+        setattr(self, name, cache)
+      return cache
+
     @staticmethod
     def is_valid_evm_address(address: str) -> bool:
       """
@@ -80,20 +606,10 @@ class _EVMMixin:
       bool
           True if `address` meets the basic criteria for an EVM address, False otherwise.
       """
-      # Basic checks:
-      # A) Must start with '0x'
-      # B) Must be exactly 42 characters in total
-      # C) All remaining characters must be valid hexadecimal digits
+      # non-str inputs may be unhashable so they are rejected before the cache
       if not isinstance(address, str):
         return False
-      if not address.startswith("0x"):
-        return False
-      if len(address) != 42:
-        return False
-      
-      hex_part = address[2:]
-      # Ensure all characters in the hex part are valid hex digits
-      return all(c in "0123456789abcdefABCDEF" for c in hex_part)
+      return _is_valid_evm_address_cached(address)
     
     @property
     def eth_types(self) -> ETHVarTypes:
@@ -117,26 +633,66 @@ class _EVMMixin:
       return _EVMMixin.is_valid_evm_address(address)
 
 
+    @staticmethod
+    def _pk_to_eth_bytes(pk) -> bytes:
+      """
+      Derive the raw 20-byte Ethereum address of an EC public key.
+
+      Parameters
+      ----------
+      pk : EllipticCurvePublicKey
+          The secp256k1 public key.
+
+      Returns
+      -------
+      bytes
+          The last 20 bytes of keccak256(x || y).
+      """
+      # Compute Ethereum-compatible address: keccak over the 64-byte `x || y`, ie the
+      # uncompressed SEC1 point without its 0x04 prefix. The point is serialized by the
+      # native (OpenSSL) backend instead of round-tripping `x`/`y` through Python ints
+      uncompressed_key = pk.public_bytes(
+        encoding=serialization.Encoding.X962,
+        format=serialization.PublicFormat.UncompressedPoint,
+      )
+      return keccak(uncompressed_key[1:])[-20:]
+
+
     def _get_eth_address(self, pk=None):
       if pk is None:
         pk = self.public_key
-      raw_public_key = pk.public_numbers()
-
-      # Compute Ethereum-compatible address
-      x = raw_public_key.x.to_bytes(32, 'big')
-      y = raw_public_key.y.to_bytes(32, 'big')
-      uncompressed_key = b'\x04' + x + y
-      keccak_hash = keccak(uncompressed_key[1:])  # Remove 0x04 prefix
-      eth_address = "0x" + keccak_hash[-20:].hex()
-      eth_address = to_checksum_address(eth_address)
+      eth_address = _checksum_hex_address(self._pk_to_eth_bytes(pk).hex())
       return eth_address    
 
 
     def _get_eth_account(self):
+      from eth_account import Account
       private_key_bytes = self.private_key.private_numbers().private_value.to_bytes(32, 'big')
       return Account.from_key(private_key_bytes)
 
+    def _get_eth_signing_key(self):
+      """
+      Return the `eth_keys.PrivateKey` of `eth_account`, built once from its raw key
+      bytes and cached on the instance (keyed by the key, so a replaced account is
+      picked up).
+
+      Returns
+      -------
+      eth_keys.datatypes.PrivateKey
+          The parsed private key, accepted by `Account.sign_message`.
+      """
+      from eth_keys import keys
+      key_bytes = bytes(self.eth_account.key)
+      cache = self._get_evm_cache("_signing_key_cache")
+      signing_key = cache.get(key_bytes)
+      if signing_key is None:
+        cache.clear()
+        signing_key = keys.PrivateKey(key_bytes)
+        cache[key_bytes] = signing_key
+      return signing_key
+
     def _get_eth_account_from_private_key(self, private_key: str):
+      from eth_account import Account
       assert isinstance(private_key, str), "Private key must be a string"
       key = private_key.strip()
       if key.startswith("0x"):
@@ -160,9 +716,70 @@ class _EVMMixin:
       -------
       str
           The Ethereum address.
+
+      Notes
+      -----
+      The EC point decode + keccak + checksum derivation is deterministic, so the
+      result is memoized per node address for the lifetime of the engine.
       """
-      public_key = self._address_to_pk(address)
-      return self._get_eth_address(pk=public_key)
+      cache = self._get_evm_cache("_node_to_eth_cache")
+      eth_address = cache.get(address)
+      if eth_address is None:
+        eth_address = _checksum_hex_address(self.node_address_to_eth_bytes(address).hex())
+        cache[address] = eth_address
+      return eth_address
+
+
+    def node_address_to_eth_bytes(self, address) -> bytes:
+      """
+      Converts a node address to its raw 20-byte Ethereum address.
+
+      Preferred over `node_address_to_eth_address` when the result is only compared
+      or packed (no hex/checksum string is built).
+
+      Parameters
+      ----------
+      address : str
+          The node address convert.
+
+      Returns
+      -------
+      bytes
+          The 20-byte Ethereum address.
+
+      Notes
+      -----
+      The point decoding is left to the host `_address_to_pk` (native backend, and
+      aware of the host address encoding); the result is memoized per node address.
+      """
+      cache = self._get_evm_cache("_node_to_eth_bytes_cache")
+      eth_bytes = cache.get(address)
+      if eth_bytes is None:
+        eth_bytes = self._pk_to_eth_bytes(self._address_to_pk(address))
+        cache[address] = eth_bytes
+      return eth_bytes
+
+
+    @staticmethod
+    def eth_addresses_to_set(lst_eth_addrs) -> frozenset:
+      """
+      Build the lookup set used by `is_node_address_in_eth_addresses`.
+
+      Callers that check many node addresses against the same list (e.g. the oracles
+      returned by `web3_get_oracles`) should convert the list once and pass the result.
+
+      Parameters
+      ----------
+      lst_eth_addrs : iterable of str
+        Ethereum addresses. Matching is exact, like a list lookup, so the casing is
+        kept as is (node addresses convert to the checksum form).
+
+      Returns
+      -------
+      frozenset
+        The addresses, unchanged.
+      """
+      return frozenset(lst_eth_addrs)
 
 
     def is_node_address_in_eth_addresses(self, node_address: str, lst_eth_addrs) -> bool:
@@ -174,8 +791,10 @@ class _EVMMixin:
       node_address : str
         the node address.
         
-      lst_eth_addrs : list
-        list of Ethereum addresses.
+      lst_eth_addrs : list or set
+        list of Ethereum addresses. A `set`/`frozenset` (ideally the output of
+        `eth_addresses_to_set`) is used directly for O(1) membership; any other
+        iterable is converted to a set first. Matching is exact (case-sensitive).
 
       Returns
       -------
@@ -184,7 +803,65 @@ class _EVMMixin:
 
       """
       eth_addr = self.node_address_to_eth_address(node_address)
-      return eth_addr in lst_eth_addrs    
+      if not isinstance(lst_eth_addrs, (set, frozenset)):
+        lst_eth_addrs = self.eth_addresses_to_set(lst_eth_addrs)
+      return eth_addr in lst_eth_addrs
+
+
+    def node_addresses_to_eth_addresses(self, node_addresses) -> list:
+      """
+      Converts a batch of node addresses to Ethereum addresses.
+
+      Parameters
+      ----------
+      node_addresses : iterable of str
+        The node addresses.
+
+      Returns
+      -------
+      list of str
+        The Ethereum addresses, in the order of `node_addresses`.
+
+      Notes
+      -----
+      Addresses not yet memoized are derived on the shared crypto thread pool when there
+      are at least `EVM_CRYPTO_POOL_MIN_BATCH` of them (and the host has several cores),
+      otherwise sequentially.
+      """
+      node_addresses = list(node_addresses)
+      cache = self._get_evm_cache("_node_to_eth_cache")
+      missing = list({addr: None for addr in node_addresses if addr not in cache})
+      pool = _get_crypto_pool() if len(missing) >= EVM_CRYPTO_POOL_MIN_BATCH else None
+      if pool is not None:
+        # results land in the memo cache, so the final pass below only does lookups
+        for _ in pool.map(self.node_address_to_eth_address, missing):
+          pass
+      return [self.node_address_to_eth_address(addr) for addr in node_addresses]
+
+
+    def are_node_addresses_in_eth_addresses(self, node_addresses, lst_eth_addrs) -> list:
+      """
+      Batch variant of `is_node_address_in_eth_addresses` (e.g. a whole node list vs the oracles).
+
+      Parameters
+      ----------
+      node_addresses : iterable of str
+        The node addresses.
+
+      lst_eth_addrs : list or set
+        list of Ethereum addresses, see `is_node_address_in_eth_addresses`.
+
+      Returns
+      -------
+      list of bool
+        For each node address, True if it is in the list of Ethereum addresses.
+      """
+      if not isinstance(lst_eth_addrs, (set, frozenset)):
+        lst_eth_addrs = self.eth_addresses_to_set(lst_eth_addrs)
+      return [
+        eth_addr in lst_eth_addrs
+        for eth_addr in self.node_addresses_to_eth_addresses(node_addresses)
+      ]
   
   
   # EVM networks
@@ -192,7 +869,13 @@ class _EVMMixin:
     def reset_network(self, network: str):
       assert network.lower() in dAuth.EVM_NET_DATA, f"Invalid network: {network}"
       os.environ[dAuth.DAUTH_NET_ENV_KEY] = network      
-      return self.get_evm_network()
+      network = self.get_evm_network()
+      # drop and eagerly rebuild the network variables so the hot paths
+      # (epoch computation, signing, balance queries) never pay for it
+      self._get_evm_cache("_w3vars_cache").clear()
+      if not EE_VPN_IMPL:
+        self._get_web3_vars(network)
+      return network
     
     def get_evm_network(self) -> str:
       """
@@ -220,7 +903,9 @@ class _EVMMixin:
         self.current_evm_network = network
         network_data = self.get_network_data(network)
         rpc_url = network_data[dAuth.EvmNetData.DAUTH_RPC_KEY]
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.web3 = _new_web3(rpc_url)
+        # contract objects are bound to the previous Web3 instance
+        self._get_evm_cache("_contract_cache").clear()
         self.P(f"Resetting Web3 for {network=} via {rpc_url=}...")
       return network
     
@@ -251,12 +936,54 @@ class _EVMMixin:
 
 
     def _get_web3_vars(self, network=None) -> Web3Vars:
+      """
+      Return the `Web3Vars` (Web3 instance, RPC, contract addresses, epoch setup) of a network.
+
+      The per-network values are static so they are built once and cached; the cache
+      is rebuilt by `reset_network`.
+
+      Parameters
+      ----------
+      network : str, optional
+          The network name. If None, the current engine network and its `self.web3`
+          instance are used. The default is None.
+
+      Returns
+      -------
+      Web3Vars
+          The network variables.
+      """
       if network is None:
         network = self.evm_network
         w3 = self.web3
       else:
         w3 = None
-        
+
+      cache = self._get_evm_cache("_w3vars_cache")
+      result = cache.get(network)
+      if result is None:
+        result = self._build_web3_vars(network)
+        cache[network] = result
+      if w3 is not None and result.w3 is not w3:
+        # the engine Web3 instance was replaced (e.g. injected), honor it
+        result = result._replace(w3=w3)
+      return result
+
+
+    def _build_web3_vars(self, network: str) -> Web3Vars:
+      """
+      Build the `Web3Vars` of `network` from the static network data (see `_get_web3_vars`).
+
+      Parameters
+      ----------
+      network : str
+          The network name.
+
+      Returns
+      -------
+      Web3Vars
+          The network variables bound to the shared Web3 instance of the network RPC.
+      """
       network_data = self.get_network_data(network)
       nd_contract_address = network_data[dAuth.EvmNetData.DAUTH_ND_ADDR_KEY]
       rpc_url = network_data[dAuth.EvmNetData.DAUTH_RPC_KEY]
@@ -273,10 +1000,8 @@ class _EVMMixin:
         network_data[dAuth.EvmNetData.EE_EPOCH_INTERVALS_KEY]
       )
 
-      if w3 is None:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        self.P(f"Created temporary Web3 for {network=} via {rpc_url=}...", verbosity=2)
-      #end if
+      w3 = _new_web3(rpc_url)
+      self.P(f"Using Web3 on the shared RPC session for {network=} via {rpc_url=}...", verbosity=2)
       
       result = Web3Vars(
         w3=w3, 
@@ -291,9 +1016,154 @@ class _EVMMixin:
         poai_manager_address=poai_manager_address,
         attestation_registry_address=attestation_registry_address,
         dauth_oracle_registry_address=dauth_oracle_registry_address,
+        genesis_ts=genesis_date.timestamp(),
       )
       return result
 
+    def _get_contract(self, w3vars: Web3Vars, address: str, abi: list):
+      """
+      Return a (cached) web3 contract object for `address` on the `w3vars` network.
+
+      Building a contract object parses the ABI and creates the function proxies,
+      so the instances are memoized per `(network, address, id(abi))`. The cache is
+      dropped whenever the engine Web3 instance is reset (see `get_evm_network`).
+
+      Parameters
+      ----------
+      w3vars : Web3Vars
+          The network variables as returned by `_get_web3_vars`.
+
+      address : str
+          The contract address.
+
+      abi : list
+          The contract ABI (one of the module-level `EVM_ABI_DATA` definitions).
+
+      Returns
+      -------
+      Contract
+          The web3 contract object.
+      """
+      cache = self._get_evm_cache("_contract_cache")
+      key = (w3vars.network, address, id(abi))
+      contract = cache.get(key)
+      if contract is None:
+        contract = w3vars.w3.eth.contract(address=address, abi=abi)
+        cache[key] = contract
+      return contract
+
+
+    def _get_proxy_contract(self, w3vars: Web3Vars):
+      """
+      Return the (cached) license/node-info proxy contract of the `w3vars` network.
+
+      Parameters
+      ----------
+      w3vars : Web3Vars
+          The network variables as returned by `_get_web3_vars`.
+
+      Returns
+      -------
+      Contract
+          The web3 contract object bound to `w3vars.proxy_contract_address`.
+      """
+      return self._get_contract(
+        w3vars,
+        address=w3vars.proxy_contract_address,
+        abi=EVM_ABI_DATA.PROXY_ABI,
+      )
+
+
+    def _get_chain_id(self, w3vars: Web3Vars) -> int:
+      """
+      Return the chain id of the `w3vars` network, querying the RPC only once per network.
+
+      Parameters
+      ----------
+      w3vars : Web3Vars
+          The network variables as returned by `_get_web3_vars`.
+
+      Returns
+      -------
+      int
+          The chain id.
+      """
+      cache = self._get_evm_cache("_chain_id_cache")
+      chain_id = cache.get(w3vars.network)
+      if chain_id is None:
+        chain_id = w3vars.w3.eth.chain_id
+        cache[w3vars.network] = chain_id
+      return chain_id
+
+
+    def _get_token_decimals(self, w3vars: Web3Vars, token_contract, default: int = 18) -> int:
+      """
+      Return the ERC20 `decimals()` of `token_contract`, cached per (network, token address).
+
+      Parameters
+      ----------
+      w3vars : Web3Vars
+          The network variables as returned by `_get_web3_vars`.
+
+      token_contract : Contract
+          The ERC20 contract object (see `_get_contract`).
+
+      default : int, optional
+          Value returned when the `decimals()` call fails. The fallback is not cached
+          so that a transient RPC failure is retried on the next call. Default is 18.
+
+      Returns
+      -------
+      int
+          The token decimals.
+      """
+      cache = self._get_evm_cache("_decimals_cache")
+      key = (w3vars.network, token_contract.address)
+      decimals = cache.get(key)
+      if decimals is None:
+        try:
+          decimals = token_contract.functions.decimals().call()
+        except Exception:
+          return default
+        cache[key] = decimals
+      return decimals
+
+
+    def _web3_batch_requests(self, w3vars: Web3Vars, requests: list):
+      """
+      Execute several read-only JSON-RPC requests as a single HTTP batch.
+
+      Parameters
+      ----------
+      w3vars : Web3Vars
+          The network variables as returned by `_get_web3_vars`.
+
+      requests : list of callable
+          Zero-argument callables each returning a batchable web3 request, e.g.
+          `lambda: w3.eth.get_balance(addr)` or `lambda: contract.functions.decimals()`.
+          They are invoked inside the batching context so that web3 queues them
+          instead of sending them one by one.
+
+      Returns
+      -------
+      list or None
+          The decoded results in request order, or None if the batch could not be
+          executed (provider without batch support, any failed entry, etc.). In the
+          latter case callers must fall back to their sequential calls so the
+          per-call error handling is preserved.
+      """
+      try:
+        with w3vars.w3.batch_requests() as batch:
+          for request in requests:
+            batch.add(request())
+          results = batch.execute()
+      except Exception as exc:
+        self.P(f"Batched RPC failed on {w3vars.network}, using sequential calls: {exc}", verbosity=2)
+        return None
+      if not isinstance(results, list) or len(results) != len(requests):
+        return None
+      return results
+
   # Epoch handling
   if True:    
     def get_epoch_id(self, date : any, network: str = None):
@@ -310,12 +1180,21 @@ class _EVMMixin:
       if isinstance(date, str):
         # remove milliseconds from string
         date = date.split('.')[0]
-        date = self.log.str_to_date(date)
+        try:
+          # C-implemented parser, covers the default `%Y-%m-%d %H:%M:%S` format
+          date = datetime.fromisoformat(date)
+        except ValueError:
+          date = self.log.str_to_date(date)
         # again this is correct to replace in order to have a timezone aware date
         # and not consider the local timezone. the `date` string naive should be UTC offsetted
-        date = date.replace(tzinfo=timezone.utc) 
-      # compute difference between date and self.__genesis_date in seconds
-      elapsed_seconds = (date - w3vars.genesis_date).total_seconds()
+        if date.tzinfo is None:
+          date = date.replace(tzinfo=timezone.utc) 
+      elif date.tzinfo is None:
+        # `timestamp()` would silently assume local time for naive datetimes
+        raise TypeError("can't compare offset-naive date with the offset-aware genesis date")
+      # compute difference between date and the genesis date in seconds using the
+      # precomputed genesis timestamp (no timedelta allocation per call)
+      elapsed_seconds = date.timestamp() - w3vars.genesis_ts
       
       # the epoch id starts from 0 - the genesis epoch
       # the epoch id is the number of days since the genesis epoch
@@ -365,7 +1244,7 @@ class _EVMMixin:
       bytes
           The hash of the message in hexadecimal format.
       """
-      message = Web3.solidity_keccak(types, values)
+      message = _solidity_keccak(types, values)
       if as_hex:
         return message.hex()
       return message
@@ -407,6 +1286,8 @@ class _EVMMixin:
       This function is using the `eth_account` property generated from the private key via
       the `_get_eth_account` method at the time of the object creation.
       """
+      from eth_account import Account
+      from eth_account.messages import encode_defunct
       if verbose:
         msg_size = len(values)
         self.P(f"Signing {msg_size=} with {types=}")
@@ -416,7 +1297,9 @@ class _EVMMixin:
       else:
         message_hash = self.eth_hash_message(types, values, as_hex=False)
       signable_message = encode_defunct(primitive=message_hash)
-      signed_message = Account.sign_message(signable_message, private_key=self.eth_account.key)
+      # signing with the raw key bytes (`.key`, also what `LocalAccount.sign_message` does)
+      # rebuilds the `eth_keys.PrivateKey` and re-derives the public key on every call
+      signed_message = Account.sign_message(signable_message, private_key=self._get_eth_signing_key())
       if hasattr(signed_message, "message_hash"): # backward compatibility
         signed_message_hash = signed_message.message_hash
       else:
@@ -475,6 +1358,9 @@ class _EVMMixin:
       str or None
         The recovered address as a string (in checksum format), or None if verification fails.
       """
+      from eth_account import Account
+      from eth_account.messages import encode_defunct
+      from eth_utils import to_checksum_address
       result = None
       error = None
       message_hash = None
@@ -522,7 +1408,7 @@ class _EVMMixin:
             message_hash=message_hash,
             signature_bytes=signature_bytes,
           ):
-            result = Web3.to_checksum_address(expected_signer)
+            result = to_checksum_address(expected_signer)
           else:
             error = Exception("Safe EIP-1271 signature verification failed.")
         except Exception as exc:
@@ -547,7 +1433,8 @@ class _EVMMixin:
       if not self.is_valid_eth_address(expected_signer):
         return False
 
-      safe_address = Web3.to_checksum_address(expected_signer)
+      from eth_utils import to_checksum_address
+      safe_address = to_checksum_address(expected_signer)
       prefix = b"\x19Ethereum Signed Message:\n" + str(len(message_hash)).encode("utf-8")
       safe_message_hash = keccak(prefix + message_hash)
       contract = self.web3.eth.contract(address=safe_address, abi=self._SAFE_SIGNATURE_ABI)
@@ -776,6 +1663,15 @@ class _EVMMixin:
       str
           Hex string containing one byte per availability value.
       """
+      if isinstance(epochs_vals, (list, tuple)):
+        # single C-level encode for the common case of a list of ints in [0, 255]
+        # (restricted to list/tuple as `bytes()` would copy the raw buffer of arrays)
+        try:
+          return "0x" + bytes(epochs_vals).hex()
+        except (TypeError, ValueError):
+          # int-like values (e.g. numeric strings, floats) or invalid values: use
+          # the per-element path which also produces the detailed error message
+          pass
       packed = bytearray()
       for val in epochs_vals:
         int_val = int(val)
@@ -817,6 +1713,9 @@ class _EVMMixin:
         raise ValueError(
           "Epochs must form a contiguous range matching the availability values."
         )
+      if normalized_epochs == list(range(from_epoch, to_epoch + 1)):
+        # whole-list comparison runs in C; the loop below only reports the failure
+        return from_epoch, to_epoch
       for index, epoch in enumerate(normalized_epochs):
         expected_epoch = from_epoch + index
         if epoch != expected_epoch:
@@ -954,6 +1853,7 @@ class _EVMMixin:
       str
           The checksum address.
       """
+      from eth_utils import to_checksum_address
       return to_checksum_address(address)
           
     def web3_is_node_licensed(self, address : str, network=None, debug=False) -> bool:
@@ -971,8 +1871,9 @@ class _EVMMixin:
       assert self.is_valid_eth_address(address), "Invalid Ethereum address"
 
       w3vars = self._get_web3_vars(network)
-      contract = w3vars.w3.eth.contract(
-        address=w3vars.controller_contract_address, 
+      contract = self._get_contract(
+        w3vars,
+        address=w3vars.controller_contract_address,
         abi=EVM_ABI_DATA.CONTROLLER_ABI,
       )
       if debug:
@@ -997,8 +1898,9 @@ class _EVMMixin:
         The list of oracles addresses.
       """
       w3vars = self._get_web3_vars(network)
-      contract = w3vars.w3.eth.contract(
-        address=w3vars.controller_contract_address, 
+      contract = self._get_contract(
+        w3vars,
+        address=w3vars.controller_contract_address,
         abi=EVM_ABI_DATA.CONTROLLER_ABI,
       )
       if debug:
@@ -1023,7 +1925,8 @@ class _EVMMixin:
         The list of dAuth oracle addresses.
       """
       w3vars = self._get_web3_vars(network)
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=w3vars.dauth_oracle_registry_address,
         abi=EVM_ABI_DATA.DAUTH_ORACLE_REGISTRY_ABI,
       )
@@ -1057,7 +1960,8 @@ class _EVMMixin:
       assert self.is_valid_eth_address(address), "Invalid Ethereum address"
 
       w3vars = self._get_web3_vars(network)
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=w3vars.dauth_oracle_registry_address,
         abi=EVM_ABI_DATA.DAUTH_ORACLE_REGISTRY_ABI,
       )
@@ -1145,8 +2049,16 @@ class _EVMMixin:
       # Get the sender's address from the object's stored attribute (assumed available)
       from_address = self.eth_address
 
-      # Fetch the current balance (in Wei)
-      balance_wei = w3vars.w3.eth.get_balance(from_address)
+      # Fetch the current balance (in Wei) and the nonce in a single round-trip
+      batched = self._web3_batch_requests(w3vars, [
+        lambda: w3vars.w3.eth.get_balance(from_address),
+        lambda: w3vars.w3.eth.get_transaction_count(from_address),
+      ])
+      if batched is not None:
+        balance_wei, nonce = batched
+      else:
+        balance_wei = w3vars.w3.eth.get_balance(from_address)
+        nonce = None
       
       # Define gas parameters for a standard ETH transfer.
       gas_limit = 21000  # typical gas limit for a simple ETH transfer
@@ -1171,10 +2083,11 @@ class _EVMMixin:
           self.P(msg, color='r')
           return None
       
-      # Get the nonce for the transaction.
-      nonce = w3vars.w3.eth.get_transaction_count(from_address)
+      if nonce is None:
+        # Get the nonce for the transaction.
+        nonce = w3vars.w3.eth.get_transaction_count(from_address)
       
-      chain_id = w3vars.w3.eth.chain_id
+      chain_id = self._get_chain_id(w3vars)
           
       # Build the transaction dictionary.
       tx = {
@@ -1186,7 +2099,8 @@ class _EVMMixin:
         'chainId': chain_id,
       }
       
-      self.P(f"Executing transaction on {network} via {w3vars.rpc_url}:\n {json.dumps(tx, indent=2)}")
+      if self.is_verbose():
+        self.P(f"Executing transaction on {network} via {w3vars.rpc_url}:\n {json.dumps(tx, indent=2)}")
           
       # Sign the transaction with the account's private key.
       signed_tx = w3vars.w3.eth.account.sign_transaction(tx, self.eth_account.key)
@@ -1227,14 +2141,13 @@ class _EVMMixin:
       assert self.is_valid_eth_address(address), "Invalid Ethereum address"
 
       w3vars = self._get_web3_vars(network)
-      token_contract = w3vars.w3.eth.contract(
-        address=w3vars.r1_contract_address, abi=EVM_ABI_DATA.ERC20_ABI
+      token_contract = self._get_contract(
+        w3vars,
+        address=w3vars.r1_contract_address,
+        abi=EVM_ABI_DATA.ERC20_ABI,
       )
 
-      try:
-        decimals = token_contract.functions.decimals().call()
-      except Exception:
-        decimals = 18  # default to 18 if the decimals call fails
+      decimals = self._get_token_decimals(w3vars, token_contract)  # defaults to 18 if the call fails
       raw_balance = token_contract.functions.balanceOf(address).call()
       human_balance = raw_balance / (10 ** decimals)
       return float(human_balance)
@@ -1290,15 +2203,14 @@ class _EVMMixin:
 
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      token_contract = w3vars.w3.eth.contract(
-        address=w3vars.r1_contract_address, abi=EVM_ABI_DATA.ERC20_ABI
+      token_contract = self._get_contract(
+        w3vars,
+        address=w3vars.r1_contract_address,
+        abi=EVM_ABI_DATA.ERC20_ABI,
       )
       
       # Get the token's decimals (default to 18 if not available).
-      try:
-        decimals = token_contract.functions.decimals().call()
-      except Exception:
-        decimals = 18
+      decimals = self._get_token_decimals(w3vars, token_contract)
       # Convert the human-readable amount to the token's smallest unit.
       token_amount = int(amount * (10 ** decimals))
       
@@ -1311,9 +2223,24 @@ class _EVMMixin:
         else:
           self.P(msg, color='r')
           return None
+
+      # Fetch the gas price, ETH balance and nonce in a single round-trip.
+      batched = self._web3_batch_requests(w3vars, [
+        lambda: w3vars.w3.eth.gas_price,
+        lambda: w3vars.w3.eth.get_balance(self.eth_address),
+        lambda: w3vars.w3.eth.get_transaction_count(self.eth_address),
+      ])
+      if batched is not None:
+        gas_price, eth_balance, nonce = batched
+      else:
+        gas_price = w3vars.w3.eth.gas_price  # This fetches the current suggested gas price from the network.
+        eth_balance = w3vars.w3.eth.get_balance(self.eth_address)
+        # Get the transaction count for the nonce.
+        nonce = w3vars.w3.eth.get_transaction_count(self.eth_address)
+      # Programmatically determine the chainId (cached per network).
+      chain_id = self._get_chain_id(w3vars)
       
       # Estimate gas fees for the token transfer.
-      gas_price = w3vars.w3.eth.gas_price  # This fetches the current suggested gas price from the network.
       estimated_gas = token_contract.functions.transfer(
         to_address, token_amount
       ).estimate_gas(
@@ -1321,14 +2248,9 @@ class _EVMMixin:
       )
       gas_cost = estimated_gas * gas_price
       # Check that the sender's ETH balance can cover gas costs plus an extra buffer.
-      eth_balance = w3vars.w3.eth.get_balance(self.eth_address)
       extra_buffer = w3vars.w3.to_wei(extra_buffer_eth, 'ether')
       if eth_balance < gas_cost + extra_buffer:
         raise Exception("Insufficient ETH balance to cover gas fees and extra buffer.")
-      # Get the transaction count for the nonce.
-      nonce = w3vars.w3.eth.get_transaction_count(self.eth_address)
-      # Programmatically determine the chainId.
-      chain_id = w3vars.w3.eth.chain_id
 
       # Build the transaction for the ERC20 transfer.
       tx = token_contract.functions.transfer(to_address, token_amount).build_transaction({
@@ -1338,7 +2260,8 @@ class _EVMMixin:
         'gasPrice': gas_price,
         'chainId': chain_id,
       })
-      self.P(f"Executing transaction on {network} via {w3vars.rpc_url}:\n {json.dumps(dict(tx), indent=2)}")
+      if self.is_verbose():
+        self.P(f"Executing transaction on {network} via {w3vars.rpc_url}:\n {json.dumps(dict(tx), indent=2)}")
       
       # Sign the transaction using the internal account (via _get_eth_account).
       eth_account = self._get_eth_account()
@@ -1364,6 +2287,8 @@ class _EVMMixin:
       node_address: str,
       network: str = None,
       raise_if_issue: bool = False,
+      as_dict: bool = True,
+      cache: bool = False,
     ):      
       """
       Retrieve license details for the specified node using getNodeLicenseDetails().
@@ -1380,60 +2305,457 @@ class _EVMMixin:
         If True, raises an exception based on custom criteria (e.g., if node is banned).
         Default is False.
 
+      as_dict : bool, optional
+        If False, the `NodeLicenseDetails` named tuple is returned as-is, which spares
+        the dictionary for callers that only read a few fields. Default is True.
+
+      cache : bool, optional
+        If True, details read less than `NODE_INFO_CACHE_TTL` seconds ago are reused
+        without any RPC. Only for hot paths that tolerate license/ban state that old;
+        with False (the default) the details are read on-chain, and the fresh result
+        still refreshes the cache.
+
       Returns
       -------
-      dict
+      dict or NodeLicenseDetails
         A dictionary containing all license details returned by getNodeLicenseDetails.
       """
       assert self.is_valid_eth_address(node_address), "Invalid Ethereum address"
 
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
-        address=w3vars.proxy_contract_address,
-        abi=EVM_ABI_DATA.PROXY_ABI,
-      )
-      self.P(f"`getNodeLicenseDetails` on {network} via {w3vars.rpc_url}", verbosity=2)
-
-      result_tuple = contract.functions.getNodeLicenseDetails(node_address).call()
-      # Unpack the tuple into a dictionary for readability.
-      details = {
-        "network": network,
-        "licenseType": result_tuple[0],
-        "licenseId": result_tuple[1],
-        "owner": result_tuple[2],
-        "nodeAddress": result_tuple[3],
-        "totalAssignedAmount": result_tuple[4],
-        "totalClaimedAmount": result_tuple[5],
-        "lastClaimEpoch": result_tuple[6],
-        "assignTimestamp": result_tuple[7],
-        "lastClaimOracle": result_tuple[8],
-        "isBanned": result_tuple[9],
-        "isValid": True, # default to True; set to False if any issues are detected
-      }
-
-      
-      no_owner = details["owner"] == "0x0000000000000000000000000000000000000000"
-      no_real_addr = details["nodeAddress"] == "0x0000000000000000000000000000000000000000"
-      is_banned = details["isBanned"]
-      
-      is_valid = not (
-        no_owner or no_real_addr or is_banned
-      )
-      details['isValid'] = is_valid
-
-      self.P(f"Node Info:\n{json.dumps(details, indent=2)}", verbosity=2)
-
-      if not is_valid:
+      if node_address == EVM_ZERO_ADDRESS:
+        # never licensed, no need for a round-trip to learn it
+        details = self._unlicensed_node_details(network)
+      else:
+        details = self._get_cached_node_license(network, node_address) if cache else None
+      if details is None:
+        if self.is_verbose(2):
+          self.P(f"`getNodeLicenseDetails` on {network} via {w3vars.rpc_url}", verbosity=2)
+
+        # raw `eth_call` + eth_abi decoding, bypasses the web3 contract function machinery
+        raw = w3vars.w3.eth.call({
+          "to": w3vars.proxy_contract_address,
+          "data": _encode_node_license_details_call(node_address),
+        })
+        result_tuple = _decode_node_license_details(raw)
+        details = self._node_license_details(network, result_tuple)
+        self._set_cached_node_license(network, node_address, details)
+
+        if self.is_verbose(2):
+          self.P(f"Node Info:\n{json.dumps(details._asdict(), indent=2)}", verbosity=2)
+      #end if not cached
+
+      if not details.isValid:
         if raise_if_issue:
           msg = f"Node {node_address} is not valid."
           raise Exception(msg)
         else:
           pass
       #end if
-      return details
+      return details._asdict() if as_dict else details
+
+
+    def web3_is_node_license_valid(self, node_address: str, network: str = None, cache: bool = False) -> bool:
+      """
+      Check only whether the node holds a valid (owned, assigned, not banned) license.
+
+      Same lookup as `web3_get_node_info` (and the same cache) but neither the details
+      dictionary nor the debug dump are built - use it when `isValid` is all that is needed.
+
+      Parameters
+      ----------
+      node_address : str
+        The node address (must be a valid Ethereum address).
+
+      network : str, optional
+        The network to use. If None, defaults to self.evm_network.
+
+      cache : bool, optional
+        Reuse recently read details, see `web3_get_node_info`. Default is False.
+
+      Returns
+      -------
+      bool
+        True if the node license is valid.
+      """
+      return self.web3_get_node_info(node_address, network=network, as_dict=False, cache=cache).isValid
+
+
+    def _node_license_details(self, network: str, result_tuple) -> NodeLicenseDetails:
+      """
+      Wrap a `getNodeLicenseDetails` result tuple and derive its validity.
+
+      Parameters
+      ----------
+      network : str
+        The network the details were read from.
+
+      result_tuple : tuple or list
+        The decoded `LicenseDetails` struct (the PoAI reward totals are not reported).
+
+      Returns
+      -------
+      NodeLicenseDetails
+        The license details, including the derived `isValid` flag.
+      """
+      # banned (a plain bool) is the cheapest test, then no owner / no real node address
+      is_valid = not (
+        result_tuple[9] or
+        result_tuple[2] == EVM_ZERO_ADDRESS or
+        result_tuple[3] == EVM_ZERO_ADDRESS
+      )
+      return NodeLicenseDetails(network, *result_tuple[:10], is_valid)
+
+
+    def _unlicensed_node_details(self, network: str) -> NodeLicenseDetails:
+      """
+      The (invalid) details the proxy reports for a node without any license.
+
+      Used to answer the zero address locally, which can never hold a license.
+
+      Parameters
+      ----------
+      network : str
+        The network of the lookup.
+
+      Returns
+      -------
+      NodeLicenseDetails
+        Zeroed license details with `isValid` False.
+      """
+      return self._node_license_details(
+        network, (0, 0, EVM_ZERO_ADDRESS, EVM_ZERO_ADDRESS, 0, 0, 0, 0, EVM_ZERO_ADDRESS, False)
+      )
+
+
+    def _get_cached_node_license(self, network: str, node_address: str):
+      """
+      Return the unexpired cached `NodeLicenseDetails` of a node, or None.
+
+      Parameters
+      ----------
+      network : str
+        The network of the lookup.
+
+      node_address : str
+        The node address (any casing).
+
+      Returns
+      -------
+      NodeLicenseDetails or None
+        The cached details if younger than `NODE_INFO_CACHE_TTL` seconds.
+      """
+      with _NODE_INFO_CACHE_LOCK:
+        entry = self._get_evm_cache("_node_info_cache").get((network, node_address.lower()))
+      if entry is not None and time.monotonic() - entry[0] < NODE_INFO_CACHE_TTL:
+        return entry[1]
+      return None
+
+
+    def _set_cached_node_license(self, network: str, node_address: str, details: NodeLicenseDetails):
+      """
+      Store freshly read `NodeLicenseDetails` in the short-TTL node info cache.
+
+      When the cache is full the expired entries are dropped first, then the oldest ones.
+
+      Parameters
+      ----------
+      network : str
+        The network of the lookup.
+
+      node_address : str
+        The node address (any casing).
+
+      details : NodeLicenseDetails
+        The details (immutable, so they can be shared by all readers).
+      """
+      now = time.monotonic()
+      with _NODE_INFO_CACHE_LOCK:
+        cache = self._get_evm_cache("_node_info_cache")
+        if len(cache) >= NODE_INFO_CACHE_MAXSIZE:
+          for key in [k for k, (ts, _) in cache.items() if now - ts >= NODE_INFO_CACHE_TTL]:
+            del cache[key]
+          while len(cache) >= NODE_INFO_CACHE_MAXSIZE:
+            del cache[next(iter(cache))]
+        cache[(network, node_address.lower())] = (now, details)
+      return
+
+
+    async def web3_get_node_info_async(
+      self,
+      node_address: str,
+      network: str = None,
+      raise_if_issue: bool = False,
+      as_dict: bool = True,
+      cache: bool = False,
+    ):
+      """
+      Async version of `web3_get_node_info` (does not block the running event loop).
+
+      Parameters
+      ----------
+      node_address : str
+        The node address (must be a valid Ethereum address).
+
+      network : str, optional
+        The network to use. If None, defaults to self.evm_network.
+
+      raise_if_issue : bool, optional
+        If True, raises an exception if the node license is not valid. Default is False.
+
+      as_dict : bool, optional
+        If False, the `NodeLicenseDetails` named tuple is returned. Default is True.
+
+      cache : bool, optional
+        Reuse recently read details, see `web3_get_node_info`. Default is False.
+
+      Returns
+      -------
+      dict or NodeLicenseDetails
+        The same details `web3_get_node_info` returns.
+      """
+      assert self.is_valid_eth_address(node_address), "Invalid Ethereum address"
+
+      w3vars = self._get_web3_vars(network)
+      if node_address == EVM_ZERO_ADDRESS:
+        details = self._unlicensed_node_details(w3vars.network)
+      else:
+        details = self._get_cached_node_license(w3vars.network, node_address) if cache else None
+      if details is None:
+        async_w3 = _get_shared_async_web3(w3vars.rpc_url)
+        raw = await async_w3.eth.call({
+          "to": w3vars.proxy_contract_address,
+          "data": _encode_node_license_details_call(node_address),
+        })
+        result_tuple = _decode_node_license_details(raw)
+        details = self._node_license_details(w3vars.network, result_tuple)
+        self._set_cached_node_license(w3vars.network, node_address, details)
+      if not details.isValid and raise_if_issue:
+        raise Exception(f"Node {node_address} is not valid.")
+      return details._asdict() if as_dict else details
+
+
+    async def web3_get_nodes_info_async(
+      self,
+      node_addresses: list,
+      network: str = None,
+      max_concurrency: int = WEB3_ASYNC_MAX_CONCURRENCY,
+      as_dict: bool = True,
+      cache: bool = False,
+    ) -> list:
+      """
+      Retrieve license details for many nodes with concurrent async RPC calls.
+
+      Parameters
+      ----------
+      node_addresses : list of str
+        The node addresses (must be valid Ethereum addresses).
+
+      network : str, optional
+        The network to use. If None, defaults to self.evm_network.
+
+      max_concurrency : int, optional
+        Maximum number of in-flight requests, keeps the provider rate limits and
+        connection pool in check. Default is `WEB3_ASYNC_MAX_CONCURRENCY`.
+
+      as_dict : bool, optional
+        If False, `NodeLicenseDetails` named tuples are returned. Default is True.
+
+      cache : bool, optional
+        Reuse recently read details, see `web3_get_node_info`. Default is False.
+
+      Returns
+      -------
+      list of dict or NodeLicenseDetails
+        The `web3_get_node_info` details, in the order of `node_addresses`.
+      """
+      import asyncio
+      semaphore = asyncio.Semaphore(max_concurrency)
+
+      async def _get_node_info(node_address):
+        async with semaphore:
+          return await self.web3_get_node_info_async(
+            node_address, network=network, as_dict=as_dict, cache=cache
+          )
+
+      return list(await asyncio.gather(*[_get_node_info(addr) for addr in node_addresses]))
+
+
+    def web3_get_nodes_info(
+      self,
+      node_addresses: list,
+      network: str = None,
+      chunk_size: int = MULTICALL3_CHUNK_SIZE,
+      as_dict: bool = True,
+      cache: bool = False,
+      use_multicall: bool = True,
+    ) -> list:
+      """
+      Retrieve license details for many nodes with one `eth_call` per `chunk_size` nodes.
+
+      The `getNodeLicenseDetails` calls are aggregated via Multicall3 `aggregate3`, so
+      N nodes cost ceil(N / chunk_size) RPC round-trips instead of N. If Multicall3 is
+      not usable (or `use_multicall` is False) the individual `eth_call`s are sent as
+      JSON-RPC batches of `JSON_RPC_BATCH_CHUNK_SIZE` requests instead.
+
+      Parameters
+      ----------
+      node_addresses : list of str
+        The node addresses (must be valid Ethereum addresses).
+
+      network : str, optional
+        The network to use. If None, defaults to self.evm_network.
+
+      chunk_size : int, optional
+        Maximum number of sub-calls per multicall. Default is `MULTICALL3_CHUNK_SIZE`.
+
+      as_dict : bool, optional
+        If False, `NodeLicenseDetails` named tuples are returned. Default is True.
+
+      cache : bool, optional
+        Reuse recently read details (only the missing nodes are queried), see
+        `web3_get_node_info`. Default is False.
+
+      use_multicall : bool, optional
+        If False, go straight to the JSON-RPC batch requests. Default is True.
+
+      Returns
+      -------
+      list
+        For each node address (same order), the same details `web3_get_node_info`
+        returns, or None if the individual call reverted.
+      """
+      node_addresses = list(node_addresses)
+      for node_address in node_addresses:
+        assert self.is_valid_eth_address(node_address), f"Invalid Ethereum address {node_address}"
+
+      w3vars = self._get_web3_vars(network)
+      network = w3vars.network
+      if cache:
+        get_cached = self._get_cached_node_license # bound once, called per node
+        results = [get_cached(network, node_address) for node_address in node_addresses]
+      else:
+        results = [None] * len(node_addresses)
+      if EVM_ZERO_ADDRESS in node_addresses:
+        unlicensed = self._unlicensed_node_details(network)
+        results = [
+          unlicensed if node_address == EVM_ZERO_ADDRESS else details
+          for node_address, details in zip(node_addresses, results)
+        ]
+      #end if zero address
+      missing = [idx for idx, details in enumerate(results) if details is None]
+      if len(missing) > 0:
+        missing_addresses = [node_addresses[idx] for idx in missing]
+        raw_results = None
+        if use_multicall:
+          try:
+            raw_results = self._node_licenses_via_multicall(w3vars, missing_addresses, chunk_size)
+          except Exception as exc:
+            self.P(f"Multicall3 failed on {network}, using JSON-RPC batches: {exc}", verbosity=2)
+        #end if use_multicall
+        if raw_results is None:
+          raw_results = self._node_licenses_via_batch_requests(w3vars, missing_addresses)
+        to_details = self._node_license_details
+        set_cached = self._set_cached_node_license
+        for idx, raw in zip(missing, raw_results):
+          if raw is None:
+            continue
+          details = to_details(network, _decode_node_license_details(raw))
+          set_cached(network, node_addresses[idx], details)
+          results[idx] = details
+        #end for each fetched node
+      #end if missing
+      if as_dict:
+        results = [details._asdict() if details is not None else None for details in results]
+      return results
     
     
+    def _node_licenses_via_multicall(self, w3vars: Web3Vars, node_addresses: list, chunk_size: int) -> list:
+      """
+      Read the raw `getNodeLicenseDetails` results through Multicall3 `aggregate3`.
+
+      Parameters
+      ----------
+      w3vars : Web3Vars
+        The network variables as returned by `_get_web3_vars`.
+
+      node_addresses : list of str
+        The (validated) node addresses.
+
+      chunk_size : int
+        Maximum number of sub-calls per multicall.
+
+      Returns
+      -------
+      list
+        The raw return data per node (same order), None for reverted sub-calls.
+      """
+      multicall = self._get_contract(w3vars, address=MULTICALL3_ADDRESS, abi=EVM_ABI_DATA.MULTICALL3_ABI)
+      proxy_address = w3vars.proxy_contract_address
+      if self.is_verbose(2):
+        self.P(
+          f"`getNodeLicenseDetails` x{len(node_addresses)} via multicall on {w3vars.network} via {w3vars.rpc_url}",
+          verbosity=2
+        )
+      aggregate3 = multicall.functions.aggregate3
+      encode = _encode_node_license_details_call
+      raw_results = []
+      for start in range(0, len(node_addresses), chunk_size):
+        calls = [(proxy_address, True, encode(node_address)) for node_address in node_addresses[start:start + chunk_size]]
+        raw_results.extend([return_data if success else None for success, return_data in aggregate3(calls).call()])
+      #end for each chunk
+      return raw_results
+
+
+    def _node_licenses_via_batch_requests(self, w3vars: Web3Vars, node_addresses: list) -> list:
+      """
+      Read the raw `getNodeLicenseDetails` results with JSON-RPC batched `eth_call`s.
+
+      Each chunk of `JSON_RPC_BATCH_CHUNK_SIZE` calls is one HTTP round-trip; a chunk the
+      endpoint refuses to batch (or with a reverted call) is retried call by call.
+
+      Parameters
+      ----------
+      w3vars : Web3Vars
+        The network variables as returned by `_get_web3_vars`.
+
+      node_addresses : list of str
+        The (validated) node addresses.
+
+      Returns
+      -------
+      list
+        The raw return data per node (same order), None for reverted calls.
+      """
+      eth = w3vars.w3.eth
+      proxy_address = w3vars.proxy_contract_address
+      encode = _encode_node_license_details_call
+      txs = [{"to": proxy_address, "data": encode(node_address)} for node_address in node_addresses]
+      if self.is_verbose(2):
+        self.P(
+          f"`getNodeLicenseDetails` x{len(txs)} via JSON-RPC batches on {w3vars.network} via {w3vars.rpc_url}",
+          verbosity=2
+        )
+      raw_results = []
+      for start in range(0, len(txs), JSON_RPC_BATCH_CHUNK_SIZE):
+        chunk = txs[start:start + JSON_RPC_BATCH_CHUNK_SIZE]
+        batch_results = self._web3_batch_requests(w3vars, [lambda tx=tx: eth.call(tx) for tx in chunk])
+        if batch_results is None:
+          batch_results = []
+          for tx in chunk:
+            try:
+              batch_results.append(eth.call(tx))
+            except Exception as exc:
+              self.P(f"`getNodeLicenseDetails` failed for {tx['data'][-20:].hex()}: {exc}", verbosity=2)
+              batch_results.append(None)
+          #end for each call
+        #end if batch not usable
+        raw_results.extend(batch_results)
+      #end for each chunk
+      return raw_results
+
+
     def web3_get_wallet_nodes(self, address: str, network:str = None):
       """
       Retrieve all nodes associated with a given wallet address.
@@ -1455,10 +2777,7 @@ class _EVMMixin:
 
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
-        address=w3vars.proxy_contract_address,
-        abi=EVM_ABI_DATA.PROXY_ABI,
-      )
+      contract = self._get_proxy_contract(w3vars)
       self.P(f"`getWalletNodes` on {network} via {w3vars.rpc_url}", verbosity=2)
 
       result = contract.functions.getWalletNodes(address).call()
@@ -1490,10 +2809,7 @@ class _EVMMixin:
 
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
-        address=w3vars.proxy_contract_address,
-        abi=EVM_ABI_DATA.PROXY_ABI,
-      )
+      contract = self._get_proxy_contract(w3vars)
       self.P(f"`getAddressesBalances` on {network} via {w3vars.rpc_url}", verbosity=2)
 
       result = contract.functions.getAddressesBalances(addresses).call()
@@ -1533,15 +2849,17 @@ class _EVMMixin:
 
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=w3vars.poai_manager_address,
-        abi=EVM_ABI_DATA.POAI_MANAGER_ABI
+        abi=EVM_ABI_DATA.POAI_MANAGER_ABI,
       )
       self.P(f"`getJobDetails` on {network} via {w3vars.rpc_url}", verbosity=2)
 
       result_tuple = contract.functions.getJobDetails(job_id).call()
       details = self._format_job_details(result_tuple, network)
-      self.P(f"Job Details:\n{json.dumps(details, indent=2)}", verbosity=2)
+      if self.is_verbose(2):
+        self.P(f"Job Details:\n{json.dumps(details, indent=2)}", verbosity=2)
       return details
 
     def web3_get_all_active_jobs(
@@ -1563,9 +2881,10 @@ class _EVMMixin:
       """
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=w3vars.poai_manager_address,
-        abi=EVM_ABI_DATA.POAI_MANAGER_ABI
+        abi=EVM_ABI_DATA.POAI_MANAGER_ABI,
       )
       self.P(f"`getAllActiveJobs` on {network} via {w3vars.rpc_url}", verbosity=2)
 
@@ -1615,9 +2934,10 @@ class _EVMMixin:
       signer_account = self._get_eth_account_from_private_key(tx_private_key)
       from_address = signer_account.address
 
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=contract_address,
-        abi=EVM_ABI_DATA.ATTESTATION_REGISTRY_ABI
+        abi=EVM_ABI_DATA.ATTESTATION_REGISTRY_ABI,
       )
       contract_fn = getattr(contract.functions, function_name, None)
       if contract_fn is None:
@@ -1632,7 +2952,7 @@ class _EVMMixin:
         raise Exception("Insufficient ETH balance to cover gas fees.")
 
       nonce = w3vars.w3.eth.get_transaction_count(from_address)
-      chain_id = w3vars.w3.eth.chain_id
+      chain_id = self._get_chain_id(w3vars)
       tx = tx_fn.build_transaction({
         "from": from_address,
         "nonce": nonce,
@@ -1681,9 +3001,10 @@ class _EVMMixin:
 
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=escrow_address,
-        abi=EVM_ABI_DATA.CSP_ESCROW_ABI
+        abi=EVM_ABI_DATA.CSP_ESCROW_ABI,
       )
       self.P(f"`getActiveJobs` on {network} via {w3vars.rpc_url} (escrow {escrow_address})", verbosity=2)
 
@@ -1727,10 +3048,12 @@ class _EVMMixin:
       assert self.is_valid_eth_address(escrow_address), "Invalid escrow address"
 
       w3vars = self._get_web3_vars(network)
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=w3vars.poai_manager_address,
         abi=EVM_ABI_DATA.POAI_MANAGER_ABI,
       )
+      from eth_utils import to_checksum_address
       owner = contract.functions.escrowToOwner(escrow_address).call()
       return to_checksum_address(owner)
 
@@ -1743,13 +3066,16 @@ class _EVMMixin:
       """
       Resolve and validate a CSP escrow owner transfer event from a mined tx.
       """
+      from eth_utils import to_checksum_address
+      from web3.logs import DISCARD
       if not isinstance(tx_hash, str) or not tx_hash.startswith("0x"):
         raise ValueError("Invalid transaction hash")
       if log_index is not None:
         log_index = int(log_index)
 
       w3vars = self._get_web3_vars(network)
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=w3vars.poai_manager_address,
         abi=EVM_ABI_DATA.POAI_MANAGER_ABI,
       )
@@ -1836,8 +3162,10 @@ class _EVMMixin:
 
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      poai_manager_contract = w3vars.w3.eth.contract(
-        address=w3vars.poai_manager_address, abi=EVM_ABI_DATA.POAI_MANAGER_ABI
+      poai_manager_contract = self._get_contract(
+        w3vars,
+        address=w3vars.poai_manager_address,
+        abi=EVM_ABI_DATA.POAI_MANAGER_ABI,
       )
       
       # Estimate gas fees for the token transfer.
@@ -1851,8 +3179,8 @@ class _EVMMixin:
         raise Exception("Insufficient ETH balance to cover gas fees.")
       # Get the transaction count for the nonce.
       nonce = w3vars.w3.eth.get_transaction_count(self.eth_address)
-      # Programmatically determine the chainId.
-      chain_id = w3vars.w3.eth.chain_id
+      # Programmatically determine the chainId (cached per network).
+      chain_id = self._get_chain_id(w3vars)
 
       # Build the transaction for the ERC20 transfer.
       tx = poai_manager_contract.functions.submitNodeUpdate(job_id, nodes).build_transaction({
@@ -1862,7 +3190,8 @@ class _EVMMixin:
         'gasPrice': gas_price,
         'chainId': chain_id,
       })
-      self.P(f"Executing transaction on {network} via {w3vars.rpc_url}:\n {json.dumps(dict(tx), indent=2)}")
+      if self.is_verbose():
+        self.P(f"Executing transaction on {network} via {w3vars.rpc_url}:\n {json.dumps(dict(tx), indent=2)}")
       
       # Sign the transaction using the internal account (via _get_eth_account).
       eth_account = self._get_eth_account()
@@ -1903,8 +3232,10 @@ class _EVMMixin:
       """
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      poai_manager_contract = w3vars.w3.eth.contract(
-        address=w3vars.poai_manager_address, abi=EVM_ABI_DATA.POAI_MANAGER_ABI
+      poai_manager_contract = self._get_contract(
+        w3vars,
+        address=w3vars.poai_manager_address,
+        abi=EVM_ABI_DATA.POAI_MANAGER_ABI,
       )
       
       # Estimate gas fees for the token transfer.
@@ -1919,8 +3250,8 @@ class _EVMMixin:
         raise Exception("Insufficient ETH balance to cover gas fees.")
       # Get the transaction count for the nonce.
       nonce = w3vars.w3.eth.get_transaction_count(self.eth_address)
-      # Programmatically determine the chainId.
-      chain_id = w3vars.w3.eth.chain_id
+      # Programmatically determine the chainId (cached per network).
+      chain_id = self._get_chain_id(w3vars)
 
       # Build the transaction for the ERC20 transfer.
       tx = poai_manager_contract.functions.allocateRewardsAcrossAllEscrows().build_transaction({
@@ -1930,7 +3261,8 @@ class _EVMMixin:
         'gasPrice': gas_price,
         'chainId': chain_id,
       })
-      self.P(f"Executing transaction on {network} via {w3vars.rpc_url}:\n {json.dumps(dict(tx), indent=2)}")
+      if self.is_verbose():
+        self.P(f"Executing transaction on {network} via {w3vars.rpc_url}:\n {json.dumps(dict(tx), indent=2)}")
       
       # Sign the transaction using the internal account (via _get_eth_account).
       eth_account = self._get_eth_account()
@@ -1974,9 +3306,10 @@ class _EVMMixin:
       """
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=w3vars.poai_manager_address,
-        abi=EVM_ABI_DATA.POAI_MANAGER_ABI
+        abi=EVM_ABI_DATA.POAI_MANAGER_ABI,
       )
       self.P(f"`getUnvalidatedJobIds` on {network} via {w3vars.rpc_url}", verbosity=2)
 
@@ -2003,9 +3336,10 @@ class _EVMMixin:
       """
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=w3vars.poai_manager_address,
-        abi=EVM_ABI_DATA.POAI_MANAGER_ABI
+        abi=EVM_ABI_DATA.POAI_MANAGER_ABI,
       )
       self.P(f"`getFirstClosableJobId` on {network} via {w3vars.rpc_url}", verbosity=2)
 
@@ -2034,9 +3368,10 @@ class _EVMMixin:
       """
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
+      contract = self._get_contract(
+        w3vars,
         address=w3vars.poai_manager_address,
-        abi=EVM_ABI_DATA.POAI_MANAGER_ABI
+        abi=EVM_ABI_DATA.POAI_MANAGER_ABI,
       )
       self.P(f"`getIsLastEpochAllocated` on {network} via {w3vars.rpc_url}", verbosity=2)
 
@@ -2065,10 +3400,7 @@ class _EVMMixin:
 
       w3vars = self._get_web3_vars(network)
       network = w3vars.network
-      contract = w3vars.w3.eth.contract(
-        address=w3vars.proxy_contract_address,
-        abi=EVM_ABI_DATA.PROXY_ABI,
-      )
+      contract = self._get_proxy_contract(w3vars)
       self.P(f"`getUserEscrowDetails` on {network} via {w3vars.rpc_url}", verbosity=2)
 
       result = contract.functions.getUserEscrowDetails(address).call()
@@ -291,6 +291,58 @@ _PROXY_ABI = [
   }
 ]
 
+# Multicall3 (same address on every supported chain) - only the `aggregate3` read batching call.
+_MULTICALL3_ABI = [
+  {
+    "inputs": [
+      {
+        "components": [
+          {
+            "internalType": "address",
+            "name": "target",
+            "type": "address"
+          },
+          {
+            "internalType": "bool",
+            "name": "allowFailure",
+            "type": "bool"
+          },
+          {
+            "internalType": "bytes",
+            "name": "callData",
+            "type": "bytes"
+          }
+        ],
+        "internalType": "struct Multicall3.Call3[]",
+        "name": "calls",
+        "type": "tuple[]"
+      }
+    ],
+    "name": "aggregate3",
+    "outputs": [
+      {
+        "components": [
+          {
+            "internalType": "bool",
+            "name": "success",
+            "type": "bool"
+          },
+          {
+            "internalType": "bytes",
+            "name": "returnData",
+            "type": "bytes"
+          }
+        ],
+        "internalType": "struct Multicall3.Result[]",
+        "name": "returnData",
+        "type": "tuple[]"
+      }
+    ],
+    "stateMutability": "payable",
+    "type": "function"
+  }
+]
+
 # A minimal ERC20 ABI for balanceOf, transfer, and decimals functions.
 _ERC20_ABI = [
   {
@@ -923,4 +975,5 @@ class EVM_ABI_DATA:
   ATTESTATION_REGISTRY_ABI = _ATTESTATION_REGISTRY_ABI
   DAUTH_ORACLE_REGISTRY_ABI = _DAUTH_ORACLE_REGISTRY_ABI
   PROXY_ABI = _PROXY_ABI
+  MULTICALL3_ABI = _MULTICALL3_ABI
   CONTROLLER_ABI = _CONTROLLER_ABI
@@ -53,30 +53,49 @@ Documentation url: https://docs.ipfs.tech/reference/kubo/cli/#ipfs
 """
 import subprocess
 import json
+import mmap
 from datetime import datetime, timezone
-import base64
 import time
 import os
 import tempfile
-import uuid
+import secrets
 import requests
 import hashlib
 import shutil
 import gzip
 from io import BytesIO
 import ssl
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 import tempfile
 import random
 import ipaddress
 import signal
+import socket
+import queue
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+try:
+  # optional SIMD base64 codec, API compatible with the stdlib module
+  from pybase64 import b64decode
+except ImportError:
+  from base64 import b64decode
+
+try:
+  # optional faster JSON decoder; encoding stays on the stdlib json module as the
+  # encoded bytes end up in ciphertexts whose CIDs must not depend on the install
+  from orjson import loads as _json_loads
+except ImportError:
+  from json import loads as _json_loads
 
 DEFAULT_SECRET = "ratio1"
 DEFAULT_FILENAME_JSON = "data.json"
 
-from threading import RLock
+from threading import Event, RLock, Thread
 
 __VER__ = "0.2.2"
 
@@ -107,8 +126,45 @@ class IPFSCt:
   RELAY_PIN_RETRY_COUNT = 3
   RELAY_PIN_RETRY_BACKOFF_SECONDS = 2
   RELAY_RETRY_QUEUE_LIMIT = 256
+  # encrypted chunks read ahead while the previous ones are sent to the daemon
+  UPLOAD_PREFETCH_CHUNKS = 4
+  # concurrent add_file calls of put_many, kept below RPC_POOL_MAXSIZE so every
+  # worker reuses a pooled daemon connection
+  PUT_MANY_MAX_WORKERS = 8
+  # concurrent get_file calls of get_many (same pooled connection constraint)
+  GET_MANY_MAX_WORKERS = 8
+  # smaller upload body pieces are merged before being sent
+  UPLOAD_COALESCE_SIZE = 64 * 1024
+  # files up to this size are encrypted/decrypted with a single AES-GCM call; above
+  # it the one-shot call loses to the chunked update path (it copies/allocates the
+  # whole payload), e.g. 2.9 ms vs 0.6 ms to encrypt 4 MB
+  ONE_SHOT_CIPHER_MAX_SIZE = 64 * 1024
+  # first read of a downloaded ciphertext file: nonce, length prefix, metadata (and
+  # for small files the whole ciphertext) in one syscall
+  DOWNLOAD_HEAD_READ_SIZE = 64 * 1024
+  # startup AES-GCM probe: payload size and the throughput (MB/s) below which a
+  # warning is logged (AES-NI/PMULL builds do several GB/s)
+  AEAD_PROBE_SIZE = 1024 * 1024
+  AEAD_MIN_THROUGHPUT_MBS = 500
+  # read/encrypt/decrypt unit of the streamed path, override with EE_R1FS_CHUNK_MB
+  CIPHER_CHUNK_SIZE = max(1, int(os.environ.get("EE_R1FS_CHUNK_MB", "4"))) * 1024 * 1024
+  # idle CIPHER_CHUNK_SIZE buffers kept for reuse across add_file/get_file calls
+  # (8 x 4 MB at most with the default chunk size)
+  CHUNK_BUFFER_POOL_SIZE = 8
   
   TIMEOUT = 90 # seconds
+  # Kubo RPC of the local daemon, used with a keep-alive session instead of
+  # spawning the `ipfs` CLI for commands issued while the daemon is running.
+  # These are the Kubo defaults; the actual address is read from the repo
+  # (`$IPFS_PATH/api` or `Addresses.API`) when IPFS is started.
+  RPC_HOST = "127.0.0.1"
+  RPC_PORT = 5001
+  RPC_API_URL = f"http://{RPC_HOST}:{RPC_PORT}/api/v0"
+  RPC_POOL_CONNECTIONS = 4
+  RPC_POOL_MAXSIZE = 16
+  # while waiting for the daemon, its RPC port is probed with a bare TCP connect
+  # at this interval (seconds) and the version call is made once it accepts
+  DAEMON_PORT_PROBE_INTERVAL = 0.1
   # The reprovide operation is very heavy and should be done infrequently.
   # The kubo documentation advises on 22h. This was previously on 1m and will be
   # increased to 10h to reduce the load on the relay(s).
@@ -127,14 +183,195 @@ COLOR_CODES = {
   'd': "\033[90m", # dark gray
   "reset": "\033[0m"
 }
+_COLOR_RESET = COLOR_CODES["reset"]
 
 def log_info(msg: str, color="reset", **kwargs):
-  timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-  color_code = COLOR_CODES.get(color, COLOR_CODES["reset"])
-  reset_code = COLOR_CODES["reset"]
-  print(f"{color_code}[{timestamp}] {msg}{reset_code}", flush=True)
+  # time.strftime avoids building a datetime object for every log line
+  timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+  color_code = COLOR_CODES.get(color, _COLOR_RESET)
+  print(f"{color_code}[{timestamp}] {msg}{_COLOR_RESET}", flush=True)
   return
 
+@lru_cache(maxsize=32)
+def _hash_secret_cached(secret: str) -> bytes:
+  """
+  SHA-256 of a passphrase, memoized as almost every call uses the same few secrets.
+
+  The cache is bounded so that many distinct secrets cannot grow it indefinitely.
+  """
+  return hashlib.sha256(secret.encode("utf-8")).digest()
+
+
+@lru_cache(maxsize=1)
+def _probe_aead_throughput(size: int = IPFSCt.AEAD_PROBE_SIZE, rounds: int = 3) -> float:
+  """
+  Best-of-`rounds` AES-256-GCM encryption throughput in MB/s, measured once per process.
+  """
+  aesgcm = AESGCM(bytes(32))
+  nonce, data = bytes(12), bytes(size)
+  best_ns = None
+  for _ in range(rounds):
+    start_ns = time.perf_counter_ns()
+    aesgcm.encrypt(nonce, data, None)
+    elapsed_ns = max(time.perf_counter_ns() - start_ns, 1)
+    best_ns = elapsed_ns if best_ns is None else min(best_ns, elapsed_ns)
+  return size / (1024 * 1024) / (best_ns / 1e9)
+
+
+def _get_cpu_aes_flags():
+  """
+  Read the AES related CPU flags from /proc/cpuinfo.
+
+  Only the flags that matter for AES-GCM speed are kept: aes/pclmulqdq/vaes/vpclmulqdq
+  on x86 and aes/pmull on arm64.
+
+  Returns
+  -------
+  list[str] or None
+      The sorted flags present (empty if the CPU has none of them), or None where
+      /proc/cpuinfo is not available (e.g. macOS, Windows).
+  """
+  try:
+    with open("/proc/cpuinfo") as f:
+      for line in f:
+        key, _, value = line.partition(":")
+        if key.strip() in ("flags", "Features"):
+          return sorted(set(value.split()) & {"aes", "pclmulqdq", "vaes", "vpclmulqdq", "pmull"})
+  except OSError:
+    pass
+  return None
+
+
+_CHUNK_BUFFER_POOL = queue.LifoQueue(maxsize=IPFSCt.CHUNK_BUFFER_POOL_SIZE)
+
+
+def _borrow_chunk_buffer() -> bytearray:
+  """
+  Take a chunk buffer (``CIPHER_CHUNK_SIZE`` + 15 spare bytes for ``update_into``)
+  from the pool, or allocate one if the pool is empty.
+  """
+  size = IPFSCt.CIPHER_CHUNK_SIZE + 15
+  while True:
+    try:
+      buffer = _CHUNK_BUFFER_POOL.get_nowait()
+    except queue.Empty:
+      return bytearray(size)
+    if len(buffer) == size:
+      return buffer
+    # buffers sized for a previous CIPHER_CHUNK_SIZE are dropped
+  #end while
+
+
+def _return_chunk_buffer(buffer: bytearray):
+  """
+  Give a buffer from `_borrow_chunk_buffer` back to the pool (dropped if the pool is full).
+  """
+  try:
+    _CHUNK_BUFFER_POOL.put_nowait(buffer)
+  except queue.Full:
+    pass
+  return
+
+
+def _rpc_address_from_multiaddr(multiaddr):
+  """
+  Parse a Kubo API multiaddr into the address a local client connects to.
+
+  Wildcard listen addresses (`0.0.0.0`, `::`) are mapped to the loopback interface.
+
+  Parameters
+  ----------
+  multiaddr : str
+      The API multiaddr, e.g. `/ip4/127.0.0.1/tcp/5001` (surrounding whitespace,
+      such as the trailing newline of `$IPFS_PATH/api`, is ignored).
+
+  Returns
+  -------
+  tuple[str, int] or None
+      The `(host, port)` pair, or None when `multiaddr` is not an ip/dns TCP address.
+  """
+  parts = str(multiaddr or "").strip().split("/")
+  if len(parts) < 5 or parts[0] != "" or parts[3] != "tcp":
+    return None
+  if parts[1] not in ("ip4", "ip6", "dns", "dns4", "dns6"):
+    return None
+  try:
+    port = int(parts[4])
+  except ValueError:
+    return None
+  host = parts[2]
+  # a wildcard listen address is reached through the loopback interface
+  if host == "0.0.0.0":
+    host = "127.0.0.1"
+  elif host == "::":
+    host = "::1"
+  return host, port
+
+
+class _R1FSFetchError(Exception):
+  """The ciphertext could not be fetched from the daemon (as opposed to decrypted)."""
+
+
+def _iter_prefetched(chunks, max_pending=IPFSCt.UPLOAD_PREFETCH_CHUNKS):
+  """
+  Iterate `chunks` while a background thread already produces the next ones.
+
+  The producer (file read + encryption) and the consumer (socket send) overlap
+  instead of taking turns; the bounded queue caps the buffered memory.
+
+  Parameters
+  ----------
+  chunks : iterable of bytes
+      The source iterator, consumed by the producer thread only.
+  max_pending : int, optional
+      Maximum number of produced but not yet consumed chunks.
+
+  Yields
+  ------
+  bytes
+      The chunks of `chunks`, in order. Producer exceptions are re-raised here.
+  """
+  pending = queue.Queue(maxsize=max_pending)
+  stop = Event()
+
+  def _put(item):
+    while not stop.is_set():
+      try:
+        pending.put(item, timeout=0.5)
+        return True
+      except queue.Full:
+        continue
+    return False
+
+  def _produce():
+    try:
+      for chunk in chunks:
+        if not _put((True, chunk)):
+          return
+      _put((False, None))
+    except BaseException as exc:
+      _put((False, exc))
+    finally:
+      close = getattr(chunks, "close", None)
+      if close is not None:
+        close()
+    return
+
+  producer = Thread(target=_produce, name="r1fs_upload_prefetch", daemon=True)
+  producer.start()
+  try:
+    while True:
+      has_chunk, value = pending.get()
+      if not has_chunk:
+        if value is not None:
+          raise value
+        return
+      yield value
+  finally:
+    stop.set()
+    producer.join()
+
+
 class SimpleLogger:
   def P(self, *args, **kwargs):
     log_info(*args, **kwargs)
@@ -248,13 +485,16 @@ class R1FSEngine:
       self.__ipfs_address = None
       self.__ipfs_id = None
       self.__ipfs_id_result = None
+      self.__ipfs_id_cached = False
       self.__min_connection_age = min_connection_age
       self.__connected_at = None
       self.__ipfs_agent = None
       self.__uploaded_files = {}
       self.__downloaded_files = {}
+      self.__downloaded_files_stat = {}
       self.__base64_swarm_key = base64_swarm_key
       self.__ipfs_relay = ipfs_relay
+      self.__ipfs_relay_peer_id = self.__get_relay_peer_id(ipfs_relay)
       self.__ipfs_relay_api = ipfs_relay_api
       self.__ipfs_api_key_username = ipfs_api_key_username
       self.__ipfs_api_key_password = ipfs_api_key_password
@@ -265,10 +505,15 @@ class R1FSEngine:
       self.__debug = debug
       self.__relay_check_cnt = 0
       self.__peers = []
+      self.__peers_by_id = {}
       self.__samehost_fix_attempted = False
       self.__relay_retry_queue = {}
       self.__relay_publication_status = {}
       self.__relay_config_warning_flags = set()
+      self.__rpc_session = self.__create_rpc_session()
+      self.__rpc_host = IPFSCt.RPC_HOST
+      self.__rpc_port = IPFSCt.RPC_PORT
+      self.__rpc_api_url = IPFSCt.RPC_API_URL
       
       self.startup()
       return
@@ -297,6 +542,7 @@ class R1FSEngine:
         else:
           self.__uploads_dir = IPFSCt.TEMP_UPLOAD
       os.makedirs(self.__uploads_dir, exist_ok=True)    
+      self.__probe_aead_backend()
 
       self.maybe_reset_ipfs()
 
@@ -309,6 +555,26 @@ class R1FSEngine:
         ipfs_certificate_path=self.__ipfs_certificate_path
       )
       return
+
+    def __probe_aead_backend(self):
+      """
+      Measure the AES-GCM throughput of the installed cryptography/OpenSSL and warn if
+      it is too low for R1FS (e.g. an OpenSSL build without AES-NI/PMULL support).
+      """
+      self.__aead_throughput_mbs = _probe_aead_throughput()
+      cpu_flags = _get_cpu_aes_flags()
+      msg = "AES-GCM throughput: {:.0f} MB/s (CPU AES flags: {})".format(
+        self.__aead_throughput_mbs, ", ".join(cpu_flags) if cpu_flags else "n/a",
+      )
+      if self.__aead_throughput_mbs < IPFSCt.AEAD_MIN_THROUGHPUT_MBS:
+        msg += (
+          f". Below {IPFSCt.AEAD_MIN_THROUGHPUT_MBS} MB/s R1FS encryption will be slow, "
+          "check that cryptography runs on an OpenSSL with AES-NI/PMULL support."
+        )
+        self.P(msg, color='y')
+      else:
+        self.Pd(msg)
+      return
       
       
     def P(self, s, *args, **kwargs):
@@ -327,10 +593,28 @@ class R1FSEngine:
         self.logger.P(s, *args, **kwargs)
       return
 
+    def __create_rpc_session(self):
+      """
+      Create the keep-alive HTTP session shared by the Kubo RPC and relay API calls.
+
+      Returns
+      -------
+      requests.Session
+          Session with a pooled adapter mounted for both schemes.
+      """
+      session = requests.Session()
+      adapter = HTTPAdapter(
+        pool_connections=IPFSCt.RPC_POOL_CONNECTIONS,
+        pool_maxsize=IPFSCt.RPC_POOL_MAXSIZE,
+      )
+      session.mount("http://", adapter)
+      session.mount("https://", adapter)
+      return session
+
     def _hash_secret(self, secret: str) -> bytes:
       secret = str(secret) # to be sure that the passed secret is of string type.
       # Convert text to bytes, then hash with SHA-256 => 32-byte key
-      return hashlib.sha256(secret.encode("utf-8")).digest()
+      return _hash_secret_cached(secret)
 
   # Private, yet visible (public) helpers.
   if True:
@@ -395,6 +679,11 @@ class R1FSEngine:
     def downloaded_files(self):
       return self.__downloaded_files
 
+    @property
+    def aead_throughput_mbs(self):
+      """AES-GCM throughput (MB/s) measured at startup."""
+      return self.__aead_throughput_mbs
+
     @property
     def relay_publication_status(self):
       """
@@ -420,7 +709,7 @@ class R1FSEngine:
   # boilerplate methods
   if True:
     def _get_unique_name(self, prefix="r1fs", suffix=""):
-      str_id = str(uuid.uuid4()).replace("-", "")[:8]
+      str_id = os.urandom(4).hex()
       return f"{prefix}_{str_id}{suffix}"
     
     def _get_unique_upload_name(self, prefix="r1fs", suffix=""):
@@ -646,7 +935,7 @@ class R1FSEngine:
           relay_attempts=attempt,
         )
         try:
-          response = requests.post(
+          response = self.__rpc_session.post(
             request_url,
             auth=HTTPBasicAuth(self.__ipfs_api_key_username, self.__ipfs_api_key_password),
             verify=self.__relay_verify_value(),
@@ -767,23 +1056,53 @@ class R1FSEngine:
       )
     
 
-    def _get_swarm_peers(self):
+    def _get_swarm_peers(self, raise_on_timeout: bool = False):
+      """
+      Return the connected swarm peers as ``<multiaddr>/p2p/<peer_id>`` lines.
+
+      The lines have the same layout as the ``ipfs swarm peers`` CLI output but are
+      read from the daemon RPC.
+
+      Parameters
+      ----------
+      raise_on_timeout : bool, optional
+          If True a ``requests.Timeout`` of the RPC call is re-raised (after the peer
+          list is reset) so the caller can tell a slow daemon from an empty swarm.
+          Default is False.
+
+      Returns
+      -------
+      list[str]
+          Connected peer multiaddrs, empty when the daemon cannot be queried.
+
+      Raises
+      ------
+      requests.Timeout
+          Only when `raise_on_timeout` is True and the daemon did not answer in time.
+      """
       peer_lines = []
+      peers_by_id = {}
+      timeout_error = None
       try:
-        out = subprocess.run(
-          ["ipfs", "swarm", "peers"],
-          capture_output=True, text=True, timeout=5
-        )
-        if out.returncode == 0:
-          peer_lines = out.stdout.strip().split("\n")
-          peer_lines = [line.strip() for line in peer_lines if line.strip()]
-          self.Pd(f"Swarm peers: {peer_lines}")
-          self.__peers = peer_lines
+        data = self._rpc("swarm/peers", timeout=5, show_logs=False)
+        for peer in (data.get("Peers") or []):
+          peer_id = peer.get("Peer", "")
+          line = f'{peer.get("Addr", "")}/p2p/{peer_id}'
+          peer_lines.append(line)
+          peers_by_id[peer_id] = line
+        self.Pd(f"Swarm peers: {peer_lines}")
+      except requests.Timeout as e:
+        if raise_on_timeout:
+          timeout_error = e
         else:
-          self.__peers = []
-        # found = len(self.__peers) > 0
+          self.P(f"Error getting swarm peers: {e}", color='r')
       except Exception as e:
         self.P(f"Error getting swarm peers: {e}", color='r')
+      # peer id -> line, so presence checks do not scan the (possibly long) list
+      self.__peers = peer_lines
+      self.__peers_by_id = peers_by_id
+      if timeout_error is not None:
+        raise timeout_error
       return peer_lines
 
 
@@ -798,8 +1117,7 @@ class R1FSEngine:
       """
       log_func = self.P if debug else self.Pd
       relay_found = False
-      relay_info = self.__parse_multiaddr(self.__ipfs_relay)
-      relay_peer_id = relay_info["peer_id"] if relay_info is not None else None
+      relay_peer_id = self.__ipfs_relay_peer_id
       try:
         if self.connected_at is not None:
           # Already connected, lets see if last check was recent enough:
@@ -816,21 +1134,17 @@ class R1FSEngine:
         if not relay_found:         
           self.__relay_check_cnt += 1
           log_func(f"Relay check #{self.__relay_check_cnt}: scanning swarm peers for relay peer id.")
-          peer_lines = self._get_swarm_peers()
+          peer_lines = self._get_swarm_peers(raise_on_timeout=True)
           if len(peer_lines) > 0:
             log_func(f"Relay check #{self.__relay_check_cnt}: found {len(peer_lines)} swarm peer(s).")
-            self.__peers = peer_lines
-            for line in peer_lines:
-              # After the workaround is applied, the relay may appear through the
-              # local-gateway multiaddr instead of its public address. Matching by
-              # peer id keeps the connection check valid in both states.
-              if relay_peer_id and relay_peer_id in line:
-                # Record the time if not already set
-                relay_found = True
-                log_func(f"Relay check #{self.__relay_check_cnt}: relay peer present on {line.strip()}")
-                break
-              #end if
-            #end for
+            # After the workaround is applied, the relay may appear through the
+            # local-gateway multiaddr instead of its public address. Matching by
+            # peer id keeps the connection check valid in both states.
+            relay_line = self.__peers_by_id.get(relay_peer_id) if relay_peer_id else None
+            if relay_line is not None:
+              relay_found = True
+              log_func(f"Relay check #{self.__relay_check_cnt}: relay peer present on {relay_line}")
+            #end if
             # now reset the connected_at time if we found the relay peer
             if relay_found:
               # TODO: maybe add first & last connected time
@@ -851,7 +1165,7 @@ class R1FSEngine:
           else:
             log_func(f"Relay check #{self.__relay_check_cnt}: swarm peer list is empty.", color='r')
           #end if len(peer_lines) > 0
-      except subprocess.TimeoutExpired:
+      except requests.Timeout:
         self.P(f"Relay check #{self.__relay_check_cnt}: timed out while reading swarm peers.", color='r')
         relay_found = False
       except Exception as e:
@@ -861,61 +1175,97 @@ class R1FSEngine:
       return relay_found
 
 
-    def __set_reprovider_interval(self):
-      # Command to set the Reprovider.Interval to 1 minute
-      cmd = ["ipfs", "config", "--json", "Reprovider.Interval", f'"{IPFSCt.REPROVIDER}"']
-      result = self.__run_command(cmd)
-      return result
-
+    def __get_startup_config(self):
+      """
+      Return the config keys (``ipfs config --json`` paths) applied before the daemon starts.
 
-    # TODO: Create a function for setting variables below.
-    def __disable_auto_tls(self):
-      result = self.__run_command(
-        ["ipfs", "config", "--json", "AutoTLS.Enabled", "false"]
-      )
-      return result
+      Returns
+      -------
+      dict
+          Dotted config key -> JSON value.
+      """
+      return {
+        "Reprovider.Interval": IPFSCt.REPROVIDER,
+        # Reprovider.Strategy: "all" vs "pinned" vs "pinned+mfs"
+        # Controls what content this node periodically re-announces ("reprovides") into the DHT (CID → provider records).
+        # - "all": advertise *everything* in the local blockstore (includes transient cache) → can be very expensive/noisy.
+        # - "pinned": advertise only content explicitly pinned (the data you intend to keep/serve) → usually the best default.
+        # - "pinned+mfs": advertise pinned content plus the current MFS tree (IPFS's mutable filesystem workspace) → use if
+        #   your app relies on MFS state being discoverable. Prefer avoiding "all" unless you truly want to advertise cache.
+        "Reprovider.Strategy": IPFSCt.REPROVIDER_STRATEGY,
+        "AutoTLS.Enabled": False,
+        # Routing.Type: "dht" vs "dhtclient"
+        # - "dht" lets the node use the DHT and automatically act as a DHT *server* when it seems reachable
+        #   (serves/handles other peers' DHT queries → more CPU/bandwidth/connections).
+        # - "dhtclient" is lookup-only: it can query the DHT but never serves DHT traffic → lighter and more predictable.
+        #   In a private hub-and-spoke setup (single relay), it's usually best to keep clients on "dhtclient" and let only
+        #   the relay (or a small set of infra nodes) serve the DHT.
+        "Routing.Type": "dhtclient",
+        "Swarm.Transports.Network.Websocket": False,
+        # Discovery.MDNS.Enabled: enabled vs disabled
+        # mDNS is "LAN auto-discovery": peers on the same local network broadcast/announce themselves and auto-connect.
+        # - Enabled: convenient for dev/LAN clusters where multicast works and you want plug-and-play discovery.
+        # - Disabled: recommended for most server/relay/container deployments across machines/subnets (mDNS doesn't cross
+        #   routers reliably, adds background chatter, and creates less predictable connections). In hub-and-spoke networks
+        #   with explicit bootstrap-to-relay, mDNS usually provides little value and can be turned off.
+        "Discovery.MDNS.Enabled": False,
+        # the public bootstrap nodes are dropped, only the relay is kept
+        "Bootstrap": [self.__ipfs_relay],
+      }
 
-    def __set_routing_type(self):
-      # Routing.Type: "dht" vs "dhtclient"
-      # - "dht" lets the node use the DHT and automatically act as a DHT *server* when it seems reachable
-      #   (serves/handles other peers' DHT queries → more CPU/bandwidth/connections).
-      # - "dhtclient" is lookup-only: it can query the DHT but never serves DHT traffic → lighter and more predictable.
-      #   In a private hub-and-spoke setup (single relay), it's usually best to keep clients on "dhtclient" and let only
-      #   the relay (or a small set of infra nodes) serve the DHT.
-      result = self.__run_command(
-        ["ipfs", "config", "--json", "Routing.Type", '"dhtclient"']
-      )
-      return result
+    def __apply_startup_config(self, config_path):
+      """
+      Write the startup config keys straight into the repo config file.
 
-    def __disable_ws_transport(self):
-      result = self.__run_command(
-        ["ipfs", "config", "--json", "Swarm.Transports.Network.Websocket", "false"]
-      )
-      return result
+      The daemon is stopped at this point, so the file is patched and atomically
+      replaced instead of spawning one ``ipfs config`` process per key. If the
+      file cannot be patched the keys are set one by one through the CLI.
 
-    def __disable_mdns_discovery(self):
-      # Discovery.MDNS.Enabled: enabled vs disabled
-      # mDNS is "LAN auto-discovery": peers on the same local network broadcast/announce themselves and auto-connect.
-      # - Enabled: convenient for dev/LAN clusters where multicast works and you want plug-and-play discovery.
-      # - Disabled: recommended for most server/relay/container deployments across machines/subnets (mDNS doesn't cross
-      #   routers reliably, adds background chatter, and creates less predictable connections). In hub-and-spoke networks
-      #   with explicit bootstrap-to-relay, mDNS usually provides little value and can be turned off.
-      result = self.__run_command(
-        ["ipfs", "config", "--json", "Discovery.MDNS.Enabled", "false"]
-      )
-      return result
+      Parameters
+      ----------
+      config_path : str
+          Path of the repo ``config`` file.
 
-    def __set_reprovider_strategy(self):
-      # Reprovider.Strategy: "all" vs "pinned" vs "pinned+mfs"
-      # Controls what content this node periodically re-announces ("reprovides") into the DHT (CID → provider records).
-      # - "all": advertise *everything* in the local blockstore (includes transient cache) → can be very expensive/noisy.
-      # - "pinned": advertise only content explicitly pinned (the data you intend to keep/serve) → usually the best default.
-      # - "pinned+mfs": advertise pinned content plus the current MFS tree (IPFS's mutable filesystem workspace) → use if
-      #   your app relies on MFS state being discoverable. Prefer avoiding "all" unless you truly want to advertise cache.
-      result = self.__run_command(
-        ["ipfs", "config", "--json", "Reprovider.Strategy", f'"{IPFSCt.REPROVIDER_STRATEGY}"']
-      )
-      return result
+      Returns
+      -------
+      bool
+          ``True`` when the file was patched directly.
+      """
+      updates = self.__get_startup_config()
+      tmp_path = None
+      try:
+        with open(config_path, "r", encoding="utf-8") as f:
+          config = json.load(f)
+        for key, value in updates.items():
+          *parents, leaf = key.split(".")
+          node = config
+          for part in parents:
+            if not isinstance(node.get(part), dict):
+              node[part] = {}
+            node = node[part]
+          #end for parents
+          node[leaf] = value
+        #end for updates
+        # mkstemp creates the file 0600, the config holds the node private key
+        handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(config_path), prefix=".config_")
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+          json.dump(config, f, indent=2)
+        os.replace(tmp_path, config_path)
+        self.P(f"Applied {len(updates)} IPFS config keys to {config_path}.", color='d')
+        return True
+      except Exception as e:
+        if tmp_path is not None and os.path.exists(tmp_path):
+          os.remove(tmp_path)
+        self.P(f"Could not patch {config_path} ({e}), falling back to 'ipfs config'.", color='r')
+      #end try
+      for key, value in updates.items():
+        if key == "Bootstrap":
+          self.__run_command(["ipfs", "bootstrap", "rm", "--all"], discard_output=True)
+          self.__bootstrap_add(self.__ipfs_relay)
+        else:
+          self.__set_config_json(key, value)
+      #end for updates
+      return False
 
     def __bootstrap_add(self, ipfs_relay):
       result = self.__run_command(
@@ -1063,6 +1413,16 @@ class R1FSEngine:
           changed = True
       return merged, changed
 
+    def __get_relay_peer_id(self, multiaddr):
+      """
+      Return the peer id of the relay multiaddr or ``None`` when it cannot be parsed.
+      Computed once whenever the relay is configured so the periodic relay checks
+      only do a dict lookup.
+      """
+      relay_info = self.__parse_multiaddr(multiaddr)
+      return relay_info["peer_id"] if relay_info is not None else None
+
+
     def __parse_multiaddr(self, multiaddr):
       """
       Extract the relay addressing fields needed by the workaround.
@@ -1367,52 +1727,70 @@ class R1FSEngine:
 
     def __swarm_connect(self, multiaddr, timeout=IPFSCt.TIMEOUT):
       """
-      Attempt an ``ipfs swarm connect`` and normalize success detection.
+      Attempt a swarm connect through the daemon RPC and normalize success detection.
 
       Parameters
       ----------
       multiaddr : str
           Peer multiaddr to connect to.
       timeout : int, optional
-          Command timeout in seconds.
+          Request timeout in seconds.
 
       Returns
       -------
       tuple[bool, str, str]
-          Success flag, stdout, and stderr from the command.
+          Success flag, the daemon output and the error message (CLI layout).
       """
-      output, errors = self.__run_command(
-        ["ipfs", "swarm", "connect", multiaddr],
-        raise_on_error=False,
-        return_errors=True,
-        timeout=timeout,
-      )
+      output, errors = self.__swarm_rpc("swarm/connect", multiaddr, timeout=timeout)
       combined = " ".join(part for part in (output, errors) if part).lower()
       success = "success" in combined or "already connected" in combined
       return success, output, errors
 
+    def __swarm_rpc(self, path, target, timeout=10):
+      """
+      Run a ``swarm/connect`` or ``swarm/disconnect`` RPC without raising.
+
+      The result keeps the layout of the former ``ipfs swarm ...`` commands so the
+      callers can keep matching on the daemon messages.
+
+      Parameters
+      ----------
+      path : str
+          The RPC command, ``swarm/connect`` or ``swarm/disconnect``.
+      target : str
+          Peer multiaddr or peer id passed as the command argument.
+      timeout : int, optional
+          Request timeout in seconds. Default is 10.
+
+      Returns
+      -------
+      tuple[str, str]
+          The daemon output lines joined with newlines and the error message; one of
+          them is empty.
+      """
+      try:
+        data = self._rpc(path, params={"arg": target}, timeout=timeout)
+        return "\n".join(data.get("Strings") or []), ""
+      except Exception as e:
+        return "", str(e)
+
     def __swarm_disconnect(self, target, timeout=10):
       """
-      Attempt an ``ipfs swarm disconnect`` without treating failures as fatal.
+      Attempt a swarm disconnect through the daemon RPC without treating failures as fatal.
 
       Parameters
       ----------
       target : str
           Peer multiaddr or peer id to disconnect from.
       timeout : int, optional
-          Command timeout in seconds.
+          Request timeout in seconds.
 
       Returns
       -------
       tuple[bool, str, str]
-          Success flag, stdout, and stderr from the command.
+          Success flag, the daemon output and the error message (CLI layout).
       """
-      output, errors = self.__run_command(
-        ["ipfs", "swarm", "disconnect", target],
-        raise_on_error=False,
-        return_errors=True,
-        timeout=timeout,
-      )
+      output, errors = self.__swarm_rpc("swarm/disconnect", target, timeout=timeout)
       combined = " ".join(part for part in (output, errors) if part).lower()
       success = "disconnect" in combined or "success" in combined or "not connected" in combined
       return success, output, errors
@@ -1455,8 +1833,8 @@ class R1FSEngine:
       """
       waited = 0.0
       while waited < timeout:
-        peer_lines = self._get_swarm_peers()
-        if not any(peer_id in line for line in peer_lines):
+        self._get_swarm_peers()
+        if peer_id not in self.__peers_by_id:
           return True
         time.sleep(step)
         waited += step
@@ -1526,6 +1904,7 @@ class R1FSEngine:
       self.__ipfs_started = False
       self.__connected_at = None
       self.__peers = []
+      self.__peers_by_id = {}
 
     def __shutdown_daemon(self, timeout=20):
       """
@@ -1547,6 +1926,7 @@ class R1FSEngine:
         ["ipfs", "shutdown"],
         raise_on_error=False,
         timeout=10,
+        discard_output=True,
       )
       waited = 0
       while waited < timeout:
@@ -1592,6 +1972,8 @@ class R1FSEngine:
           ``True`` when the daemon becomes reachable.
       """
       self.P("Starting IPFS daemon in background...")
+      # a (re)started daemon may come up with a different identity/addresses
+      self.__ipfs_id_cached = False
       subprocess.Popen(
         ["ipfs", "daemon", "--enable-gc", "--migrate=true"],
         stdout=subprocess.DEVNULL,
@@ -1795,15 +2177,12 @@ class R1FSEngine:
       Get the IPFS peer ID via 'ipfs id' (JSON output).
       Returns the ipfs ID object.
       """
-      data = {}
-      output = self.__run_command(["ipfs", "id"])  # this will raise an exception if the command fails
       try:
-        data = json.loads(output)
+        data = self._rpc("id")  # this will raise an exception if the call fails
       except json.JSONDecodeError:
         raise Exception("Failed to parse JSON from 'ipfs id' output.")
       except Exception as e:
-        msg = f"Error getting IPFS ID: {e}. `ipfs id`:\n{data}"
-        self.P(msg, color='r')
+        self.P(f"Error getting IPFS ID: {e}", color='r')
         raise Exception(f"Error getting IPFS ID: {e}") from e
       return data
 
@@ -1817,11 +2196,14 @@ class R1FSEngine:
       verbose=False,
       return_errors=False,
       show_logs=True,
+      discard_output=False,
     ):
       """
       Run a shell command using subprocess.run with a timeout.
       Logs the command and its result. If verbose is enabled,
       prints command details. Raises an exception on error if raise_on_error is True.
+      With discard_output the stdout goes to /dev/null instead of being piped and
+      decoded (stderr is still captured for the error report) and "" is returned.
       """
       result = None
       failed = False
@@ -1833,7 +2215,8 @@ class R1FSEngine:
       try:
         result = subprocess.run(
           cmd_list, 
-          capture_output=True, 
+          stdout=subprocess.DEVNULL if discard_output else subprocess.PIPE,
+          stderr=subprocess.PIPE,
           text=True, 
           timeout=timeout,
         )
@@ -1859,7 +2242,7 @@ class R1FSEngine:
         if raise_on_error:
           raise Exception(f"Error while running '{cmd_str}': {result.stderr.strip()}")
       
-      if not failed:
+      if not failed and not discard_output:
         if show_logs:
           if verbose:
             self.Pd(f"Command output: {result.stdout.strip()}")
@@ -1867,13 +2250,91 @@ class R1FSEngine:
       if return_errors:
         return output, errors
       return output
+
+
+    def _rpc(
+      self,
+      path: str,
+      params: dict = None,
+      files: dict = None,
+      data=None,
+      headers: dict = None,
+      timeout=IPFSCt.TIMEOUT,
+      parse_json=True,
+      show_logs=True,
+      stream=False,
+    ):
+      """
+      Call the local daemon Kubo RPC (``/api/v0/<path>``) over the keep-alive session.
+
+      Parameters
+      ----------
+      path : str
+          RPC command path such as ``id``, ``swarm/peers`` or ``pin/add``.
+      params : dict, optional
+          Query arguments, e.g. ``{"arg": cid}``.
+      files : dict, optional
+          Multipart payload for upload commands.
+      data : bytes or iterable of bytes, optional
+          Raw request body, a generator is streamed with chunked transfer encoding.
+      headers : dict, optional
+          Extra request headers (e.g. the multipart content type of ``data``).
+      timeout : int, optional
+          Request timeout in seconds.
+      parse_json : bool, optional
+          Decode the response as a JSON document. If False, the raw text is
+          returned (streaming commands answer with one JSON object per line).
+      show_logs : bool, optional
+          Whether to log the call.
+      stream : bool, optional
+          Return the open ``requests.Response`` without reading its body, for
+          commands such as ``cat`` whose output is consumed incrementally.
+
+      Returns
+      -------
+      dict or str or requests.Response
+          Decoded JSON response, the raw response text or the streamed response.
+
+      Raises
+      ------
+      requests.RequestException
+          When the daemon is not reachable or does not answer within `timeout`
+          (``requests.Timeout``).
+      Exception
+          When the daemon rejects the command (non-200 answer), with its message.
+      """
+      if show_logs:
+        self.Pd(f"Calling RPC: {path} {params or ''}", color='d')
+      response = self.__rpc_session.post(
+        f"{self.__rpc_api_url}/{path}",
+        params=params,
+        files=files,
+        data=data,
+        headers=headers,
+        timeout=timeout,
+        stream=stream,
+      )
+      if response.status_code != 200:
+        try:
+          message = response.json().get("Message", response.text)
+        except ValueError:
+          message = response.text
+        raise Exception(f"Error while calling '{path}': {str(message).strip()}")
+      if stream:
+        return response
+      return _json_loads(response.content) if parse_json else response.text
     
 
     def __get_id(self) -> str:
       """
       Get the IPFS peer ID via 'ipfs id' (JSON output).
       Returns the 'ID' field as a string.
+
+      The identity does not change while the daemon runs, so the first successful
+      result is reused until the daemon is (re)started or the repo is reset.
       """
+      if self.__ipfs_id_cached and self.__ipfs_id:
+        return self.__ipfs_id
       data = self.get_ipfs_id_data()
       self.__ipfs_id_result = data
       self.__ipfs_id = data.get("ID", ERROR_TAG)
@@ -1883,6 +2344,7 @@ class R1FSEngine:
         self.__ipfs_address = None
       else:
         self.__ipfs_address = addrs[1] if len(addrs) > 1 else addrs[0] if len(addrs) else ERROR_TAG
+      self.__ipfs_id_cached = self.__ipfs_id != ERROR_TAG
       return self.__ipfs_id
     
 
@@ -1892,7 +2354,8 @@ class R1FSEngine:
       """
       Explicitly pin a CID (and fetch its data) so it appears in the local pinset.
       """
-      res = self.__run_command(["ipfs", "pin", "add", cid])
+      data = self._rpc("pin/add", params={"arg": cid})
+      res = " ".join(f"pinned {pinned} recursively" for pinned in (data.get("Pins") or []))
       self.Pd(f"{res}")
       return res  
 
@@ -1918,8 +2381,8 @@ class R1FSEngine:
           JSON-serializable data to add to IPFS.
           
       fn : str, optional
-          Filename to use for the JSON data. If None, uses DEFAULT_FILENAME_JSON
-          in a unique temporary directory.
+          Filename stored with the JSON data. If None, uses DEFAULT_FILENAME_JSON.
+          The data is uploaded from memory, no file is written.
           
       secret : str, optional
           Passphrase for AES-GCM encryption. Defaults to 'ratio1'.
@@ -1928,7 +2391,7 @@ class R1FSEngine:
           Nonce for encryption. If None, a random nonce will be generated.
           
       use_tempfile : bool, optional
-          If True, use a system temporary file with random name. If False, use specified filename in unique directory.
+          If True, store the data under a random filename instead of `fn`.
           
       show_logs : bool, optional
           Whether to show logs via self.P / self.Pd. Default is True.
@@ -1941,41 +2404,24 @@ class R1FSEngine:
       str
           The CID of the added JSON file.
       """
-      unique_dir = None
       try:
         json_data = json.dumps(data, sort_keys=True, separators=(',', ':'))
         if show_logs:
           self.P(f"JSON data: {json_data}")
         
+        # the serialized data is encrypted straight from memory, nothing is written to disk
         if use_tempfile:
-          if show_logs:
-            self.Pd("Using tempfile for JSON")
-          with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.json', delete=False
-          ) as f:
-            f.write(json_data)
-          fn = f.name
-        else:
-          # Use default filename if none specified
-          if fn is None:
-            fn = DEFAULT_FILENAME_JSON
-            
-          # Create unique temporary directory for the file
-          unique_dir = os.path.join(tempfile.gettempdir(), uuid.uuid4().hex)
-          os.makedirs(unique_dir, exist_ok=True)
-          fn = os.path.join(unique_dir, fn)
-          
-          if show_logs:
-            self.Pd(f"Using unique directory for JSON: {fn}")
-          with open(fn, "w") as f:
-            f.write(json_data)
-        #end if tempfile
+          fn = self._get_unique_name(prefix="tmp", suffix=".json")
+        elif fn is None:
+          fn = DEFAULT_FILENAME_JSON
+        basename = os.path.basename(fn)
         
         if show_logs:
-          self.Pd(f"About to call add_file with: file_path={fn}, nonce={nonce}, secret={secret[:10] if secret else 'None'}...")
+          self.Pd(f"About to call add_file with: original_basename={basename}, nonce={nonce}, secret={secret[:10] if secret else 'None'}...")
         
         cid = self.add_file(
-          file_path=fn,
+          data_stream=BytesIO(json_data.encode("utf-8")),
+          original_basename=basename,
           secret=secret,
           nonce=nonce,
           show_logs=show_logs,
@@ -1993,18 +2439,6 @@ class R1FSEngine:
         if raise_on_error:
           raise
         return None
-        
-      finally:
-        # Clean up temporary files and directories
-        if fn and os.path.exists(fn):
-          os.remove(fn)
-          if show_logs:
-            self.Pd(f"Cleaned up temporary JSON file: {fn}")
-            
-        if unique_dir and os.path.exists(unique_dir):
-          os.rmdir(unique_dir)
-          if show_logs:
-            self.Pd(f"Cleaned up temporary directory: {unique_dir}")
       
       
     def add_yaml(
@@ -2024,19 +2458,14 @@ class R1FSEngine:
         import yaml
         yaml_data = yaml.dump(data)
         if tempfile:
-          if show_logs:
-            self.Pd("Using tempfile for YAML")
-          with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_data)
-          fn = f.name
+          fn = self._get_unique_name(prefix="tmp", suffix=".yaml")
         else:
           fn = self._get_unique_or_complete_upload_name(fn=fn, suffix=".yaml")
           if show_logs:
             self.Pd(f"Using unique name for YAML: {fn}")
-          with open(fn, "w") as f:
-            f.write(yaml_data)
         cid = self.add_file(
-          file_path=fn,
+          data_stream=BytesIO(yaml_data.encode("utf-8")),
+          original_basename=os.path.basename(fn),
           secret=secret,
           nonce=nonce,
           show_logs=show_logs,
@@ -2068,7 +2497,8 @@ class R1FSEngine:
           Python object to pickle and add to IPFS.
           
       fn : str, optional
-          Filename to use for the pickle data. If None, generates a unique filename.
+          Filename stored with the pickle data. If None, generates a unique filename.
+          The data is uploaded from memory, no file is written.
           
       secret : str, optional
           Passphrase for AES-GCM encryption. Defaults to 'ratio1'.
@@ -2077,7 +2507,7 @@ class R1FSEngine:
           Nonce for encryption. If None, a random nonce will be generated.
           
       use_tempfile : bool, optional
-          If True, use a system temporary file with random name. If False, use specified filename.
+          If True, store the data under a random filename instead of `fn`.
           
       show_logs : bool, optional
           Whether to show logs via self.P / self.Pd. Default is True.
@@ -2096,27 +2526,22 @@ class R1FSEngine:
           self.Pd(f"Pickling data of type: {type(data)}")
         
         if use_tempfile:
+          fn = self._get_unique_name(prefix="tmp", suffix=".pkl")
+        elif fn is None:
+          fn = self._get_unique_or_complete_upload_name(fn=fn, suffix=".pkl")
           if show_logs:
-            self.Pd("Using tempfile for Pickle")
-          with tempfile.NamedTemporaryFile(mode='wb', suffix='.pkl', delete=False) as f:
-            pickle.dump(data, f)
-          fn = f.name
+            self.Pd(f"Using unique name for pkl: {fn}")
         else:
-          if fn is None:
-            fn = self._get_unique_or_complete_upload_name(fn=fn, suffix=".pkl")
-            if show_logs:
-              self.Pd(f"Using unique name for pkl: {fn}")
-          else:
-            if show_logs:
-              self.Pd(f"Using provided filename: {fn}")
-          with open(fn, "wb") as f:
-            pickle.dump(data, f)
+          if show_logs:
+            self.Pd(f"Using provided filename: {fn}")
+        basename = os.path.basename(fn)
         
         if show_logs:
-          self.Pd(f"About to call add_file with: file_path={fn}, nonce={nonce}, secret={secret[:10] if secret else 'None'}...")
+          self.Pd(f"About to call add_file with: original_basename={basename}, nonce={nonce}, secret={secret[:10] if secret else 'None'}...")
         
         cid = self.add_file(
-          file_path=fn,
+          data_stream=BytesIO(pickle.dumps(data)),
+          original_basename=basename,
           secret=secret,
           nonce=nonce,
           show_logs=show_logs,
@@ -2134,23 +2559,124 @@ class R1FSEngine:
         if raise_on_error:
           raise
         return None
-        
+
+
+    def __iter_encrypted_file(self, file_path: str, key: bytes, nonce_bytes: bytes, meta_bytes: bytes):
+      """
+      Encrypt a file with AES-GCM, see `__iter_encrypted_stream` for the layout.
+      """
+      with open(file_path, "rb", buffering=0) as fin:
+        yield from self.__iter_encrypted_stream(
+          fin, os.path.getsize(file_path), key, nonce_bytes, meta_bytes
+        )
+      return
+
+    def __iter_encrypted_stream(self, fin, size: int, key: bytes, nonce_bytes: bytes, meta_bytes: bytes):
+      """
+      Encrypt a binary stream with AES-GCM and yield the R1FS ciphertext layout piece by piece.
+
+      The layout is ``[nonce][4-byte-len][metadata][ciphertext][16-byte GCM tag]``.
+      Inputs up to ``IPFSCt.ONE_SHOT_CIPHER_MAX_SIZE`` are encrypted with a single
+      ``AESGCM.encrypt`` call, which yields the very same bytes as the streamed path.
+
+      Parameters
+      ----------
+      fin : binary file-like
+          Plaintext source, read from its current position to the end.
+      size : int
+          Number of plaintext bytes left in `fin`.
+      key : bytes
+          32-byte AES key.
+      nonce_bytes : bytes
+          12-byte GCM nonce.
+      meta_bytes : bytes
+          JSON metadata, encrypted in front of the file content.
+
+      Yields
+      ------
+      bytes
+          Consecutive pieces of the ciphertext file.
+      """
+      header = nonce_bytes + len(meta_bytes).to_bytes(4, "big")
+      if size <= IPFSCt.ONE_SHOT_CIPHER_MAX_SIZE:
+        yield header
+        # the 16-byte tag is appended to the ciphertext by AESGCM
+        yield AESGCM(key).encrypt(nonce_bytes, meta_bytes + fin.read(), None)
+        return
+      encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce_bytes)).encryptor()
+      yield header + encryptor.update(meta_bytes)
+      # the pooled read buffer is reused, only the ciphertext pieces are new objects
+      # (they may still be queued for upload while the next chunk is read)
+      raw_buffer = _borrow_chunk_buffer()
+      buffer = memoryview(raw_buffer)[:IPFSCt.CIPHER_CHUNK_SIZE]
+      try:
+        while True:
+          n_read = fin.readinto(buffer)
+          if not n_read:
+            break
+          yield encryptor.update(buffer[:n_read])
+        #end while there are still bytes to read
       finally:
-        # Clean up temporary files
-        if 'fn' in locals() and fn and os.path.exists(fn):
-          os.remove(fn)
-          if show_logs:
-            self.Pd(f"Cleaned up temporary pickle file: {fn}")
+        _return_chunk_buffer(raw_buffer)
+      # GCM has no trailing block for finalize(), so this is (almost) just the tag
+      yield encryptor.finalize() + encryptor.tag
+      return
+
+    def __iter_multipart_file(self, boundary: str, filename: str, chunks):
+      """
+      Wrap a stream of file pieces in a single-part ``multipart/form-data`` body.
 
+      Parameters
+      ----------
+      boundary : str
+          Multipart boundary (must not occur in the payload, a random token is used).
+      filename : str
+          File name reported to the daemon.
+      chunks : iterable of bytes
+          The file content.
+
+      Yields
+      ------
+      bytes
+          The multipart body.
+      """
+      # Small pieces (multipart framing, ciphertext header, tag, small payloads)
+      # are joined so each one does not become its own chunked-encoding write;
+      # pieces of at least IPFSCt.UPLOAD_COALESCE_SIZE are passed through uncopied.
+      pending = [(
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+      ).encode("utf-8")]
+      pending_size = len(pending[0])
+      for chunk in chunks:
+        if not chunk:
+          continue
+        if pending_size + len(chunk) > IPFSCt.UPLOAD_COALESCE_SIZE:
+          if pending:
+            yield b"".join(pending)
+            pending, pending_size = [], 0
+          if len(chunk) >= IPFSCt.UPLOAD_COALESCE_SIZE:
+            yield chunk
+            continue
+        #end if flush
+        pending.append(chunk)
+        pending_size += len(chunk)
+      #end for chunks
+      pending.append(f"\r\n--{boundary}--\r\n".encode("utf-8"))
+      yield b"".join(pending)
+      return
 
     @require_ipfs_started
     def add_file(
       self,
-      file_path: str,
+      file_path: str = None,
       nonce: int = None,
       secret: str = None,
       raise_on_error: bool = False,
       show_logs: bool = True,
+      data_stream=None,
+      original_basename: str = None,
     ) -> str:
       """
       Add a file to R1FS with default encryption. The secret parameter is mandatory,
@@ -2172,6 +2698,14 @@ class R1FSEngine:
       show_logs : bool, optional
         Whether to show logs via self.P / self.Pd. Default is True.
 
+      data_stream : binary file-like, optional
+        Seekable in-memory or file stream (e.g. ``io.BytesIO``) uploaded instead of
+        `file_path`, from its current position to the end. Nothing is written to disk.
+
+      original_basename : str, optional
+        Filename stored in the encrypted metadata. Defaults to the basename of
+        `file_path`, or to a unique name for `data_stream` uploads.
+
       Returns
       -------
       str
@@ -2203,20 +2737,31 @@ class R1FSEngine:
       >>> print(cid)
       QmFolder123ABC
       """
-      add_time, remove_time, pin_time = 0.0, 0.0, 0.0
+      add_time, pin_time = 0.0, 0.0
       relay_publish_time = 0.0
       start_time = time.time()
 
       if secret in ["", None]:
         secret = self.__DEFAULT_SECRET
       
-      if not os.path.isfile(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+      if data_stream is not None:
+        start_pos = data_stream.tell()
+        file_size = data_stream.seek(0, os.SEEK_END) - start_pos
+        data_stream.seek(start_pos)
+        if original_basename is None:
+          original_basename = self._get_unique_name(suffix=".bin")
+      else:
+        if file_path is None or not os.path.isfile(file_path):
+          raise FileNotFoundError(f"File not found: {file_path}")
+        file_size = os.path.getsize(file_path)
+        if original_basename is None:
+          original_basename = os.path.basename(file_path)
+      #end if stream or file
+      source_name = file_path if data_stream is None else original_basename
 
       # Check file size and throw an error if larger than 5 GB.
-      file_size = os.path.getsize(file_path)
       if file_size > 5 * 1024 * 1024 * 1024:
-        raise ValueError(f"File {file_path} is too large ({file_size} bytes). Maximum allowed size is 2 GB.")
+        raise ValueError(f"File {source_name} is too large ({file_size} bytes). Maximum allowed size is 2 GB.")
 
       key = self._hash_secret(secret)  # mandatory passphrase
 
@@ -2228,8 +2773,6 @@ class R1FSEngine:
         original_nonce = nonce
         nonce_bytes = random.Random(nonce).randbytes(12)
 
-      original_basename = os.path.basename(file_path)
-
       # JSON metadata storing the original filename
       meta_dict = {"filename": original_basename}
       meta_bytes = json.dumps(meta_dict).encode("utf-8")
@@ -2239,43 +2782,36 @@ class R1FSEngine:
         self.Pd(f"Metadata: {meta_dict}")
         self.Pd(f"Secret hash (first 16 bytes): {key[:16].hex()}")
 
-      tmp_cipher_path = os.path.join(tempfile.gettempdir(), uuid.uuid4().hex + ".bin")
+      # the ciphertext is streamed to the daemon as it is produced, no temporary file
+      cipher_name = secrets.token_hex(16) + ".bin"
+      boundary = secrets.token_hex(16)
       
       folder_cid = None
       try:
-        encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce_bytes)).encryptor()
-
-        chunk_size = 1024 * 1024  # 1 MB chunks
-        with open(file_path, "rb") as fin, open(tmp_cipher_path, "wb") as fout:
-          # [nonce][4-byte-len][metadata][ciphertext][16-byte GCM tag]
-          fout.write(nonce_bytes)
-          meta_len = len(meta_bytes)
-          fout.write(meta_len.to_bytes(4, "big"))
-          # encrypt the metadata and save
-          enc_meta_data = encryptor.update(meta_bytes)
-          fout.write(enc_meta_data)
-
-          while True:
-            chunk = fin.read(chunk_size)
-            if not chunk:
-              break
-            fout.write(encryptor.update(chunk))
-          #end while there are still bytes to read
-          final_ct = encryptor.finalize()
-          fout.write(final_ct)
-          # Append 16-byte GCM tag
-          tag = encryptor.tag
-          fout.write(tag)
-        #end with fin, fout
-
-        # Now we IPFS-add the ciphertext
-        output = self.__run_command(["ipfs", "add", "-q", "-w", tmp_cipher_path], show_logs=show_logs)
-        lines = output.strip().split("\n")
-        self.P("output lines: ", json.dumps(lines))
+        if data_stream is not None:
+          cipher_chunks = self.__iter_encrypted_stream(data_stream, file_size, key, nonce_bytes, meta_bytes)
+        else:
+          cipher_chunks = self.__iter_encrypted_file(file_path, key, nonce_bytes, meta_bytes)
+        if file_size > 1024 * 1024:
+          # encrypt the next chunks while the current ones are on the wire
+          cipher_chunks = _iter_prefetched(cipher_chunks)
+        body = self.__iter_multipart_file(boundary, cipher_name, cipher_chunks)
+        output = self._rpc(
+          "add",
+          params={"wrap-with-directory": "true", "quieter": "true"},
+          data=body,
+          headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+          parse_json=False,
+          show_logs=show_logs,
+        )
+        # one JSON object per line, the wrapping directory comes last
+        lines = [_json_loads(line) for line in output.splitlines() if line.strip()]
+        if show_logs:
+          self.Pd(f"add output: {json.dumps(lines)}")
 
         if not lines:
-          raise RuntimeError("No output from 'ipfs add -w -q' for ciphertext.")
-        folder_cid = lines[-1].strip()
+          raise RuntimeError("No output from the daemon 'add' for ciphertext.")
+        folder_cid = lines[-1]["Hash"]
         self.__set_upload_status(
           folder_cid,
           source_path=file_path,
@@ -2286,7 +2822,7 @@ class R1FSEngine:
           relay_detail="Local IPFS add completed; relay publication pending.",
         )
       except Exception as e:
-        msg = f"Error encrypting file {file_path}: {e}"
+        msg = f"Error encrypting file {source_name}: {e}"
         if raise_on_error:
           raise RuntimeError(msg)
         else:
@@ -2294,14 +2830,21 @@ class R1FSEngine:
       #end try
       add_time = time.time() - start_time
       
-      remove_start_time = time.time()
-      # Cleanup temp file
-      os.remove(tmp_cipher_path)
-      remove_time = time.time() - remove_start_time
-      
       if folder_cid is not None:
         pin_start_time = time.time()
-        self.__uploaded_files[folder_cid] = file_path
+        self.__uploaded_files[folder_cid] = source_name
+        # Keep the local node pinned even when relay publication is deferred.
+        # The local pin RPC runs while the (remote, retried) relay publication
+        # is in flight; the upload status is only updated from this thread.
+        pin_errors = []
+        def _pin_locally():
+          try:
+            self.__pin_add(folder_cid)
+          except Exception as exc:
+            pin_errors.append(exc)
+          return
+        pin_thread = Thread(target=_pin_locally, name="r1fs_local_pin", daemon=True)
+        pin_thread.start()
         relay_publish_start = time.time()
         self.__publish_cid_to_relay(
           cid=folder_cid,
@@ -2312,8 +2855,9 @@ class R1FSEngine:
           raise_on_error=False,
         )
         relay_publish_time = time.time() - relay_publish_start
-        # Keep the local node pinned even when relay publication is deferred.
-        self.__pin_add(folder_cid)
+        pin_thread.join()
+        if pin_errors:
+          raise pin_errors[0]
         self.__set_upload_status(
           folder_cid,
           source_path=file_path,
@@ -2328,14 +2872,199 @@ class R1FSEngine:
         upload_status = self.get_upload_status(folder_cid) if folder_cid else {}
         relay_status = upload_status.get("relay_status", "unknown")
         self.P(
-          f"Added file {file_path} as <{folder_cid}> in {total_time:.2f}s: "
-          f"add_time={add_time:.2f}s, remove_time={remove_time:.2f}s, "
+          f"Added file {source_name} as <{folder_cid}> in {total_time:.2f}s: "
+          f"add_time={add_time:.2f}s, "
           f"relay_publish_time={relay_publish_time:.2f}s, pin_time={pin_time:.2f}s, "
           f"relay_status={relay_status}"
         )
       return folder_cid
 
 
+    @require_ipfs_started
+    def put_many(
+      self,
+      paths: list,
+      secret: str = None,
+      max_workers: int = None,
+      raise_on_error: bool = False,
+      show_logs: bool = True,
+    ) -> dict:
+      """
+      Add several files to R1FS concurrently.
+
+      Each file goes through `add_file`. The uploads overlap on a bounded thread
+      pool, so a batch of small files takes roughly as long as the slowest add
+      instead of the sum of all of them.
+
+      Parameters
+      ----------
+      paths : list[str]
+        Paths of the local plaintext files.
+
+      secret : str, optional
+        Passphrase used for every file, defaulting to 'ratio1'.
+
+      max_workers : int, optional
+        Number of concurrent uploads. Defaults to ``IPFSCt.PUT_MANY_MAX_WORKERS``.
+
+      raise_on_error : bool, optional
+        If True, the first failed upload raises. Otherwise its CID is None. Default is False.
+
+      show_logs : bool, optional
+        Whether to show logs via self.P / self.Pd. Default is True.
+
+      Returns
+      -------
+      dict
+        Path -> folder CID (None for failed uploads when `raise_on_error` is False).
+
+      Examples
+      --------
+      >>> cids = engine.put_many(["/data/a.json", "/data/b.json"])
+      >>> cids["/data/a.json"]
+      QmFolderA
+      """
+      paths = list(dict.fromkeys(paths))
+      if not paths:
+        return {}
+      max_workers = max(1, min(max_workers or IPFSCt.PUT_MANY_MAX_WORKERS, len(paths)))
+      start_time = time.time()
+      with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="r1fs_put") as executor:
+        futures = {
+          path: executor.submit(
+            self.add_file,
+            file_path=path,
+            secret=secret,
+            raise_on_error=raise_on_error,
+            show_logs=show_logs,
+          )
+          for path in paths
+        }
+        results = {}
+        for path, future in futures.items():
+          try:
+            results[path] = future.result()
+          except Exception as e:
+            # add_file validates its input before its own error handling
+            if raise_on_error:
+              raise
+            self.P(f"Error adding file {path}: {e}", color='r')
+            results[path] = None
+          #end try
+        #end for futures
+      #end with executor
+      if show_logs:
+        n_failed = sum(cid is None for cid in results.values())
+        self.P(
+          f"Added {len(paths) - n_failed}/{len(paths)} files with {max_workers} workers "
+          f"in {time.time() - start_time:.2f}s"
+        )
+      return results
+
+
+    def __iter_cid_file(self, cid: str, timeout: int):
+      """
+      Yield the content of the single file wrapped by the folder `cid` from the daemon RPC.
+
+      Any failure to list or read the content is raised as `_R1FSFetchError`.
+      """
+      daemon_timeout = f"{timeout}s"
+      try:
+        listing = self._rpc(
+          "ls",
+          params={"arg": cid, "resolve-type": "false", "size": "false", "timeout": daemon_timeout},
+          timeout=timeout,
+          show_logs=False,
+        )
+        links = listing["Objects"][0]["Links"]
+        if len(links) != 1:
+          raise RuntimeError(f"expected 1 file in {cid}, found {[link.get('Name') for link in links]}")
+        response = self._rpc(
+          "cat", params={"arg": links[0]["Hash"], "timeout": daemon_timeout}, timeout=timeout, stream=True,
+        )
+      except Exception as e:
+        raise _R1FSFetchError(str(e)) from e
+      with response:
+        chunks = response.iter_content(chunk_size=IPFSCt.CIPHER_CHUNK_SIZE)
+        while True:
+          try:
+            chunk = next(chunks)
+          except StopIteration:
+            break
+          except Exception as e:
+            raise _R1FSFetchError(str(e)) from e
+          yield chunk
+        #end while chunks
+      #end with response
+      return
+
+    def __decrypt_chunks_to_folder(self, chunks, key: bytes, local_folder: str) -> str:
+      """
+      Decrypt an R1FS ciphertext arriving as a stream of byte chunks into `local_folder`.
+
+      The header is parsed from the first bytes and the last 16 bytes are held back
+      as the GCM tag, so the ciphertext never has to be stored. The partially written
+      file is removed if the tag does not verify.
+
+      Returns
+      -------
+      str
+          Path of the restored plaintext file.
+      """
+      chunks = iter(chunks)
+      head = b""
+      meta_len = None
+      while meta_len is None or len(head) < 16 + meta_len:
+        chunk = next(chunks, None)
+        if chunk is None:
+          raise ValueError("Truncated R1FS ciphertext header")
+        head += chunk
+        if meta_len is None and len(head) >= 16:
+          meta_len = int.from_bytes(head[12:16], "big")
+      #end while header incomplete
+      decryptor = Cipher(algorithms.AES(key), modes.GCM(head[:12])).decryptor()
+      meta_dict = _json_loads(decryptor.update(head[16:16 + meta_len]))
+      original_filename = meta_dict.get("filename", "restored_file.bin")
+      out_path = os.path.join(local_folder, original_filename)
+      tail = head[16 + meta_len:]
+      # pooled output buffer, update_into needs block_size - 1 spare bytes; it is only
+      # replaced if the transport hands over a chunk larger than CIPHER_CHUNK_SIZE
+      raw_buffer = _borrow_chunk_buffer()
+      out_buffer = memoryview(raw_buffer)
+      try:
+        with open(out_path, "wb") as fout:
+          if len(tail) > 16:
+            fout.write(decryptor.update(tail[:-16]))
+            tail = tail[-16:]
+          for chunk in chunks:
+            if len(chunk) >= 16:
+              # the held back bytes turned out not to be the tag
+              if tail:
+                fout.write(decryptor.update(tail))
+              view = memoryview(chunk)
+              if len(view) - 1 > len(out_buffer):
+                out_buffer = memoryview(bytearray(len(view) - 1))
+              n_plain = decryptor.update_into(view[:-16], out_buffer)
+              fout.write(out_buffer[:n_plain])
+              tail = view[-16:].tobytes()
+            else:
+              tail += chunk
+              if len(tail) > 16:
+                fout.write(decryptor.update(tail[:-16]))
+                tail = tail[-16:]
+            #end if chunk size
+          #end for chunks
+          fout.write(decryptor.finalize_with_tag(tail))
+        #end with fout
+      except BaseException:
+        if os.path.exists(out_path):
+          os.remove(out_path)
+        raise
+      finally:
+        _return_chunk_buffer(raw_buffer)
+      return out_path
+
+
     @require_ipfs_started
     def get_file(
       self,
@@ -2347,6 +3076,7 @@ class R1FSEngine:
       raise_on_error: bool = False,
       show_logs: bool = True,
       return_absolute_path: bool = True,
+      force_refresh: bool = False,
     ) -> str:
       """
       Retrieve an encrypted file from R1FS by CID, decrypt with AES-GCM in streaming mode.
@@ -2381,6 +3111,10 @@ class R1FSEngine:
       return_absolute_path : bool, optional
         If True, return the absolute path to the restored plaintext file.
 
+      force_refresh : bool, optional
+        If True, download again even if this CID was already restored to the same
+        folder with the same secret and the file is unchanged since. Default False.
+
       Returns
       -------
       str
@@ -2423,6 +3157,10 @@ class R1FSEngine:
         
       key = self._hash_secret(secret)
 
+      if local_folder is None:
+        local_folder = self.__downloads_dir # default downloads directory
+      final_folder = os.path.join(local_folder, cid) # add the CID as a subfolder
+
       if pin:
         try:
           pin_result = self.__pin_add(cid)
@@ -2447,43 +3185,134 @@ class R1FSEngine:
         #end try
       #end if pin
 
-      if local_folder is None:
-        local_folder = self.__downloads_dir # default downloads directory
-      
-      os.makedirs(local_folder, exist_ok=True)
-      
-      local_folder = os.path.join(local_folder, cid) # add the CID as a subfolder
-      
-      # if the folder exists cleanup the content 
-      if os.path.exists(local_folder):
-        if os.path.isdir(local_folder):
-          if show_logs:
-            files = os.listdir(local_folder)
-            self.Pd(f"Cleaning up {local_folder} with {files}")
-          #end if show_logs
-          shutil.rmtree(local_folder)
-        else:
-          # If it's a file, just remove it
+      # an unchanged previous download only spares the fetch and decryption, the
+      # pin above is still applied
+      if not force_refresh:
+        cached_path = self.__get_cached_download(cid, key, final_folder)
+        if cached_path is not None:
           if show_logs:
-            self.Pd(f"Removing existing file {local_folder}")
-          #end if show_logs
-          os.remove(local_folder)
-        #end if isdir
-      #end if local_folder exists
+            self.Pd(f"Reusing previous download of {cid}: {cached_path}")
+          return os.path.abspath(cached_path) if return_absolute_path else cached_path
+      #end if not force_refresh
 
-      
-      if show_logs:
-        self.Pd(f"Downloading file {cid} to {local_folder}")
-      # IPFS get the single ciphertext file
+      os.makedirs(local_folder, exist_ok=True)
+
+      # Download into a fresh hidden folder that replaces `final_folder` only once
+      # the plaintext is complete, so a partial download is never visible there.
+      # os.makedirs keeps the umask-based permissions (mkdtemp would force 0700).
+      work_folder = os.path.join(local_folder, f".{cid}_{secrets.token_hex(8)}")
+      stale_path = None
+      os.makedirs(work_folder)
+      try:
+        if show_logs:
+          self.Pd(f"Downloading file {cid} to {final_folder}")
+        work_path = self.__download_and_decrypt(
+          cid, key=key, local_folder=work_folder, timeout=timeout,
+          raise_on_error=raise_on_error, show_logs=show_logs,
+        )
+        if work_path is None:
+          return None
+        # A previous download is moved aside rather than deleted in place, so a
+        # caller still reading from it keeps its open files until it is swapped out.
+        if os.path.lexists(final_folder):
+          os.rename(final_folder, work_folder + "_stale")
+          stale_path = work_folder + "_stale" # only set once the rename succeeded
+        os.rename(work_folder, final_folder)
+      finally:
+        shutil.rmtree(work_folder, ignore_errors=True)
+        if stale_path is not None and os.path.lexists(stale_path):
+          if os.path.isdir(stale_path) and not os.path.islink(stale_path):
+            shutil.rmtree(stale_path, ignore_errors=True)
+          else:
+            os.remove(stale_path)
+      #end try work folder
+
+      out_path = os.path.join(final_folder, os.path.basename(work_path))
+      stat = os.stat(out_path)
+      self.__downloaded_files_stat[cid] = (key, stat.st_size, stat.st_mtime_ns)
+      if return_absolute_path:
+        out_path = os.path.abspath(out_path)
+      self.__downloaded_files[cid] = out_path
+      return out_path
+
+
+    def __get_cached_download(self, cid, key, final_folder):
+      """
+      Find a still valid previous download of `cid` into `final_folder`.
+
+      A download is reused only if it was decrypted with the same key and the
+      plaintext file still has the size and mtime recorded when it was written.
+
+      Parameters
+      ----------
+      cid : str
+          The CID being requested.
+      key : str
+          The decryption key of the current request.
+      final_folder : str
+          The folder the file is requested into.
+
+      Returns
+      -------
+      str or None
+          Path of the reusable plaintext file, None if it must be downloaded again.
+      """
+      cached_path = self.__downloaded_files.get(cid)
+      if cached_path is None or self.__downloaded_files_stat.get(cid, (None,))[0] != key:
+        return None
+      if os.path.abspath(os.path.dirname(cached_path)) != os.path.abspath(final_folder):
+        return None
+      try:
+        stat = os.stat(cached_path)
+      except OSError:
+        return None
+      if self.__downloaded_files_stat[cid][1:] != (stat.st_size, stat.st_mtime_ns):
+        return None
+      return os.path.join(final_folder, os.path.basename(cached_path))
+
+
+    def __download_and_decrypt(self, cid, key, local_folder, timeout, raise_on_error, show_logs):
+      """
+      Fetch the ciphertext of `cid` and decrypt it into the existing, empty `local_folder`.
+
+      Returns
+      -------
+      str or None
+          Path of the plaintext file, None on errors when `raise_on_error` is False.
+      """
       ipfs_timeout = timeout if timeout else 90  # or IPFSCt.TIMEOUT
+
+      # Stream the ciphertext from the daemon straight into the decryptor; the
+      # `ipfs get` into a ciphertext file below is only the fallback.
+      start_time = time.time()
+      try:
+        out_path = self.__decrypt_chunks_to_folder(
+          self.__iter_cid_file(cid, timeout=ipfs_timeout), key=key, local_folder=local_folder,
+        )
+        if show_logs:
+          self.P(f"Downloaded+decrypted (streamed) in {time.time() - start_time:.1f}s <{cid}> {os.path.basename(out_path)}")
+        return out_path
+      except _R1FSFetchError as e:
+        self.P(f"Streaming download of {cid} failed, falling back to ipfs get: {e}", color='y')
+      except Exception as e:
+        msg = f"Error decrypting file {cid}: {e}"
+        if raise_on_error:
+          raise RuntimeError(msg)
+        self.P(msg, color='r')
+        return None
+      #end try streamed download
+
+      # IPFS get the single ciphertext file
+      cipher_folder = os.path.join(local_folder, f".{cid}.ipfs")
       start_time = time.time()
       download_error = None
       try:
         self.__run_command(
-          ["ipfs", "get", cid, "-o", local_folder],
+          ["ipfs", "get", cid, "-o", cipher_folder],
           timeout=ipfs_timeout,
           raise_on_error=True,
-          show_logs=show_logs
+          show_logs=show_logs,
+          discard_output=True,
         )
       except Exception as e:
         download_error = str(e)
@@ -2492,10 +3321,11 @@ class R1FSEngine:
         if healed:
           try:
             self.__run_command(
-              ["ipfs", "get", cid, "-o", local_folder],
+              ["ipfs", "get", cid, "-o", cipher_folder],
               timeout=ipfs_timeout,
               raise_on_error=True,
-              show_logs=show_logs
+              show_logs=show_logs,
+              discard_output=True,
             )
             download_error = None
           except Exception as retry_error:
@@ -2507,75 +3337,84 @@ class R1FSEngine:
         return None
       download_elapsed_time = time.time() - start_time
 
-      # Expect exactly one file
-      if not os.path.isdir(local_folder):
-        msg = f"Expected {local_folder} to be a directory after IPFS download, but it's not"
-        if raise_on_error:
-          raise RuntimeError(msg)
+      # Expect exactly one file (the folder is private, so nothing else can be in it)
+      try:
+        contents = os.listdir(cipher_folder)
+      except NotADirectoryError:
+        contents = None
+      if contents is None or len(contents) != 1:
+        if contents is None:
+          msg = f"Expected {cipher_folder} to be a directory after IPFS download, but it's not"
         else:
-          self.P(msg, color='r')
-          return
-
-      contents = os.listdir(local_folder)
-      if len(contents) != 1:
-        msg = f"Expected 1 file in {local_folder}, found {contents}"
+          msg = f"Expected 1 file in {cipher_folder}, found {contents}"
         if raise_on_error:
           raise RuntimeError(msg)
         else:
           self.P(msg, color='r')
           return
 
-      cipher_path = os.path.join(local_folder, contents[0])
+      cipher_path = os.path.join(cipher_folder, contents[0])
       
       out_path = None
 
       # Decrypt with AES-GCM
       start_time = time.time()
       try:
-        with open(cipher_path, "rb") as fin:
-          nonce = fin.read(12)
-          meta_len_bytes = fin.read(4)
-          meta_len = int.from_bytes(meta_len_bytes, "big")
-
-          decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).decryptor()
-          
-          # Read the metadata and decrypt it
-          enc_meta_data = fin.read(meta_len)
-          meta_data = decryptor.update(enc_meta_data) # TODO: verify if this is correct
-          meta_dict = json.loads(meta_data.decode("utf-8"))
+        with open(cipher_path, "rb", buffering=0) as fin:
+          total_size = os.fstat(fin.fileno()).st_size
+          # One read for nonce + length prefix + metadata, sliced without copies
+          head = memoryview(fin.read(IPFSCt.DOWNLOAD_HEAD_READ_SIZE))
+          nonce = head[:12].tobytes()
+          meta_len = int.from_bytes(head[12:16], "big")
+          data_start = 12 + 4 + meta_len
+          if len(head) < data_start and len(head) < total_size:
+            head = memoryview(head.tobytes() + fin.read(data_start - len(head)))
+
+          plain_data = None
+          if total_size <= IPFSCt.ONE_SHOT_CIPHER_MAX_SIZE:
+            # Small file: decrypt and verify the tag in one call, before writing anything
+            ciphertext = head[16:] if len(head) == total_size else head[16:].tobytes() + fin.read()
+            plain_data = memoryview(AESGCM(key).decrypt(nonce, ciphertext, None))
+            meta_data = plain_data[:meta_len].tobytes()
+          else:
+            decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).decryptor()
+            meta_data = decryptor.update(head[16:data_start])
+          meta_dict = _json_loads(meta_data)
 
           original_filename = meta_dict.get("filename", "restored_file.bin")
 
-          # File size + chunk logic to isolate last 16 bytes as GCM tag
-          fin.seek(0, os.SEEK_END)
-          total_size = fin.tell()
-          data_start = 12 + 4 + meta_len
-          tag_size = 16
-          content_size = total_size - data_start - tag_size
-          fin.seek(data_start, os.SEEK_SET)
-
           out_path = os.path.join(local_folder, original_filename)
-          if return_absolute_path:
-            out_path = os.path.abspath(out_path)
-          chunk_size = 1024 * 1024
 
           with open(out_path, "wb") as fout:
-            remaining = content_size
-            while remaining > 0:
-              read_len = min(chunk_size, remaining)
-              chunk = fin.read(read_len)
-              if not chunk:
-                break
-              fout.write(decryptor.update(chunk))
-              remaining -= read_len
-            #end while there are still bytes to read
-            # Final 16 bytes => GCM tag
-            tag = fin.read(16)
-            # decryptor.authenticate_tag(tag)
-            # final_pt = decryptor.finalize()
-            final_pt = decryptor.finalize_with_tag(tag)
-            if final_pt:
-              fout.write(final_pt)
+            if plain_data is not None:
+              fout.write(plain_data[meta_len:])
+            else:
+              # Map the ciphertext and feed slices of the mapping to the decryptor,
+              # which saves copying the whole file into a read buffer first
+              content_end = total_size - 16
+              chunk_size = IPFSCt.CIPHER_CHUNK_SIZE
+              # pooled output buffer, update_into needs block_size - 1 spare bytes
+              raw_buffer = _borrow_chunk_buffer()
+              out_buffer = memoryview(raw_buffer)
+              with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                  for chunk_start in range(data_start, content_end, chunk_size):
+                    chunk = view[chunk_start:min(chunk_start + chunk_size, content_end)]
+                    n_plain = decryptor.update_into(chunk, out_buffer)
+                    chunk.release()
+                    fout.write(out_buffer[:n_plain])
+                  #end for chunks
+                  # Final 16 bytes => GCM tag
+                  tag = view[max(content_end, data_start):].tobytes()
+                finally:
+                  view.release()
+                  _return_chunk_buffer(raw_buffer)
+              #end with mapped
+              final_pt = decryptor.finalize_with_tag(tag)
+              if final_pt:
+                fout.write(final_pt)
+            #end if one-shot or streamed
           #end with fout 
         #end with fin
         decrypt_elapsed_time = time.time() - start_time
@@ -2588,16 +3427,111 @@ class R1FSEngine:
           self.P(msg, color='r')
       #end try
 
-      # Optionally remove the ciphertext
-      os.remove(cipher_path)      
+      # Remove the ciphertext
+      shutil.rmtree(cipher_folder)
 
-      if out_path:
-        if show_logs:
-          self.P(f"Downloaded/descrypted in {download_elapsed_time:.1f}s/{decrypt_elapsed_time:.1f}s <{cid}> to {out_path}")
-        self.__downloaded_files[cid] = out_path      
-      #end if out_path is not None
+      if out_path and show_logs:
+        self.P(f"Downloaded/descrypted in {download_elapsed_time:.1f}s/{decrypt_elapsed_time:.1f}s <{cid}> {os.path.basename(out_path)}")
       return out_path
 
+
+    @require_ipfs_started
+    def get_many(
+      self,
+      cids: list,
+      local_folder: str = None,
+      secret: str = None,
+      timeout: int = None,
+      pin: bool = True,
+      max_workers: int = None,
+      raise_on_error: bool = False,
+      show_logs: bool = True,
+    ) -> dict:
+      """
+      Retrieve several files from R1FS concurrently.
+
+      Each CID goes through `get_file`. The downloads overlap on a bounded thread
+      pool, so the daemon fetches of some files run while others are decrypted
+      (AES-GCM releases the GIL). The secret hash is memoized, so it is derived
+      once for the whole batch.
+
+      Parameters
+      ----------
+      cids : list[str]
+        Folder CIDs returned by `add_file`.
+
+      local_folder : str, optional
+        Parent folder of the per-CID download folders. Defaults to the downloads folder.
+
+      secret : str, optional
+        Passphrase used for every file, defaulting to 'ratio1'.
+
+      timeout : int, optional
+        Per-file download timeout in seconds.
+
+      pin : bool, optional
+        Pin every CID locally before downloading it. Default is True.
+
+      max_workers : int, optional
+        Number of concurrent downloads. Defaults to ``IPFSCt.GET_MANY_MAX_WORKERS``.
+
+      raise_on_error : bool, optional
+        If True, the first failed download raises. Otherwise its path is None. Default is False.
+
+      show_logs : bool, optional
+        Whether to show logs via self.P / self.Pd. Default is True.
+
+      Returns
+      -------
+      dict
+        CID -> path of the decrypted file (None for failed downloads when
+        `raise_on_error` is False).
+
+      Examples
+      --------
+      >>> paths = engine.get_many(["QmFolderA", "QmFolderB"])
+      >>> paths["QmFolderA"]
+      /app/downloads/QmFolderA/a.json
+      """
+      cids = list(dict.fromkeys(cids))
+      if not cids:
+        return {}
+      max_workers = max(1, min(max_workers or IPFSCt.GET_MANY_MAX_WORKERS, len(cids)))
+      start_time = time.time()
+      with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="r1fs_get") as executor:
+        futures = {
+          cid: executor.submit(
+            self.get_file,
+            cid=cid,
+            local_folder=local_folder,
+            secret=secret,
+            timeout=timeout,
+            pin=pin,
+            raise_on_error=raise_on_error,
+            show_logs=show_logs,
+          )
+          for cid in cids
+        }
+        results = {}
+        for cid, future in futures.items():
+          try:
+            results[cid] = future.result()
+          except Exception as e:
+            if raise_on_error:
+              raise
+            self.P(f"Error getting file {cid}: {e}", color='r')
+            results[cid] = None
+          #end try
+        #end for futures
+      #end with executor
+      if show_logs:
+        n_failed = sum(path is None for path in results.values())
+        self.P(
+          f"Downloaded {len(cids) - n_failed}/{len(cids)} files with {max_workers} workers "
+          f"in {time.time() - start_time:.2f}s"
+        )
+      return results
+
     @require_ipfs_started
     def get_pickle(
       self,
@@ -2794,8 +3728,8 @@ class R1FSEngine:
       
       # Load the JSON file
       try:
-        with open(file_path, "r", encoding="utf-8") as f:
-          data = json.load(f)
+        with open(file_path, "rb") as f:
+          data = _json_loads(f.read())
         
         if show_logs:
           self.Pd(f"Successfully loaded JSON data from {file_path}")
@@ -2820,19 +3754,16 @@ class R1FSEngine:
     @require_ipfs_started
     def list_pins(self):
       """
-      List pinned CIDs via 'ipfs pin ls --type=recursive'.
+      List pinned CIDs via the daemon 'pin/ls?type=recursive' RPC, falling back
+      to 'ipfs pin ls --type=recursive --quiet' when the RPC is not reachable.
       Returns a list of pinned CIDs.
       """
-      output = self.__run_command(["ipfs", "pin", "ls", "--type=recursive"])
-      pinned_cids = []
-      for line in output.split("\n"):
-        line = line.strip()
-        if not line:
-          continue
-        parts = line.split()
-        if len(parts) > 0:
-          pinned_cids.append(parts[0])
-      return pinned_cids
+      try:
+        data = self._rpc("pin/ls", params={"type": "recursive"})
+      except Exception as e:
+        self.Pd(f"pin/ls RPC failed, using the CLI: {e}")
+        return self.__run_command(["ipfs", "pin", "ls", "--type=recursive", "--quiet"]).split()
+      return list(data.get("Keys") or {})
     
     
     @require_ipfs_started
@@ -2850,10 +3781,9 @@ class R1FSEngine:
           The maximum time to wait for the CID to be found.
           
       """
-      CMD = ["ipfs", "block", "stat", cid]  
       result = True
       try:
-        res = self.__run_command(CMD, timeout=max_wait)
+        res = self._rpc("block/stat", params={"arg": cid, "timeout": f"{max_wait}s"}, timeout=max_wait)
         self.Pd(f"{cid} is available:\n{res}")
       except Exception as e:
         result = False
@@ -2885,12 +3815,12 @@ class R1FSEngine:
         >>>   print("File is pinned")
         """
         try:
-          output = self.__run_command(
-            ["ipfs", "pin", "ls", "--type=recursive", cid],
-            raise_on_error=False,
-            show_logs=False
-          )
-          is_pinned = cid in output
+          # the daemon answers with an error when the CID is not pinned
+          try:
+            data = self._rpc("pin/ls", params={"arg": cid, "type": "recursive"}, show_logs=False)
+          except Exception:
+            data = {}
+          is_pinned = cid in (data.get("Keys") or {})
           if show_logs:
             self.Pd(f"CID {cid} pinned: {is_pinned}")
           return is_pinned
@@ -2950,10 +3880,11 @@ class R1FSEngine:
 
         try:
           # First, unpin locally
-          result = self.__run_command(
+          self.__run_command(
             ["ipfs", "pin", "rm", cid],
             raise_on_error=raise_on_error,
-            show_logs=False
+            show_logs=False,
+            discard_output=True,
           )
 
           if show_logs:
@@ -2973,10 +3904,11 @@ class R1FSEngine:
         if unpin_remote and self.__ipfs_relay_api is not None:
           try:
             request_url = f"{self.__ipfs_relay_api}/api/v0/pin/rm?arg={cid}"
-            response = requests.post(
+            response = self.__rpc_session.post(
               request_url,
               auth=HTTPBasicAuth(self.__ipfs_api_key_username, self.__ipfs_api_key_password),
-              verify=self.__ipfs_certificate_path
+              verify=self.__ipfs_certificate_path,
+              timeout=IPFSCt.RELAY_PIN_TIMEOUT_SECONDS,
             )
 
             if response.status_code == 200:
@@ -3113,10 +4045,11 @@ class R1FSEngine:
             if show_logs:
               self.Pd("Running garbage collection...")
             try:
-              gc_result = self.__run_command(
+              self.__run_command(
                 ["ipfs", "repo", "gc"],
                 raise_on_error=False,
-                show_logs=False  # GC output can be very verbose
+                show_logs=False,  # GC output can be very verbose
+                discard_output=True,
               )
               if show_logs:
                 self.P(f"Deleted file {cid} and ran garbage collection", color='g')
@@ -3274,10 +4207,11 @@ class R1FSEngine:
           if show_logs:
             self.P("Running garbage collection for all deleted files...", color='m')
           try:
-            gc_result = self.__run_command(
+            self.__run_command(
               ["ipfs", "repo", "gc"],
               raise_on_error=False,
-              show_logs=False
+              show_logs=False,
+              discard_output=True,
             )
             if show_logs:
               self.Pd("Garbage collection completed")
@@ -3524,34 +4458,14 @@ class R1FSEngine:
         self.Pd(f"Secret hash (first 16 bytes): {key[:16].hex()}")
 
       # Create temporary encrypted file (same as in add_file)
-      tmp_cipher_path = os.path.join(tempfile.gettempdir(), uuid.uuid4().hex + ".bin")
+      tmp_cipher_path = os.path.join(tempfile.gettempdir(), secrets.token_hex(16) + ".bin")
 
       try:
-        # Encrypt the file content (same as in add_file)
-        encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce_bytes)).encryptor()
-
-        chunk_size = 1024 * 1024  # 1 MB chunks
-        with open(file_path, "rb") as fin, open(tmp_cipher_path, "wb") as fout:
-          # [nonce][4-byte-len][metadata][ciphertext][16-byte GCM tag]
-          fout.write(nonce_bytes)
-          meta_len = len(meta_bytes)
-          fout.write(meta_len.to_bytes(4, "big"))
-          # encrypt the metadata and save
-          enc_meta_data = encryptor.update(meta_bytes)
-          fout.write(enc_meta_data)
-
-          while True:
-            chunk = fin.read(chunk_size)
-            if not chunk:
-              break
-            fout.write(encryptor.update(chunk))
-          #end while there are still bytes to read
-          final_ct = encryptor.finalize()
-          fout.write(final_ct)
-          # Append 16-byte GCM tag
-          tag = encryptor.tag
-          fout.write(tag)
-        #end with fin, fout
+        # Encrypt the file content exactly as add_file does
+        with open(tmp_cipher_path, "wb") as fout:
+          for piece in self.__iter_encrypted_file(file_path, key, nonce_bytes, meta_bytes):
+            fout.write(piece)
+        #end with fout
 
         # Use IPFS to calculate the hash without adding the file
         output = self.__run_command(["ipfs", "add", "--only-hash", "-q", "-w", tmp_cipher_path], show_logs=show_logs)
@@ -3645,7 +4559,7 @@ class R1FSEngine:
         self.Pd(f"Calculating CID for JSON data with {len(json_data)} characters, filename: {fn}")
       
       # Create temporary file for JSON data with the desired filename in a unique directory
-      unique_dir = os.path.join(tempfile.gettempdir(), uuid.uuid4().hex)
+      unique_dir = os.path.join(tempfile.gettempdir(), secrets.token_hex(16))
       os.makedirs(unique_dir, exist_ok=True)
       tmp_json_path = os.path.join(unique_dir, fn)
       
@@ -3752,7 +4666,7 @@ class R1FSEngine:
         self.Pd(f"Calculating CID for pickle data with {len(pickle_data)} bytes, filename: {fn}")
       
       # Create temporary file for pickle data with the desired filename in a unique directory
-      unique_dir = os.path.join(tempfile.gettempdir(), uuid.uuid4().hex)
+      unique_dir = os.path.join(tempfile.gettempdir(), secrets.token_hex(16))
       os.makedirs(unique_dir, exist_ok=True)
       tmp_pickle_path = os.path.join(unique_dir, fn)
       
@@ -3799,27 +4713,32 @@ class R1FSEngine:
 
     def is_ipfs_daemon_running(
       self,
-      host="127.0.0.1",
-      port=5001,
+      host=None,
+      port=None,
       method="POST",
       timeout=3
     ) -> bool:
       """
       Checks if an IPFS daemon is running by calling /api/v0/version
-      on the specified host and port. Some configurations require
-      POST instead of GET, so we allow a method argument.
+      on the specified host and port (by default the RPC address of the repo).
+      Some configurations require POST instead of GET, so we allow a method argument.
 
       Returns:
           bool: True if the IPFS daemon responds successfully; False otherwise.
       """
-      url = f"http://{host}:{port}/api/v0/version"
+      if host is None and port is None:
+        url = f"{self.__rpc_api_url}/version"
+      else:
+        host = host or self.__rpc_host
+        port = port or self.__rpc_port
+        url = f"http://{f'[{host}]' if ':' in host else host}:{port}/api/v0/version"
       result = False
       output = None
       try:
         if method.upper() == "POST":
-          response = requests.post(url, timeout=timeout)
+          response = self.__rpc_session.post(url, timeout=timeout)
         else:
-          response = requests.get(url, timeout=timeout)
+          response = self.__rpc_session.get(url, timeout=timeout)
 
         if response.status_code == 200:
           data = response.json()
@@ -3838,18 +4757,88 @@ class R1FSEngine:
       self.P(f"IPFS daemon run-check: {result} ({output})")
       return result        
     
-    def is_ipfs_daemon_ready(self, max_wait=30, step=1):
-      """ Check with timeout if the IPFS daemon is running and ready to accept requests."""
-      waited = 0
-      while waited < max_wait:
-        if self.is_ipfs_daemon_running():
+    def __is_rpc_port_open(self, timeout=1):
+      """
+      TCP connect probe of the daemon RPC port (no HTTP request, no log line).
+
+      Parameters
+      ----------
+      timeout : float, optional
+          Connect timeout in seconds. Default is 1.
+
+      Returns
+      -------
+      bool
+          True if the RPC host accepted the connection, False on any socket error.
+      """
+      try:
+        with socket.create_connection((self.__rpc_host, self.__rpc_port), timeout=timeout):
           return True
-        time.sleep(step)
-        waited += step
-      return False    
+      except OSError:
+        return False
+
+    def is_ipfs_daemon_ready(self, max_wait=30, step=1):
+      """
+      Check with timeout if the IPFS daemon is running and ready to accept requests.
+
+      The RPC port is probed every `IPFSCt.DAEMON_PORT_PROBE_INTERVAL` seconds with a
+      cheap TCP connect; the version call of `is_ipfs_daemon_running` is only made
+      once the port accepts connections, at most every `step` seconds.
+      """
+      deadline = time.monotonic() + max_wait
+      last_check = None
+      while True:
+        now = time.monotonic()
+        if (last_check is None or now - last_check >= step) and self.__is_rpc_port_open(timeout=step):
+          last_check = now
+          if self.is_ipfs_daemon_running():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+          return False
+        time.sleep(min(IPFSCt.DAEMON_PORT_PROBE_INTERVAL, remaining))
+      #end while
     
+    def __resolve_rpc_address(self):
+      """
+      Read the daemon RPC address the way the `ipfs` CLI does.
+
+      The `$IPFS_PATH/api` file (written by a running daemon) is tried first, then
+      `Addresses.API` of the repo config. The RPC base URL and the readiness probe
+      host/port are derived from the first usable address; the Kubo default
+      `IPFSCt.RPC_API_URL` is kept when neither can be read.
+
+      Returns
+      -------
+      str
+          The RPC base URL (``http://<host>:<port>/api/v0``) now used by `_rpc`.
+      """
+      candidates = []
+      try:
+        with open(os.path.join(self.__ipfs_home, "api")) as f:
+          candidates.append(f.read())
+      except OSError:
+        pass
+      try:
+        with open(os.path.join(self.__ipfs_home, "config")) as f:
+          api_addrs = json.load(f).get("Addresses", {}).get("API")
+        candidates.extend(api_addrs if isinstance(api_addrs, list) else [api_addrs])
+      except (OSError, ValueError, AttributeError):
+        pass
+      for multiaddr in candidates:
+        address = _rpc_address_from_multiaddr(multiaddr)
+        if address is not None:
+          self.__rpc_host, self.__rpc_port = address
+          url_host = f"[{self.__rpc_host}]" if ":" in self.__rpc_host else self.__rpc_host
+          self.__rpc_api_url = f"http://{url_host}:{self.__rpc_port}/api/v0"
+          break
+      #end for
+      self.P(f"Kubo RPC endpoint: {self.__rpc_api_url}", color='d')
+      return self.__rpc_api_url
+
     def maybe_reset_ipfs(self):
       """ Reset the IPFS repository if needed, remove swarm key and ipfs home."""
+      self.__ipfs_id_cached = False
       
 
     def maybe_start_ipfs(
@@ -3927,7 +4916,7 @@ class R1FSEngine:
       if ipfs_api_key_username is None or ipfs_api_key_password is None:
         try:
           ipfs_api_key_base64 = os.getenv(IPFSCt.EE_IPFS_API_KEY_BASE64_KEY)
-          ipfs_api_key_b = base64.b64decode(ipfs_api_key_base64)
+          ipfs_api_key_b = b64decode(ipfs_api_key_base64)
           ipfs_api_key = str(ipfs_api_key_b, 'utf-8')
           split_api_key = ipfs_api_key.split(":")
           ipfs_api_key_username = split_api_key[0]
@@ -3968,6 +4957,7 @@ class R1FSEngine:
       
       self.__base64_swarm_key = base64_swarm_key
       self.__ipfs_relay = ipfs_relay
+      self.__ipfs_relay_peer_id = self.__get_relay_peer_id(ipfs_relay)
       self.__ipfs_relay_api = ipfs_relay_api
       self.__ipfs_api_key_username = ipfs_api_key_username
       self.__ipfs_api_key_password = ipfs_api_key_password
@@ -4007,7 +4997,7 @@ class R1FSEngine:
       
       # Write the swarm key at every start.
       try:
-        decoded_key = base64.b64decode(base64_swarm_key)
+        decoded_key = b64decode(base64_swarm_key)
         with open(swarm_key_path, "wb") as f:
           f.write(decoded_key)
         os.chmod(swarm_key_path, 0o600)
@@ -4030,6 +5020,8 @@ class R1FSEngine:
       if not self.__samehost_fix_enabled():
         self.__cleanup_samehost_relay_workaround()
 
+      self.__resolve_rpc_address()
+
       # Check if daemon is already running by attempting to get the node id.
       try:
         self.P("Trying to see if IPFS daemon is running...", color='d')
@@ -4051,14 +5043,8 @@ class R1FSEngine:
           ###################################################
           #######             CLEANUP PHASE            ######
           ###################################################                            
-          # we start by removing any existing bootstrap nodes
-          try:
-            self.P("Removing public IPFS bootstrap nodes...")
-            self.__run_command(["ipfs", "bootstrap", "rm", "--all"])
-          except Exception as e:
-            self.P(f"Error removing bootstrap nodes: {e}", color='r')
-               
-          # then delete the repository lock file if it exists
+          # the public bootstrap nodes are replaced by the relay in the config below
+          # delete the repository lock file if it exists
           lock_file = os.path.join(self.__ipfs_home, "repo.lock")
           if os.path.isfile(lock_file):
             self.P(f"Deleting lock file {lock_file}...")
@@ -4075,13 +5061,7 @@ class R1FSEngine:
           ###################################################
           #######        END OF CLEANUP PHASE        ########
           ###################################################
-          self.__set_reprovider_interval()
-          self.__set_reprovider_strategy()
-          self.__disable_auto_tls()
-          self.__set_routing_type()
-          self.__disable_ws_transport()
-          self.__disable_mdns_discovery()
-          self.__bootstrap_add(self.__ipfs_relay)
+          self.__apply_startup_config(config_path)
           ipfs_daemon_running = self.__start_daemon()
           if not ipfs_daemon_running:
             self.P("Failed to start IPFS daemon after multiple attempts.", color='r')
@@ -4119,8 +5099,8 @@ class R1FSEngine:
           msg += f"\n  IPFS Agent: {self.__ipfs_agent}"
           msg += f"\n  Relay:      {ipfs_relay}"
           self.P(msg, color='m')
-          result = self.__run_command(["ipfs", "swarm", "connect", ipfs_relay])
-          if "connect" in result.lower() and "success" in result.lower():
+          connected, _, errors = self.__swarm_connect(ipfs_relay, timeout=IPFSCt.TIMEOUT)
+          if connected:
             self.P(f"{my_id} connected to: {relay_ip}", color='g', boxed=True)
             self.__ipfs_started = True
             self.P("Re-checking swarm peers...")
@@ -4128,7 +5108,7 @@ class R1FSEngine:
             self.P(f"Swarm peers:\n {json.dumps(swarm_peers, indent=2)}")
             self._check_and_record_relay_connection(debug=True)
           else:
-            self.P("Relay connection result did not indicate success.", color='r')
+            self.P(f"Relay connection result did not indicate success: {errors}", color='r')
         # endif ipfs not started
 
         if self.__ipfs_started and self.__maybe_apply_samehost_relay_workaround():
@@ -4155,10 +5135,9 @@ class R1FSEngine:
   def __decode_base64_gzip_to_text(self, encoded_str):
     try:
       # Step 1: Decode base64
-      compressed_data = base64.b64decode(encoded_str)
-      # Step 2: Decompress gzip
-      with gzip.GzipFile(fileobj=BytesIO(compressed_data)) as f:
-        decompressed_data = f.read()
+      compressed_data = b64decode(encoded_str)
+      # Step 2: Decompress gzip (one call, no file object wrappers)
+      decompressed_data = gzip.decompress(compressed_data)
       # Step 3: Convert bytes to string
       return decompressed_data.decode('utf-8')
     except Exception as e:
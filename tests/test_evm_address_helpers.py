@@ -0,0 +1,126 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from cryptography.hazmat.primitives.asymmetric import ec
+from eth_utils import keccak, to_checksum_address
+
+from ratio1.bc.evm import _EVMMixin, _checksum_hex_address, _is_valid_evm_address_cached
+
+
+class _DummyEngine(_EVMMixin):
+  pass
+
+
+def _reference_eth_address(public_key):
+  numbers = public_key.public_numbers()
+  raw = numbers.x.to_bytes(32, "big") + numbers.y.to_bytes(32, "big")
+  return to_checksum_address("0x" + keccak(raw)[-20:].hex())
+
+
+class TestEvmAddressValidation(unittest.TestCase):
+
+  def test_is_valid_evm_address_accepts_mixed_case_hex(self):
+    self.assertTrue(_EVMMixin.is_valid_evm_address("0x" + "aB" * 20))
+    self.assertTrue(_EVMMixin.is_valid_eth_address("0x" + "01" * 20))
+
+  def test_is_valid_evm_address_rejects_malformed_inputs(self):
+    invalid = [
+      None,
+      ["0x" + "ab" * 20],
+      "ab" * 21,
+      "0x" + "ab" * 19,
+      "0x" + "zz" * 20,
+      "0x" + "ab " * 13 + "a",
+      "0x" + "ab" * 19 + " a",
+    ]
+    for address in invalid:
+      with self.subTest(address=address):
+        self.assertFalse(_EVMMixin.is_valid_evm_address(address))
+
+  def test_is_valid_evm_address_is_memoized(self):
+    address = "0x" + "cd" * 20
+    _EVMMixin.is_valid_evm_address(address)
+    hits = _is_valid_evm_address_cached.cache_info().hits
+    _EVMMixin.is_valid_evm_address(address)
+    self.assertEqual(_is_valid_evm_address_cached.cache_info().hits, hits + 1)
+
+  def test_checksum_hex_address_matches_eth_utils(self):
+    for seed in range(32):
+      addr_hex = keccak(seed.to_bytes(4, "big"))[-20:].hex()
+      with self.subTest(addr_hex=addr_hex):
+        self.assertEqual(_checksum_hex_address(addr_hex), to_checksum_address("0x" + addr_hex))
+
+
+class TestNodeAddressToEthAddress(unittest.TestCase):
+
+  def setUp(self):
+    self.engine = _DummyEngine()
+    self.public_key = ec.derive_private_key(12345, ec.SECP256K1()).public_key()
+    self.engine._address_to_pk = mock.Mock(return_value=self.public_key)
+
+  def test_node_address_to_eth_address_matches_reference(self):
+    result = self.engine.node_address_to_eth_address("0xai_node")
+    self.assertEqual(result, _reference_eth_address(self.public_key))
+
+  def test_node_address_to_eth_address_is_memoized_per_address(self):
+    first = self.engine.node_address_to_eth_address("0xai_node")
+    second = self.engine.node_address_to_eth_address("0xai_node")
+    self.assertEqual(first, second)
+    self.engine._address_to_pk.assert_called_once_with("0xai_node")
+
+  def test_node_address_to_eth_bytes_returns_raw_address(self):
+    raw = self.engine.node_address_to_eth_bytes("0xai_node")
+    self.assertEqual(len(raw), 20)
+    self.assertEqual("0x" + raw.hex(), _reference_eth_address(self.public_key).lower())
+    self.engine.node_address_to_eth_address("0xai_node")
+    self.engine._address_to_pk.assert_called_once_with("0xai_node")
+
+  def test_is_node_address_in_eth_addresses_matches_exactly(self):
+    eth_address = _reference_eth_address(self.public_key)
+    others = ["0x" + "12" * 20]
+    self.assertTrue(self.engine.is_node_address_in_eth_addresses("0xai_node", others + [eth_address]))
+    self.assertTrue(self.engine.is_node_address_in_eth_addresses("0xai_node", set(others + [eth_address])))
+    self.assertTrue(self.engine.is_node_address_in_eth_addresses(
+      "0xai_node", _EVMMixin.eth_addresses_to_set(others + [eth_address])
+    ))
+    self.assertFalse(self.engine.is_node_address_in_eth_addresses("0xai_node", others))
+
+  def test_is_node_address_in_eth_addresses_is_case_sensitive_like_a_list(self):
+    eth_address = _reference_eth_address(self.public_key)
+    self.assertNotEqual(eth_address, eth_address.lower()) # checksum form is mixed-case
+    for lst in ([eth_address.lower()], [eth_address.upper()]):
+      self.assertEqual(
+        self.engine.is_node_address_in_eth_addresses("0xai_node", lst),
+        self.engine.node_address_to_eth_address("0xai_node") in lst,
+      )
+      self.assertFalse(self.engine.is_node_address_in_eth_addresses("0xai_node", lst))
+      self.assertFalse(self.engine.is_node_address_in_eth_addresses("0xai_node", _EVMMixin.eth_addresses_to_set(lst)))
+
+  def test_node_addresses_to_eth_addresses_uses_pool_for_large_batches(self):
+    keys = {
+      "0xai_{}".format(i): ec.derive_private_key(1000 + i, ec.SECP256K1()).public_key()
+      for i in range(4)
+    }
+    self.engine._address_to_pk = mock.Mock(side_effect=lambda addr: keys[addr])
+    nodes = ["0xai_2", "0xai_0", "0xai_2", "0xai_1", "0xai_3"]
+    with ThreadPoolExecutor(max_workers=2) as pool, \
+         mock.patch("ratio1.bc.evm.EVM_CRYPTO_POOL_MIN_BATCH", 2), \
+         mock.patch("ratio1.bc.evm._get_crypto_pool", return_value=pool) as get_pool:
+      result = self.engine.node_addresses_to_eth_addresses(nodes)
+    get_pool.assert_called_once()
+    self.assertEqual(result, [_reference_eth_address(keys[node]) for node in nodes])
+    self.assertEqual(self.engine._address_to_pk.call_count, 4)
+
+  def test_are_node_addresses_in_eth_addresses_matches_single_check(self):
+    eth_address = _reference_eth_address(self.public_key)
+    with mock.patch("ratio1.bc.evm._get_crypto_pool") as get_pool:
+      result = self.engine.are_node_addresses_in_eth_addresses(["0xai_node"], [eth_address])
+      mixed_case = self.engine.are_node_addresses_in_eth_addresses(["0xai_node"], [eth_address.lower()])
+    get_pool.assert_not_called()
+    self.assertEqual(result, [True])
+    self.assertEqual(mixed_case, [False])
+
+
+if __name__ == "__main__":
+  unittest.main()
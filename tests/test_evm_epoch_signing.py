@@ -1,7 +1,9 @@
 import unittest
 from unittest import mock
 
-from ratio1.bc.evm import _EVMMixin
+from web3 import Web3
+
+from ratio1.bc.evm import _EVMMixin, _solidity_keccak
 from ratio1.const.base import ETHVarTypes
 
 
@@ -80,5 +82,90 @@ class TestEthNodeEpochSigning(unittest.TestCase):
       )
 
 
+  def test_pack_epoch_availabilities_matches_for_lists_and_arrays(self):
+    import numpy as np
+
+    self.assertEqual(self.engine.pack_epoch_availabilities([1, 2, 255]), "0x0102ff")
+    self.assertEqual(self.engine.pack_epoch_availabilities((0, 16)), "0x0010")
+    self.assertEqual(self.engine.pack_epoch_availabilities(np.array([1, 2, 3], dtype=np.int64)), "0x010203")
+    self.assertEqual(self.engine.pack_epoch_availabilities(["7", 8]), "0x0708")
+
+  def test_pack_epoch_availabilities_rejects_negative_byte(self):
+    with self.assertRaisesRegex(ValueError, "Invalid epoch availability value: -1"):
+      self.engine.pack_epoch_availabilities([1, -1])
+
+
+class TestEthSignMessage(unittest.TestCase):
+
+  def setUp(self):
+    from eth_account import Account
+
+    self.account = Account.from_key("0x" + "42" * 32)
+    self.engine = _DummyEngine()
+    self.engine.eth_account = self.account
+    self.engine.eth_address = self.account.address
+
+  def test_eth_sign_message_matches_raw_key_signature(self):
+    from eth_account import Account
+    from eth_account.messages import encode_defunct
+
+    result = self.engine.eth_sign_message(["string", "uint256"], ["node", 7])
+    expected = Account.sign_message(
+      encode_defunct(primitive=_solidity_keccak(["string", "uint256"], ["node", 7])),
+      private_key=self.account.key,
+    )
+    self.assertEqual(result["signature"], "0x" + expected.signature.hex().removeprefix("0x"))
+    self.assertEqual(result["sender"], self.account.address)
+    self.assertEqual(
+      self.engine.eth_verify_message_signature(["node", 7], ["string", "uint256"], result["signature"]),
+      self.account.address,
+    )
+
+  def test_eth_sign_message_accepts_account_without_parsed_key(self):
+    self.engine.eth_account = mock.Mock(spec=["key"], key=self.account.key)
+    result = self.engine.eth_sign_message(["string"], ["hello"])
+    self.assertEqual(
+      self.engine.eth_verify_message_signature(["hello"], ["string"], result["signature"]),
+      self.account.address,
+    )
+
+  def test_signing_key_is_built_once_per_account(self):
+    from eth_account import Account
+
+    signing_key = self.engine._get_eth_signing_key()
+    self.assertIs(self.engine._get_eth_signing_key(), signing_key)
+    self.assertEqual(signing_key.to_bytes(), bytes(self.account.key))
+
+    other = Account.from_key("0x" + "43" * 32)
+    self.engine.eth_account = other
+    self.assertEqual(self.engine._get_eth_signing_key().to_bytes(), bytes(other.key))
+
+
+class TestSolidityKeccak(unittest.TestCase):
+
+  def test_specialized_signatures_match_web3(self):
+    node = Web3.to_checksum_address("0x" + "ab" * 20)
+    cases = [
+      (["string"], ["hello-world"]),
+      (["string"], ["h\u00e9llo \u2713"]),
+      (["address", "uint256", "uint256", "bytes"], [node, 245, 247, "0x0102ff"]),
+      (["address", "uint256", "uint256", "bytes"], [node, 0, 2 ** 256 - 1, b"\x00\xff"]),
+      (["string", "uint256", "uint256", "bytes"], ["0xai_node", 1, 2, "0x"]),
+      (["address", "uint256[]", "uint256[]"], [node, [1, 2, 3], [4, 5, 6]]),
+    ]
+    for types, values in cases:
+      with self.subTest(types=types, values=values):
+        self.assertEqual(_solidity_keccak(types, values), Web3.solidity_keccak(types, values))
+
+  def test_unhandled_values_fall_back_to_web3(self):
+    self.assertEqual(
+      _solidity_keccak(["bool", "uint8"], [True, 7]),
+      Web3.solidity_keccak(["bool", "uint8"], [True, 7]),
+    )
+    with self.assertRaises(Exception):
+      # web3 rejects non-checksum addresses, the fast path must not accept them
+      _solidity_keccak(["address"], ["0x" + "ab" * 20])
+
+
 if __name__ == "__main__":
   unittest.main()
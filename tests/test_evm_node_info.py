@@ -0,0 +1,359 @@
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from eth_abi import encode as abi_encode
+from eth_utils import to_checksum_address
+from web3 import Web3
+
+from ratio1.bc import evm
+from ratio1.bc.evm import (
+  MULTICALL3_ADDRESS,
+  NodeLicenseDetails,
+  _EVMMixin,
+  _NODE_LICENSE_DETAILS_TYPE,
+  _encode_node_license_details_call,
+)
+from ratio1.const.base import EVM_ABI_DATA
+
+
+NODE = "0x" + "ab" * 20
+OWNER = "0x" + "cd" * 20
+ZERO = "0x" + "00" * 20
+
+
+def _license_tuple(owner=OWNER, node=NODE, is_banned=False):
+  return (1, 42, owner, node, 100, 10, 245, 1700000000, "0x" + "ef" * 20, is_banned, 7, 8)
+
+
+def _encoded(result):
+  return abi_encode([_NODE_LICENSE_DETAILS_TYPE], [result])
+
+
+class _DummyEngine(_EVMMixin):
+  def __init__(self):
+    self.messages = []
+
+  def P(self, message, **kwargs):
+    self.messages.append(message)
+
+
+class TestNodeLicenseCodec(unittest.TestCase):
+
+  def test_output_type_matches_proxy_abi(self):
+    abi = next(item for item in EVM_ABI_DATA.PROXY_ABI if item.get("name") == "getNodeLicenseDetails")
+    types = [component["type"] for component in abi["outputs"][0]["components"]]
+    self.assertEqual(_NODE_LICENSE_DETAILS_TYPE, "({})".format(",".join(types)))
+
+  def test_calldata_matches_web3_encoding(self):
+    contract = Web3().eth.contract(address="0x" + "22" * 20, abi=EVM_ABI_DATA.PROXY_ABI)
+    expected = contract.encode_abi("getNodeLicenseDetails", args=[to_checksum_address(NODE)])
+    self.assertEqual("0x" + _encode_node_license_details_call(NODE).hex(), expected)
+    self.assertEqual(_encode_node_license_details_call(NODE.upper().replace("0X", "0x")), bytes.fromhex(expected[2:]))
+
+  def test_prebuilt_decoder_matches_eth_abi_decode(self):
+    from eth_abi import decode as abi_decode
+    from eth_abi.exceptions import InsufficientDataBytes
+
+    raw = _encoded(_license_tuple(is_banned=True))
+    expected = list(abi_decode([_NODE_LICENSE_DETAILS_TYPE], raw)[0])
+    for idx in (2, 3, 8):
+      expected[idx] = to_checksum_address(expected[idx])
+    self.assertEqual(evm._decode_node_license_details(raw), expected)
+    with self.assertRaises(InsufficientDataBytes):
+      evm._decode_node_license_details(b"")
+
+  def test_decoded_addresses_are_checksummed_once(self):
+    with mock.patch("ratio1.bc.evm._checksum_hex_address", wraps=evm._checksum_hex_address) as checksum:
+      evm._checksum_decoded_address.cache_clear()
+      first = evm._decode_node_license_details(_encoded(_license_tuple()))
+      second = evm._decode_node_license_details(_encoded(_license_tuple()))
+    self.assertEqual(first, second)
+    self.assertEqual(first[2], to_checksum_address(OWNER))
+    self.assertEqual(first[8], to_checksum_address("0x" + "ef" * 20))
+    self.assertEqual(checksum.call_count, 3)
+
+
+class TestWeb3GetNodeInfo(unittest.TestCase):
+
+  def setUp(self):
+    self.engine = _DummyEngine()
+    self.web3 = mock.MagicMock()
+    self.web3_vars = SimpleNamespace(
+      w3=self.web3,
+      rpc_url="http://rpc.local",
+      network="devnet",
+      proxy_contract_address="0x" + "22" * 20,
+    )
+    self.engine._get_web3_vars = mock.Mock(return_value=self.web3_vars)
+    self.eth_call = self.web3.eth.call
+
+  def test_node_info_uses_raw_eth_call(self):
+    self.eth_call.return_value = _encoded(_license_tuple())
+    self.engine.web3_get_node_info(NODE)
+    self.eth_call.assert_called_once_with({
+      "to": self.web3_vars.proxy_contract_address,
+      "data": _encode_node_license_details_call(NODE),
+    })
+    self.web3.eth.contract.assert_not_called()
+
+  def test_node_info_unpacks_license_details(self):
+    self.eth_call.return_value = _encoded(_license_tuple())
+    details = self.engine.web3_get_node_info(NODE)
+    self.assertEqual(details["network"], "devnet")
+    self.assertEqual(details["licenseId"], 42)
+    # eth_abi decodes lowercase addresses, the results must carry the web3 checksum form
+    self.assertEqual(details["owner"], to_checksum_address(OWNER))
+    self.assertEqual(details["nodeAddress"], to_checksum_address(NODE))
+    self.assertEqual(details["lastClaimOracle"], to_checksum_address("0x" + "ef" * 20))
+    self.assertEqual(details["lastClaimEpoch"], 245)
+    self.assertTrue(details["isValid"])
+
+  def test_node_info_keeps_dict_layout_and_offers_named_tuple(self):
+    self.eth_call.return_value = _encoded(_license_tuple())
+    details = self.engine.web3_get_node_info(NODE)
+    self.assertEqual(list(details), [
+      "network", "licenseType", "licenseId", "owner", "nodeAddress", "totalAssignedAmount",
+      "totalClaimedAmount", "lastClaimEpoch", "assignTimestamp", "lastClaimOracle", "isBanned", "isValid",
+    ])
+    raw = self.engine.web3_get_node_info(NODE, as_dict=False)
+    self.assertIsInstance(raw, NodeLicenseDetails)
+    self.assertEqual(raw._asdict(), details)
+    self.assertTrue(raw.isValid)
+
+  def test_node_info_skips_log_formatting_when_not_verbose(self):
+    self.eth_call.return_value = _encoded(_license_tuple())
+    self.engine.is_verbose = mock.Mock(return_value=False)
+    with mock.patch("ratio1.bc.evm.json.dumps") as dumps:
+      self.engine.web3_get_node_info(NODE)
+    dumps.assert_not_called()
+    self.assertEqual(self.engine.messages, [])
+
+  def test_node_info_flags_invalid_licenses(self):
+    for result in [_license_tuple(owner=ZERO), _license_tuple(node=ZERO), _license_tuple(is_banned=True)]:
+      with self.subTest(result=result):
+        self.eth_call.return_value = _encoded(result)
+        self.assertFalse(self.engine.web3_get_node_info(NODE, cache=False)["isValid"])
+        with self.assertRaises(Exception):
+          self.engine.web3_get_node_info(NODE, raise_if_issue=True)
+
+  def test_node_info_rejects_unusable_addresses_without_rpc(self):
+    details = self.engine.web3_get_node_info(ZERO, as_dict=False)
+    self.assertFalse(details.isValid)
+    self.assertEqual(details.owner, ZERO)
+    with self.assertRaises(Exception):
+      self.engine.web3_get_node_info(ZERO, raise_if_issue=True)
+    with self.assertRaises(AssertionError):
+      self.engine.web3_get_node_info("0x" + "zz" * 20)
+    self.eth_call.assert_not_called()
+
+  def test_is_node_license_valid_returns_only_the_flag(self):
+    self.eth_call.return_value = _encoded(_license_tuple(is_banned=True))
+    self.assertIs(self.engine.web3_is_node_license_valid(NODE), False)
+    self.eth_call.return_value = _encoded(_license_tuple())
+    self.assertIs(self.engine.web3_is_node_license_valid(NODE, cache=True), False)
+    self.assertIs(self.engine.web3_is_node_license_valid(NODE), True)
+    self.assertIs(self.engine.web3_is_node_license_valid(ZERO), False)
+    self.assertEqual(self.eth_call.call_count, 2)
+
+  def test_node_info_is_cached_for_a_short_ttl(self):
+    self.eth_call.return_value = _encoded(_license_tuple())
+    with mock.patch("ratio1.bc.evm.time.monotonic", return_value=1000.0):
+      first = self.engine.web3_get_node_info(NODE, cache=True)
+      first["isValid"] = "mutated by caller"
+      second = self.engine.web3_get_node_info(NODE.upper().replace("0X", "0x"), cache=True)
+    self.assertEqual(self.eth_call.call_count, 1)
+    self.assertTrue(second["isValid"])
+
+    with mock.patch("ratio1.bc.evm.time.monotonic", return_value=1000.0 + evm.NODE_INFO_CACHE_TTL):
+      self.engine.web3_get_node_info(NODE, cache=True)
+    self.assertEqual(self.eth_call.call_count, 2)
+
+  def test_node_info_cache_is_opt_in(self):
+    self.eth_call.return_value = _encoded(_license_tuple())
+    self.engine.web3_get_node_info(NODE, cache=True)
+    self.eth_call.return_value = _encoded(_license_tuple(is_banned=True))
+    self.assertFalse(self.engine.web3_get_node_info(NODE)["isValid"])
+    # the fresh read refreshed the cache as well
+    self.assertFalse(self.engine.web3_get_node_info(NODE, cache=True)["isValid"])
+    self.assertEqual(self.eth_call.call_count, 2)
+
+  def test_node_info_cache_is_bounded(self):
+    self.eth_call.return_value = _encoded(_license_tuple())
+    nodes = ["0x" + "{:040x}".format(i + 1) for i in range(5)]
+    with mock.patch("ratio1.bc.evm.NODE_INFO_CACHE_MAXSIZE", 3):
+      for node in nodes:
+        self.engine.web3_get_node_info(node)
+    self.assertEqual(len(self.engine._node_info_cache), 3)
+    self.assertNotIn(("devnet", nodes[0]), self.engine._node_info_cache)
+    self.assertIn(("devnet", nodes[-1]), self.engine._node_info_cache)
+
+
+class TestWeb3GetNodesInfo(unittest.TestCase):
+
+  def setUp(self):
+    self.engine = _DummyEngine()
+    self.web3 = mock.MagicMock()
+    self.multicall = mock.MagicMock()
+    self.web3.eth.contract.side_effect = (
+      lambda address, abi: self.multicall if address == MULTICALL3_ADDRESS else mock.MagicMock()
+    )
+    self.web3_vars = SimpleNamespace(
+      w3=self.web3,
+      rpc_url="http://rpc.local",
+      network="devnet",
+      proxy_contract_address="0x" + "22" * 20,
+    )
+    self.engine._get_web3_vars = mock.Mock(return_value=self.web3_vars)
+    self.aggregate3 = self.multicall.functions.aggregate3
+
+  def test_nodes_info_matches_single_lookup_shape(self):
+    self.aggregate3.return_value.call.return_value = [
+      (True, _encoded(_license_tuple())),
+      (False, b""),
+      (True, _encoded(_license_tuple(node=ZERO))),
+    ]
+    nodes = [NODE, "0x" + "01" * 20, "0x" + "02" * 20]
+    result = self.engine.web3_get_nodes_info(nodes)
+
+    self.assertEqual(len(result), 3)
+    self.assertIsNone(result[1])
+    self.assertEqual(result[0]["owner"], to_checksum_address(OWNER))
+    self.assertEqual(result[0]["nodeAddress"], to_checksum_address(NODE))
+    self.assertEqual(result[0]["licenseId"], 42)
+    self.assertTrue(result[0]["isValid"])
+    self.assertFalse(result[2]["isValid"])
+    calls = self.aggregate3.call_args.args[0]
+    self.assertEqual(
+      calls[0], (self.web3_vars.proxy_contract_address, True, _encode_node_license_details_call(NODE))
+    )
+
+  def test_nodes_info_splits_into_chunks(self):
+    self.aggregate3.return_value.call.side_effect = lambda: [
+      (True, _encoded(_license_tuple()))
+    ] * len(self.aggregate3.call_args.args[0])
+    nodes = ["0x" + "{:040x}".format(i + 1) for i in range(5)]
+    result = self.engine.web3_get_nodes_info(nodes, chunk_size=2)
+    self.assertEqual(len(result), 5)
+    self.assertEqual([len(c.args[0]) for c in self.aggregate3.call_args_list], [2, 2, 1])
+
+  def test_nodes_info_only_queries_uncached_nodes(self):
+    self.aggregate3.return_value.call.side_effect = lambda: [
+      (True, _encoded(_license_tuple()))
+    ] * len(self.aggregate3.call_args.args[0])
+    nodes = ["0x" + "{:040x}".format(i + 1) for i in range(4)]
+    self.engine.web3_get_nodes_info(nodes[:2])
+    result = self.engine.web3_get_nodes_info(nodes, cache=True)
+    self.assertEqual(len(result), 4)
+    self.assertEqual([len(c.args[0]) for c in self.aggregate3.call_args_list], [2, 2])
+    self.engine.web3_get_nodes_info(nodes, cache=True)
+    self.assertEqual(self.aggregate3.call_count, 2)
+    self.engine.web3_get_nodes_info(nodes)
+    self.assertEqual(len(self.aggregate3.call_args.args[0]), 4)
+
+  def test_node_info_cache_is_thread_safe(self):
+    nodes = ["0x" + "{:040x}".format(i + 1) for i in range(64)]
+    details = self.engine._unlicensed_node_details("devnet")
+    errors = []
+
+    def worker(offset):
+      try:
+        for i in range(500):
+          node = nodes[(offset + i) % len(nodes)]
+          self.engine._set_cached_node_license("devnet", node, details)
+          self.engine._get_cached_node_license("devnet", node)
+      except Exception as exc:
+        errors.append(exc)
+
+    with mock.patch("ratio1.bc.evm.NODE_INFO_CACHE_MAXSIZE", 8):
+      threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+      for thread in threads:
+        thread.start()
+      for thread in threads:
+        thread.join()
+    self.assertEqual(errors, [])
+    self.assertLessEqual(len(self.engine._node_info_cache), 8)
+
+  def test_nodes_info_answers_zero_address_locally(self):
+    self.aggregate3.return_value.call.return_value = [(True, _encoded(_license_tuple()))]
+    result = self.engine.web3_get_nodes_info([ZERO, NODE])
+    self.assertFalse(result[0]["isValid"])
+    self.assertTrue(result[1]["isValid"])
+    self.assertEqual(len(self.aggregate3.call_args.args[0]), 1)
+
+  def test_nodes_info_rejects_invalid_address(self):
+    with self.assertRaises(AssertionError):
+      self.engine.web3_get_nodes_info([NODE, "0x1234"])
+    self.aggregate3.assert_not_called()
+
+  def test_nodes_info_falls_back_to_json_rpc_batches(self):
+    self.aggregate3.return_value.call.side_effect = ValueError("no multicall contract")
+    batch = self.web3.batch_requests.return_value.__enter__.return_value
+    batch.execute.side_effect = [[_encoded(_license_tuple())] * 2, [_encoded(_license_tuple())]]
+    nodes = ["0x" + "{:040x}".format(i + 1) for i in range(3)]
+    with mock.patch("ratio1.bc.evm.JSON_RPC_BATCH_CHUNK_SIZE", 2):
+      result = self.engine.web3_get_nodes_info(nodes)
+    self.assertEqual([details["licenseId"] for details in result], [42] * 3)
+    self.assertEqual(batch.execute.call_count, 2)
+    self.assertEqual(
+      [c.args[0]["data"] for c in self.web3.eth.call.call_args_list],
+      [_encode_node_license_details_call(node) for node in nodes],
+    )
+
+  def test_nodes_info_batch_rejection_falls_back_to_sequential_calls(self):
+    self.web3.batch_requests.side_effect = ValueError("batch requests are not supported")
+    self.web3.eth.call.side_effect = [_encoded(_license_tuple()), ValueError("execution reverted")]
+    result = self.engine.web3_get_nodes_info([NODE, "0x" + "01" * 20], use_multicall=False)
+    self.aggregate3.assert_not_called()
+    self.assertEqual(result[0]["licenseId"], 42)
+    self.assertIsNone(result[1])
+
+
+class TestWeb3GetNodeInfoAsync(unittest.TestCase):
+
+  def setUp(self):
+    self.engine = _DummyEngine()
+    self.web3_vars = SimpleNamespace(
+      w3=mock.MagicMock(),
+      rpc_url="http://rpc.local",
+      network="devnet",
+      proxy_contract_address="0x" + "22" * 20,
+    )
+    self.engine._get_web3_vars = mock.Mock(return_value=self.web3_vars)
+    self.async_w3 = mock.MagicMock()
+    patcher = mock.patch("ratio1.bc.evm._get_shared_async_web3", return_value=self.async_w3)
+    self.get_async_web3 = patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def test_async_node_info_matches_sync_shape(self):
+    self.async_w3.eth.call = mock.AsyncMock(return_value=_encoded(_license_tuple(is_banned=True)))
+    details = asyncio.run(self.engine.web3_get_node_info_async(NODE))
+    self.assertEqual(details["licenseId"], 42)
+    self.assertEqual(details["owner"], to_checksum_address(OWNER))
+    self.assertFalse(details["isValid"])
+    with self.assertRaises(Exception):
+      asyncio.run(self.engine.web3_get_node_info_async(NODE, raise_if_issue=True))
+    self.get_async_web3.assert_called_with(self.web3_vars.rpc_url)
+
+  def test_async_nodes_info_bounds_concurrency(self):
+    state = {"in_flight": 0, "peak": 0}
+
+    async def _call(tx):
+      state["in_flight"] += 1
+      state["peak"] = max(state["peak"], state["in_flight"])
+      await asyncio.sleep(0)
+      state["in_flight"] -= 1
+      return _encoded(_license_tuple())
+
+    self.async_w3.eth.call = _call
+    nodes = ["0x" + "{:040x}".format(i + 1) for i in range(10)]
+    result = asyncio.run(self.engine.web3_get_nodes_info_async(nodes, max_concurrency=3))
+    self.assertEqual(len(result), 10)
+    self.assertTrue(all(details["isValid"] for details in result))
+    self.assertEqual(state["peak"], 3)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,217 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from ratio1.bc import evm
+from ratio1.bc.evm import WEB3_HTTP_TIMEOUT, _EVMMixin, _get_shared_web3_session, _new_web3
+from ratio1.const.base import EVM_ABI_DATA
+
+
+class _DummyEngine(_EVMMixin):
+  def __init__(self):
+    self.messages = []
+
+  def P(self, message, **kwargs):
+    self.messages.append(message)
+
+
+class TestEvmContractCache(unittest.TestCase):
+
+  def setUp(self):
+    self.engine = _DummyEngine()
+    self.web3 = mock.Mock()
+    self.web3_vars = SimpleNamespace(
+      w3=self.web3,
+      rpc_url="http://rpc.local",
+      network="devnet",
+      controller_contract_address="0x" + "11" * 20,
+    )
+    self.engine._get_web3_vars = mock.Mock(return_value=self.web3_vars)
+
+  def test_get_contract_builds_each_contract_once(self):
+    first = self.engine._get_contract(
+      self.web3_vars,
+      address=self.web3_vars.controller_contract_address,
+      abi=EVM_ABI_DATA.CONTROLLER_ABI,
+    )
+    second = self.engine._get_contract(
+      self.web3_vars,
+      address=self.web3_vars.controller_contract_address,
+      abi=EVM_ABI_DATA.CONTROLLER_ABI,
+    )
+    self.assertIs(first, second)
+    self.web3.eth.contract.assert_called_once_with(
+      address=self.web3_vars.controller_contract_address,
+      abi=EVM_ABI_DATA.CONTROLLER_ABI,
+    )
+
+  def test_get_contract_keys_on_abi(self):
+    self.engine._get_contract(
+      self.web3_vars, address=self.web3_vars.controller_contract_address, abi=EVM_ABI_DATA.CONTROLLER_ABI,
+    )
+    self.engine._get_contract(
+      self.web3_vars, address=self.web3_vars.controller_contract_address, abi=EVM_ABI_DATA.ERC20_ABI,
+    )
+    self.assertEqual(self.web3.eth.contract.call_count, 2)
+
+  def test_web3_calls_reuse_cached_contract(self):
+    self.web3.eth.contract.return_value.functions.getOracles.return_value.call.return_value = ["0xabc"]
+    self.assertEqual(self.engine.web3_get_oracles(), ["0xabc"])
+    self.assertEqual(self.engine.web3_get_oracles(), ["0xabc"])
+    self.web3.eth.contract.assert_called_once()
+
+
+
+class TestEvmBatchRequests(unittest.TestCase):
+
+  def setUp(self):
+    self.engine = _DummyEngine()
+    self.web3 = mock.MagicMock()
+    self.web3_vars = SimpleNamespace(w3=self.web3, rpc_url="http://rpc.local", network="devnet")
+
+  def test_batch_requests_returns_results_in_order(self):
+    batch = self.web3.batch_requests.return_value.__enter__.return_value
+    batch.execute.return_value = [1, 2]
+
+    result = self.engine._web3_batch_requests(self.web3_vars, [lambda: "a", lambda: "b"])
+
+    self.assertEqual(result, [1, 2])
+    batch.add.assert_has_calls([mock.call("a"), mock.call("b")])
+
+  def test_batch_requests_returns_none_on_failure(self):
+    self.web3.batch_requests.side_effect = Exception("batching unsupported")
+
+    result = self.engine._web3_batch_requests(self.web3_vars, [lambda: "a"])
+
+    self.assertIsNone(result)
+
+  def test_send_r1_checks_balance_before_batching(self):
+    token_contract = mock.Mock()
+    token_contract.functions.balanceOf.return_value.call.return_value = 5
+    self.engine.eth_address = "0x" + "22" * 20
+    self.engine._get_web3_vars = mock.Mock(return_value=SimpleNamespace(
+      w3=self.web3, network="devnet", r1_contract_address="0x" + "11" * 20,
+    ))
+    self.engine._get_contract = mock.Mock(return_value=token_contract)
+    self.engine._get_token_decimals = mock.Mock(return_value=0)
+    self.engine._web3_batch_requests = mock.Mock()
+
+    self.assertIsNone(self.engine.web3_send_r1("0x" + "33" * 20, 10))
+
+    self.engine._web3_batch_requests.assert_not_called()
+    self.assertIn("Insufficient funds", self.engine.messages[-1])
+
+
+class TestEvmNetworkConstantsCache(unittest.TestCase):
+
+  def setUp(self):
+    self.engine = _DummyEngine()
+    self.web3 = mock.Mock()
+    self.token_contract = mock.Mock()
+    self.token_contract.address = "0x" + "11" * 20
+    self.web3.eth.contract.return_value = self.token_contract
+    self.web3_vars = SimpleNamespace(
+      w3=self.web3,
+      rpc_url="http://rpc.local",
+      network="devnet",
+      r1_contract_address=self.token_contract.address,
+    )
+    self.engine._get_web3_vars = mock.Mock(return_value=self.web3_vars)
+
+  def test_get_balance_r1_queries_decimals_once(self):
+    self.token_contract.functions.decimals.return_value.call.return_value = 6
+    self.token_contract.functions.balanceOf.return_value.call.return_value = 2_500_000
+
+    self.assertEqual(self.engine.web3_get_balance_r1(address="0x" + "22" * 20), 2.5)
+    self.assertEqual(self.engine.web3_get_balance_r1(address="0x" + "22" * 20), 2.5)
+
+    self.token_contract.functions.decimals.return_value.call.assert_called_once()
+
+  def test_decimals_fallback_is_not_cached(self):
+    decimals_call = self.token_contract.functions.decimals.return_value.call
+    decimals_call.side_effect = [Exception("rpc down"), 6]
+    self.token_contract.functions.balanceOf.return_value.call.return_value = 3 * 10 ** 18
+
+    self.assertEqual(self.engine.web3_get_balance_r1(address="0x" + "22" * 20), 3.0)
+    self.assertEqual(self.engine._get_token_decimals(self.web3_vars, self.token_contract), 6)
+    self.assertEqual(decimals_call.call_count, 2)
+
+  def test_chain_id_is_cached_per_network(self):
+    chain_id = mock.PropertyMock(return_value=8453)
+    type(self.web3.eth).chain_id = chain_id
+
+    self.assertEqual(self.engine._get_chain_id(self.web3_vars), 8453)
+    self.assertEqual(self.engine._get_chain_id(self.web3_vars), 8453)
+
+    chain_id.assert_called_once()
+
+
+class TestEvmWeb3VarsCache(unittest.TestCase):
+
+  def setUp(self):
+    self.engine = _DummyEngine()
+    self.engine.log = mock.Mock()
+    self.engine.log.str_to_date.side_effect = lambda value: datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
+  def test_web3_vars_are_built_once_per_network(self):
+    first = self.engine._get_web3_vars("devnet")
+    second = self.engine._get_web3_vars("devnet")
+
+    self.assertIs(first, second)
+    self.assertIs(first.w3.provider._request_session_manager._explicit_session, _get_shared_web3_session())
+    self.assertEqual(first.epoch_length_seconds, 4 * 3600)
+    self.engine.log.str_to_date.assert_called_once()
+
+  def test_web3_vars_honor_the_engine_web3_for_current_network(self):
+    self.engine.web3 = mock.Mock()
+    with mock.patch.object(_DummyEngine, "evm_network", new_callable=mock.PropertyMock, return_value="devnet"):
+      w3vars = self.engine._get_web3_vars()
+    self.assertIs(w3vars.w3, self.engine.web3)
+    self.assertEqual(w3vars.network, "devnet")
+
+  def test_get_epoch_id_uses_precomputed_genesis_timestamp(self):
+    w3vars = self.engine._get_web3_vars("devnet")
+    genesis = datetime(2026, 5, 1, 16, tzinfo=timezone.utc)
+    epoch_length = timedelta(seconds=w3vars.epoch_length_seconds)
+
+    self.assertEqual(w3vars.genesis_ts, genesis.timestamp())
+    self.assertEqual(self.engine.get_epoch_id(genesis, "devnet"), 0)
+    self.assertEqual(self.engine.get_epoch_id(genesis + epoch_length - timedelta(seconds=1), "devnet"), 0)
+    self.assertEqual(self.engine.get_epoch_id(genesis + 3 * epoch_length, "devnet"), 3)
+    self.assertEqual(self.engine.get_epoch_id("2026-05-01 19:59:59.999", "devnet"), 0)
+    self.assertEqual(self.engine.get_epoch_id("2026-05-01 20:00:00", "devnet"), 1)
+
+  def test_get_epoch_id_rejects_naive_datetime(self):
+    with self.assertRaises(TypeError):
+      self.engine.get_epoch_id(datetime(2026, 5, 2), "devnet")
+
+
+class TestSharedWeb3(unittest.TestCase):
+
+  def test_web3_is_per_caller_over_the_shared_session(self):
+    first = _new_web3("http://127.0.0.1:1/shared-a")
+    second = _new_web3("http://127.0.0.1:1/shared-a")
+
+    self.assertIsNot(first, second)
+    self.assertIsNot(first.provider, second.provider)
+    first.eth.default_account = "0x0000000000000000000000000000000000000001"
+    self.assertNotEqual(second.eth.default_account, first.eth.default_account)
+    for w3 in (first, second):
+      self.assertIs(w3.provider._request_session_manager._explicit_session, _get_shared_web3_session())
+      self.assertEqual(w3.provider._request_kwargs["timeout"], WEB3_HTTP_TIMEOUT)
+
+  def test_shared_session_pools_and_retries_safely(self):
+    w3 = _new_web3("http://127.0.0.1:1/shared-c")
+    adapter = _get_shared_web3_session().get_adapter("https://rpc.local")
+    self.assertEqual(adapter._pool_maxsize, evm.WEB3_HTTP_POOL_MAXSIZE)
+    retries = adapter.max_retries
+    self.assertEqual(retries.connect, evm.WEB3_HTTP_MAX_RETRIES)
+    self.assertEqual(retries.read, 0)
+    self.assertEqual(tuple(retries.status_forcelist), (429,))
+    # the adapter is the only retry layer
+    self.assertIsNone(w3.provider.exception_retry_configuration)
+
+
+if __name__ == "__main__":
+  unittest.main()
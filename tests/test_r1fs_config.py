@@ -0,0 +1,75 @@
+import base64
+import gzip
+import json
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from ratio1.ipfs.r1fs import IPFSCt, R1FSEngine
+
+RELAY = "/ip4/10.0.0.1/tcp/4001/p2p/12D3KooRelay"
+
+
+class R1FSStartupConfigTests(unittest.TestCase):
+
+  def setUp(self):
+    self.engine = object.__new__(R1FSEngine)
+    self.engine.P = lambda *args, **kwargs: None
+    self.engine._R1FSEngine__ipfs_relay = RELAY
+    self.engine._R1FSEngine__run_command = mock.Mock(return_value="")
+    folder = tempfile.TemporaryDirectory()
+    self.addCleanup(folder.cleanup)
+    self.config_path = os.path.join(folder.name, "config")
+
+  def _write_config(self, content):
+    with open(self.config_path, "w") as f:
+      f.write(content)
+    os.chmod(self.config_path, 0o600)
+
+  def test_patches_config_file_without_cli(self):
+    self._write_config(json.dumps({
+      "Identity": {"PeerID": "12D3KooSelf"},
+      "Bootstrap": ["/dnsaddr/bootstrap.libp2p.io/p2p/QmPublic"],
+      "Swarm": {"Transports": {"Network": {"QUIC": True}}},
+      "Discovery": {"MDNS": {"Enabled": True}},
+    }))
+
+    self.assertTrue(self.engine._R1FSEngine__apply_startup_config(self.config_path))
+
+    self.engine._R1FSEngine__run_command.assert_not_called()
+    with open(self.config_path) as f:
+      config = json.load(f)
+    self.assertEqual(config["Identity"], {"PeerID": "12D3KooSelf"})
+    self.assertEqual(config["Bootstrap"], [RELAY])
+    self.assertEqual(config["Swarm"]["Transports"]["Network"], {"QUIC": True, "Websocket": False})
+    self.assertFalse(config["Discovery"]["MDNS"]["Enabled"])
+    self.assertFalse(config["AutoTLS"]["Enabled"])
+    self.assertEqual(config["Routing"]["Type"], "dhtclient")
+    self.assertEqual(config["Reprovider"], {
+      "Interval": IPFSCt.REPROVIDER, "Strategy": IPFSCt.REPROVIDER_STRATEGY,
+    })
+    self.assertEqual(stat.S_IMODE(os.stat(self.config_path).st_mode), 0o600)
+    self.assertEqual(os.listdir(os.path.dirname(self.config_path)), ["config"])
+
+  def test_falls_back_to_cli_when_config_is_unreadable(self):
+    self._write_config("not json")
+
+    self.assertFalse(self.engine._R1FSEngine__apply_startup_config(self.config_path))
+
+    commands = [call.args[0] for call in self.engine._R1FSEngine__run_command.call_args_list]
+    self.assertIn(["ipfs", "config", "--json", "Routing.Type", '"dhtclient"'], commands)
+    self.assertIn(["ipfs", "bootstrap", "rm", "--all"], commands)
+    self.assertEqual(commands[-1], ["ipfs", "bootstrap", "add", RELAY])
+    self.assertEqual(os.listdir(os.path.dirname(self.config_path)), ["config"])
+
+  def test_decodes_gzipped_base64_certificate(self):
+    certificate = "-----BEGIN CERTIFICATE-----\nMIIB\n-----END CERTIFICATE-----\n"
+    encoded = base64.b64encode(gzip.compress(certificate.encode("utf-8"))).decode("ascii")
+    self.assertEqual(self.engine._R1FSEngine__decode_base64_gzip_to_text(encoded), certificate)
+    self.assertEqual(self.engine._R1FSEngine__decode_base64_gzip_to_text("bm90IGd6aXA="), "")
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,684 @@
+import hashlib
+import io
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from ratio1.ipfs.r1fs import (
+  COLOR_CODES, DEFAULT_SECRET, IPFSCt, R1FSEngine, _hash_secret_cached, _iter_prefetched, log_info,
+  _borrow_chunk_buffer, _probe_aead_throughput, _return_chunk_buffer, _rpc_address_from_multiaddr,
+)
+
+
+def _response(status_code=200, payload=None, text=""):
+  response = mock.Mock(status_code=status_code, text=text)
+  response.json.return_value = payload
+  response.content = json.dumps(payload).encode() if payload is not None else text.encode()
+  return response
+
+
+def _started_engine():
+  engine = object.__new__(R1FSEngine)
+  engine.messages = []
+  engine.P = lambda message, *args, **kwargs: engine.messages.append(str(message))
+  engine.Pd = lambda message, *args, **kwargs: None
+  engine._R1FSEngine__rpc_session = mock.Mock()
+  engine._R1FSEngine__rpc_host = IPFSCt.RPC_HOST
+  engine._R1FSEngine__rpc_port = IPFSCt.RPC_PORT
+  engine._R1FSEngine__rpc_api_url = IPFSCt.RPC_API_URL
+  engine._R1FSEngine__peers = []
+  engine._R1FSEngine__ipfs_started = True
+  return engine
+
+
+class R1FSRpcTests(unittest.TestCase):
+
+  def _engine(self):
+    return _started_engine()
+
+  def test_rpc_posts_to_local_daemon(self):
+    engine = self._engine()
+    session = engine._R1FSEngine__rpc_session
+    session.post.return_value = _response(payload={"ID": "12D3Koo"})
+
+    self.assertEqual(engine.get_ipfs_id_data(), {"ID": "12D3Koo"})
+    session.post.assert_called_once_with(
+      f"{IPFSCt.RPC_API_URL}/id", params=None, files=None, data=None, headers=None, timeout=IPFSCt.TIMEOUT,
+      stream=False,
+    )
+
+  def test_rpc_raises_daemon_error_message(self):
+    engine = self._engine()
+    engine._R1FSEngine__rpc_session.post.return_value = _response(
+      status_code=500, payload={"Message": "invalid path", "Code": 0, "Type": "error"},
+    )
+    with self.assertRaisesRegex(Exception, "invalid path"):
+      engine._rpc("pin/add", params={"arg": "bad"})
+
+  def test_swarm_peers_keep_cli_line_layout(self):
+    engine = self._engine()
+    engine._R1FSEngine__rpc_session.post.return_value = _response(payload={"Peers": [
+      {"Addr": "/ip4/10.0.0.1/tcp/4001", "Peer": "12D3KooRelay"},
+      {"Addr": "/ip4/10.0.0.2/tcp/4001", "Peer": "12D3KooOther"},
+    ]})
+
+    peers = engine._get_swarm_peers()
+
+    self.assertEqual(peers, ["/ip4/10.0.0.1/tcp/4001/p2p/12D3KooRelay", "/ip4/10.0.0.2/tcp/4001/p2p/12D3KooOther"])
+    self.assertEqual(engine.peers, peers)
+
+  def test_swarm_peers_empty_when_daemon_unreachable(self):
+    engine = self._engine()
+    engine._R1FSEngine__peers = ["stale"]
+    engine._R1FSEngine__rpc_session.post.side_effect = ConnectionError("refused")
+
+    self.assertEqual(engine._get_swarm_peers(), [])
+    self.assertEqual(engine.peers, [])
+
+  def _relay_engine(self, peers):
+    engine = self._engine()
+    engine.logger = mock.Mock()
+    engine._R1FSEngine__connected_at = None
+    engine._R1FSEngine__relay_check_cnt = 0
+    engine._R1FSEngine__ipfs_relay = "/ip4/10.0.0.1/tcp/4001/p2p/12D3KooRelay"
+    engine._R1FSEngine__ipfs_relay_peer_id = "12D3KooRelay"
+    engine._R1FSEngine__rpc_session.post.return_value = _response(payload={"Peers": peers})
+    return engine
+
+  def test_relay_check_matches_relay_peer_id(self):
+    engine = self._relay_engine([
+      {"Addr": "/ip4/10.0.0.2/tcp/4001", "Peer": "12D3KooOther"},
+      {"Addr": "/ip4/127.0.0.1/tcp/4001", "Peer": "12D3KooRelay"},
+    ])
+
+    self.assertTrue(engine._check_and_record_relay_connection())
+    self.assertIsNotNone(engine.connected_at)
+    self.assertEqual(engine._R1FSEngine__peers_by_id["12D3KooRelay"], "/ip4/127.0.0.1/tcp/4001/p2p/12D3KooRelay")
+
+  def test_relay_check_ignores_peers_dialed_through_relay(self):
+    engine = self._relay_engine([
+      {"Addr": "/ip4/10.0.0.1/tcp/4001/p2p/12D3KooRelay/p2p-circuit", "Peer": "12D3KooOther"},
+    ])
+
+    self.assertFalse(engine._check_and_record_relay_connection())
+    self.assertIsNone(engine.connected_at)
+
+  def test_relay_check_reports_swarm_peers_timeout(self):
+    engine = self._relay_engine([])
+    engine._R1FSEngine__peers = ["stale"]
+    engine._R1FSEngine__rpc_session.post.side_effect = requests.Timeout("read timed out")
+
+    self.assertFalse(engine._check_and_record_relay_connection())
+    self.assertTrue(any("timed out while reading swarm peers" in msg for msg in engine.messages))
+    self.assertEqual(engine.peers, [])
+
+  def test_pin_add_uses_rpc(self):
+    engine = self._engine()
+    session = engine._R1FSEngine__rpc_session
+    session.post.return_value = _response(payload={"Pins": ["QmCid"]})
+
+    self.assertEqual(engine._R1FSEngine__pin_add("QmCid"), "pinned QmCid recursively")
+    self.assertEqual(session.post.call_args.kwargs["params"], {"arg": "QmCid"})
+
+  def test_pin_queries_use_rpc(self):
+    engine = self._engine()
+    session = engine._R1FSEngine__rpc_session
+    session.post.return_value = _response(payload={"Keys": {"QmA": {"Type": "recursive"}, "QmB": {"Type": "recursive"}}})
+    self.assertEqual(engine.list_pins(), ["QmA", "QmB"])
+    self.assertEqual(session.post.call_args.args[0], f"{IPFSCt.RPC_API_URL}/pin/ls")
+    session.post.side_effect = ConnectionError("refused")
+    engine._R1FSEngine__run_command = mock.Mock(return_value="QmA\nQmB\n")
+    self.assertEqual(engine.list_pins(), ["QmA", "QmB"])
+    session.post.side_effect = None
+
+    session.post.return_value = _response(payload={"Keys": {"QmA": {"Type": "recursive"}}})
+    self.assertTrue(engine.is_pinned("QmA"))
+    session.post.return_value = _response(status_code=500, payload={"Message": "path 'QmC' is not pinned"})
+    self.assertFalse(engine.is_pinned("QmC"))
+
+  def test_cid_availability_uses_block_stat_rpc(self):
+    engine = self._engine()
+    session = engine._R1FSEngine__rpc_session
+    session.post.return_value = _response(payload={"Key": "QmA", "Size": 10})
+    self.assertTrue(engine.is_cid_available("QmA", max_wait=2))
+    self.assertEqual(session.post.call_args.args[0], f"{IPFSCt.RPC_API_URL}/block/stat")
+    self.assertEqual(session.post.call_args.kwargs["timeout"], 2)
+
+    session.post.side_effect = TimeoutError("timed out")
+    self.assertFalse(engine.is_cid_available("QmMissing"))
+
+  def test_swarm_connect_uses_rpc(self):
+    engine = self._engine()
+    session = engine._R1FSEngine__rpc_session
+    session.post.return_value = _response(payload={"Strings": ["connect 12D3KooRelay success"]})
+    self.assertEqual(
+      engine._R1FSEngine__swarm_connect("/ip4/10.0.0.1/tcp/4001/p2p/12D3KooRelay"),
+      (True, "connect 12D3KooRelay success", ""),
+    )
+
+    session.post.return_value = _response(status_code=500, payload={"Message": "failure: dial backoff"})
+    success, output, errors = engine._R1FSEngine__swarm_connect("/ip4/10.0.0.1/tcp/4001/p2p/12D3KooRelay")
+    self.assertFalse(success)
+    self.assertIn("dial backoff", errors)
+
+
+  def test_daemon_ready_probes_port_before_version_call(self):
+    engine = self._engine()
+    engine.is_ipfs_daemon_running = mock.Mock(return_value=True)
+    connect = mock.MagicMock(side_effect=[ConnectionRefusedError(), ConnectionRefusedError(), mock.MagicMock()])
+    with mock.patch("ratio1.ipfs.r1fs.socket.create_connection", connect), \
+         mock.patch.object(IPFSCt, "DAEMON_PORT_PROBE_INTERVAL", 0.001):
+      self.assertTrue(engine.is_ipfs_daemon_ready(max_wait=5, step=1))
+    self.assertEqual(connect.call_count, 3)
+    engine.is_ipfs_daemon_running.assert_called_once_with()
+
+    with mock.patch("ratio1.ipfs.r1fs.socket.create_connection", side_effect=ConnectionRefusedError()), \
+         mock.patch.object(IPFSCt, "DAEMON_PORT_PROBE_INTERVAL", 0.001):
+      self.assertFalse(engine.is_ipfs_daemon_ready(max_wait=0.05, step=1))
+    engine.is_ipfs_daemon_running.assert_called_once_with()
+
+  def test_rpc_address_follows_repo_api_address(self):
+    self.assertEqual(_rpc_address_from_multiaddr("/ip4/0.0.0.0/tcp/5101"), ("127.0.0.1", 5101))
+    self.assertEqual(_rpc_address_from_multiaddr("/ip6/::1/tcp/5001\n"), ("::1", 5001))
+    self.assertIsNone(_rpc_address_from_multiaddr("/unix/var/run/ipfs.sock"))
+    self.assertIsNone(_rpc_address_from_multiaddr(None))
+
+    engine = self._engine()
+    with tempfile.TemporaryDirectory() as home:
+      engine._R1FSEngine__ipfs_home = home
+      with open(os.path.join(home, "config"), "w") as f:
+        json.dump({"Addresses": {"API": ["/ip4/127.0.0.1/tcp/5101"]}}, f)
+      self.assertEqual(engine._R1FSEngine__resolve_rpc_address(), "http://127.0.0.1:5101/api/v0")
+
+      # the api file of a running daemon wins over the config
+      with open(os.path.join(home, "api"), "w") as f:
+        f.write("/ip6/::1/tcp/5201")
+      self.assertEqual(engine._R1FSEngine__resolve_rpc_address(), "http://[::1]:5201/api/v0")
+
+    session = engine._R1FSEngine__rpc_session
+    session.post.return_value = _response(payload={"ID": "12D3KooSelf"})
+    engine._rpc("id")
+    self.assertEqual(session.post.call_args.args[0], "http://[::1]:5201/api/v0/id")
+    session.post.return_value = _response(payload={"Version": "0.32.1"})
+    self.assertTrue(engine.is_ipfs_daemon_running())
+    self.assertEqual(session.post.call_args.args[0], "http://[::1]:5201/api/v0/version")
+    with mock.patch("ratio1.ipfs.r1fs.socket.create_connection") as connect:
+      self.assertTrue(engine._R1FSEngine__is_rpc_port_open())
+    self.assertEqual(connect.call_args.args[0], ("::1", 5201))
+
+  def test_run_command_can_discard_output(self):
+    engine = self._engine()
+    cmd = [sys.executable, "-c", "import sys; print('noise'); sys.stderr.write('bad arg'); sys.exit(1)"]
+    self.assertEqual(engine._R1FSEngine__run_command(cmd[:2] + ["print('noise')"], discard_output=True), "")
+    self.assertEqual(engine._R1FSEngine__run_command(cmd[:2] + ["print('noise')"]), "noise")
+    with self.assertRaisesRegex(Exception, "bad arg"):
+      engine._R1FSEngine__run_command(cmd, discard_output=True, show_logs=False)
+
+  def test_get_id_is_memoized_until_daemon_restart(self):
+    engine = self._engine()
+    engine._R1FSEngine__ipfs_id = None
+    engine._R1FSEngine__ipfs_id_cached = False
+    session = engine._R1FSEngine__rpc_session
+    session.post.return_value = _response(payload={
+      "ID": "12D3KooSelf", "AgentVersion": "kubo/0.35.0", "Addresses": ["/ip4/127.0.0.1/tcp/4001"],
+    })
+
+    self.assertEqual(engine._R1FSEngine__get_id(), "12D3KooSelf")
+    self.assertEqual(engine._R1FSEngine__get_id(), "12D3KooSelf")
+    self.assertEqual(session.post.call_count, 1)
+
+    engine.maybe_reset_ipfs()
+    engine._R1FSEngine__get_id()
+    self.assertEqual(session.post.call_count, 2)
+
+  def test_log_info_layout(self):
+    with mock.patch("builtins.print") as printed:
+      log_info("hello", color="g")
+      log_info("plain", color="unknown")
+    green, plain = [call.args[0] for call in printed.call_args_list]
+    self.assertRegex(green, r"^\x1b\[92m\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] hello\x1b\[0m$")
+    self.assertTrue(plain.startswith(COLOR_CODES["reset"] + "["))
+
+  def test_aead_probe_warns_on_slow_backend(self):
+    self.assertGreater(_probe_aead_throughput(), 0)
+    self.assertIs(_probe_aead_throughput(), _probe_aead_throughput())
+    for throughput, warned in [(IPFSCt.AEAD_MIN_THROUGHPUT_MBS * 10, False), (IPFSCt.AEAD_MIN_THROUGHPUT_MBS / 10, True)]:
+      engine = self._engine()
+      with mock.patch("ratio1.ipfs.r1fs._probe_aead_throughput", return_value=throughput):
+        engine._R1FSEngine__probe_aead_backend()
+      self.assertEqual(engine.aead_throughput_mbs, throughput)
+      self.assertEqual(any("AES-NI" in message for message in engine.messages), warned)
+
+  def test_startup_starts_ipfs_with_configured_relay(self):
+    engine = self._engine()
+    relay = "/ip4/10.0.0.1/tcp/4001/p2p/12D3KooRelay"
+    with tempfile.TemporaryDirectory() as folder:
+      engine._R1FSEngine__downloads_dir = os.path.join(folder, "downloads")
+      engine._R1FSEngine__uploads_dir = os.path.join(folder, "uploads")
+      engine._R1FSEngine__base64_swarm_key = "c3dhcm0ta2V5"
+      engine._R1FSEngine__ipfs_relay = relay
+      engine._R1FSEngine__ipfs_relay_api = "https://relay.example/api"
+      engine._R1FSEngine__ipfs_api_key_username = "user"
+      engine._R1FSEngine__ipfs_api_key_password = "pass"
+      engine._R1FSEngine__ipfs_certificate_path = None
+      engine.maybe_reset_ipfs = mock.Mock()
+      engine.maybe_start_ipfs = mock.Mock()
+      with mock.patch("ratio1.ipfs.r1fs._probe_aead_throughput", return_value=IPFSCt.AEAD_MIN_THROUGHPUT_MBS * 10):
+        engine.startup()
+    engine.maybe_reset_ipfs.assert_called_once_with()
+    engine.maybe_start_ipfs.assert_called_once_with(
+      base64_swarm_key="c3dhcm0ta2V5",
+      ipfs_relay=relay,
+      ipfs_relay_api="https://relay.example/api",
+      ipfs_api_key_username="user",
+      ipfs_api_key_password="pass",
+      ipfs_certificate_path=None,
+    )
+
+  def test_hash_secret_is_memoized_sha256(self):
+    engine = self._engine()
+    self.assertEqual(engine._hash_secret("ratio1"), hashlib.sha256(b"ratio1").digest())
+    hits = _hash_secret_cached.cache_info().hits
+    self.assertEqual(engine._hash_secret(123), hashlib.sha256(b"123").digest())
+    engine._hash_secret("ratio1")
+    self.assertEqual(_hash_secret_cached.cache_info().hits, hits + 1)
+
+
+class R1FSAddFileTests(unittest.TestCase):
+
+  def _engine(self):
+    engine = _started_engine()
+    engine._R1FSEngine__DEFAULT_SECRET = DEFAULT_SECRET
+    engine._R1FSEngine__uploaded_files = {}
+    engine._R1FSEngine__relay_publication_status = {}
+    engine._R1FSEngine__publish_cid_to_relay = mock.Mock(return_value=True)
+    engine._R1FSEngine__pin_add = mock.Mock(return_value="pinned")
+    self.bodies = []
+
+    def post(url, data=None, headers=None, **kwargs):
+      self.bodies.append((url, kwargs.get("params"), headers, b"".join(data)))
+      return _response(text='{"Name":"","Hash":"QmFolder","Size":"99"}\n')
+
+    engine._R1FSEngine__rpc_session.post.side_effect = post
+    return engine
+
+  def _write(self, content):
+    handle, path = tempfile.mkstemp(suffix="_payload.txt")
+    with os.fdopen(handle, "wb") as f:
+      f.write(content)
+    self.addCleanup(os.remove, path)
+    return path
+
+  def _decrypt(self, ciphertext, secret=DEFAULT_SECRET):
+    key = R1FSEngine._hash_secret(None, secret)
+    nonce, meta_len = ciphertext[:12], int.from_bytes(ciphertext[12:16], "big")
+    plaintext = AESGCM(key).decrypt(nonce, ciphertext[16:], None)
+    return json.loads(plaintext[:meta_len]), plaintext[meta_len:]
+
+  def test_add_file_streams_ciphertext_to_daemon(self):
+    engine = self._engine()
+    content = os.urandom(3 * 1024 * 1024 + 17)
+    path = self._write(content)
+
+    cid = engine.add_file(path, show_logs=False)
+
+    self.assertEqual(cid, "QmFolder")
+    (url, params, headers, body), = self.bodies
+    self.assertEqual(url, f"{IPFSCt.RPC_API_URL}/add")
+    self.assertEqual(params, {"wrap-with-directory": "true", "quieter": "true"})
+    boundary = headers["Content-Type"].split("boundary=")[1]
+    head, _, rest = body.partition(b"\r\n\r\n")
+    self.assertIn(b'name="file"; filename="', head)
+    self.assertTrue(rest.endswith(f"\r\n--{boundary}--\r\n".encode()))
+    ciphertext = rest[:-len(f"\r\n--{boundary}--\r\n")]
+    meta, plaintext = self._decrypt(ciphertext)
+    self.assertEqual(meta, {"filename": os.path.basename(path)})
+    self.assertEqual(plaintext, content)
+    engine._R1FSEngine__pin_add.assert_called_once_with("QmFolder")
+    self.assertTrue(engine.get_upload_status("QmFolder")["local_pin_succeeded"])
+
+  def test_add_file_coalesces_small_body_pieces(self):
+    engine = self._engine()
+    pieces = []
+    engine._R1FSEngine__rpc_session.post.side_effect = lambda url, data=None, **kwargs: (
+      pieces.append([len(piece) for piece in data]) or _response(text='{"Hash":"QmFolder"}\n')
+    )
+    engine.add_file(self._write(b"small"), show_logs=False)
+    with mock.patch.object(IPFSCt, "ONE_SHOT_CIPHER_MAX_SIZE", 0):
+      engine.add_file(self._write(os.urandom(2 * IPFSCt.CIPHER_CHUNK_SIZE + 10)), show_logs=False)
+
+    small, large = pieces
+    self.assertEqual(len(small), 1)
+    # framing + header, two full chunks, then the 10-byte tail, tag and closing boundary
+    self.assertEqual(len(large), 4)
+    self.assertEqual(large[1:3], [IPFSCt.CIPHER_CHUNK_SIZE] * 2)
+    self.assertLess(large[0] + large[-1], 1024)
+
+  def test_add_file_with_nonce_is_deterministic(self):
+    engine = self._engine()
+    path = self._write(b"same content")
+
+    engine.add_file(path, nonce=7, show_logs=False)
+    engine.add_file(path, nonce=7, show_logs=False)
+
+    first, second = [body.partition(b"\r\n\r\n")[2].split(b"\r\n--")[0] for *_, body in self.bodies]
+    self.assertEqual(first, second)
+
+
+  def test_add_file_pins_locally_while_publishing_to_relay(self):
+    engine = self._engine()
+    pinned = threading.Event()
+    engine._R1FSEngine__pin_add = mock.Mock(side_effect=lambda cid: pinned.set())
+    # the relay publication sees the local pin complete while it is still running
+    waits = []
+    engine._R1FSEngine__publish_cid_to_relay = mock.Mock(
+      side_effect=lambda **kwargs: waits.append(pinned.wait(5)) or True
+    )
+
+    self.assertEqual(engine.add_file(self._write(b"data"), show_logs=False), "QmFolder")
+    self.assertEqual(waits, [True])
+    self.assertTrue(engine.get_upload_status("QmFolder")["local_pin_succeeded"])
+
+  def test_add_file_propagates_local_pin_errors(self):
+    engine = self._engine()
+    engine._R1FSEngine__pin_add = mock.Mock(side_effect=RuntimeError("pin failed"))
+
+    with self.assertRaisesRegex(RuntimeError, "pin failed"):
+      engine.add_file(self._write(b"data"), show_logs=False)
+    self.assertFalse(engine.get_upload_status("QmFolder")["local_pin_succeeded"])
+
+
+  def test_add_file_from_stream_uses_given_basename(self):
+    engine = self._engine()
+    stream = io.BytesIO(b"skip|payload")
+    stream.seek(5)
+
+    self.assertEqual(engine.add_file(data_stream=stream, original_basename="p.bin", show_logs=False), "QmFolder")
+    meta, plaintext = self._decrypt(self._ciphertext(self.bodies[0][-1]))
+    self.assertEqual(meta, {"filename": "p.bin"})
+    self.assertEqual(plaintext, b"payload")
+
+  def test_add_json_and_pickle_upload_from_memory(self):
+    engine = self._engine()
+    with mock.patch("builtins.open", side_effect=AssertionError("no disk access expected")):
+      engine.add_json({"b": 1, "a": [2]}, show_logs=False, raise_on_error=True)
+      engine.add_pickle({"k": 3}, fn="state.pkl", show_logs=False, raise_on_error=True)
+
+    (json_meta, json_data), (pkl_meta, pkl_data) = [
+      self._decrypt(self._ciphertext(body)) for *_, body in self.bodies
+    ]
+    self.assertEqual(json_meta, {"filename": "data.json"})
+    self.assertEqual(json_data, b'{"a":[2],"b":1}')
+    self.assertEqual(pkl_meta, {"filename": "state.pkl"})
+    self.assertEqual(pickle.loads(pkl_data), {"k": 3})
+
+
+  def test_put_many_adds_every_file(self):
+    engine = self._engine()
+    paths = [self._write(content) for content in [b"one", b"two", b"three"]]
+    missing = paths[0] + ".missing"
+
+    cids = engine.put_many(paths + [missing, paths[1]], max_workers=2, show_logs=False)
+
+    self.assertEqual(list(cids), paths + [missing])
+    self.assertEqual([cids[path] for path in paths], ["QmFolder"] * 3)
+    self.assertIsNone(cids[missing])
+    plaintexts = sorted(self._decrypt(self._ciphertext(body))[1] for *_, body in self.bodies)
+    self.assertEqual(plaintexts, [b"one", b"three", b"two"])
+    with self.assertRaises(FileNotFoundError):
+      engine.put_many([missing], raise_on_error=True, show_logs=False)
+
+
+  def _ciphertext(self, body):
+    return body.partition(b"\r\n\r\n")[2].rsplit(b"\r\n--", 1)[0]
+
+  def test_one_shot_and_streamed_encryption_are_identical(self):
+    engine = self._engine()
+    path = self._write(os.urandom(5000))
+
+    engine.add_file(path, nonce=3, show_logs=False)
+    with mock.patch.object(IPFSCt, "ONE_SHOT_CIPHER_MAX_SIZE", 1024), \
+         mock.patch.object(IPFSCt, "CIPHER_CHUNK_SIZE", 1000):
+      engine.add_file(path, nonce=3, show_logs=False)
+
+    one_shot, streamed = [self._ciphertext(body) for *_, body in self.bodies]
+    self.assertEqual(one_shot, streamed)
+
+  def _added_ciphertext(self, content):
+    engine = self._engine()
+    engine._R1FSEngine__relay_retry_queue = {}
+    engine._R1FSEngine__downloaded_files = {}
+    engine._R1FSEngine__downloaded_files_stat = {}
+    path = self._write(content)
+    engine.add_file(path, show_logs=False)
+    return engine, path, self._ciphertext(self.bodies[0][-1])
+
+  def _serve_cat(self, engine, ciphertext, chunk_size):
+    cat = _response()
+    cat.__enter__ = mock.Mock(return_value=cat)
+    cat.__exit__ = mock.Mock(return_value=False)
+    cat.iter_content = lambda **kwargs: (
+      ciphertext[i:i + chunk_size] for i in range(0, len(ciphertext), chunk_size)
+    )
+    ls = _response(payload={"Objects": [{"Hash": "QmFolder", "Links": [{"Name": "cipher.bin", "Hash": "QmCipher"}]}]})
+
+    def post(url, params=None, **kwargs):
+      if url.endswith("/ls"):
+        self.assertEqual(params["arg"], "QmFolder")
+        return ls
+      self.assertEqual((url, params["arg"], kwargs["stream"]), (f"{IPFSCt.RPC_API_URL}/cat", "QmCipher", True))
+      return cat
+
+    engine._R1FSEngine__rpc_session.post.side_effect = post
+    engine._R1FSEngine__run_command = mock.Mock(side_effect=AssertionError("ipfs get must not run"))
+
+  def test_get_file_streams_from_daemon_cat(self):
+    content = os.urandom(4096)
+    engine, path, ciphertext = self._added_ciphertext(content)
+    for chunk_size in [1, 7, 16, 17, 1000, len(ciphertext)]:
+      self._serve_cat(engine, ciphertext, chunk_size)
+      # chunks above CIPHER_CHUNK_SIZE grow the reused output buffer
+      with self.subTest(chunk_size=chunk_size), tempfile.TemporaryDirectory() as folder, \
+           mock.patch.object(IPFSCt, "CIPHER_CHUNK_SIZE", 256):
+        out_path = engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False)
+        self.assertEqual(out_path, os.path.join(os.path.abspath(folder), "QmFolder", os.path.basename(path)))
+        with open(out_path, "rb") as f:
+          self.assertEqual(f.read(), content)
+
+  def test_get_file_reuses_unchanged_previous_download(self):
+    content = os.urandom(4096)
+    engine, path, ciphertext = self._added_ciphertext(content)
+    self._serve_cat(engine, ciphertext, 1000)
+    session = engine._R1FSEngine__rpc_session
+    with tempfile.TemporaryDirectory() as folder:
+      out_path = engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False)
+      n_calls = session.post.call_count
+
+      self.assertEqual(engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False), out_path)
+      self.assertEqual(session.post.call_count, n_calls)
+
+      # a different secret, a forced refresh or a modified file download again
+      engine.get_file("QmFolder", local_folder=folder, secret="other", pin=False, show_logs=False)
+      self.assertGreater(session.post.call_count, n_calls)
+      for kwargs in [{"force_refresh": True}, {}]:
+        n_calls = session.post.call_count
+        if not kwargs:
+          with open(out_path, "ab") as f:
+            f.write(b"edited")
+        self.assertEqual(engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False, **kwargs), out_path)
+        self.assertGreater(session.post.call_count, n_calls)
+        with open(out_path, "rb") as f:
+          self.assertEqual(f.read(), content)
+
+  def test_get_file_pins_even_when_reusing_previous_download(self):
+    engine, _, ciphertext = self._added_ciphertext(os.urandom(4096))
+    self._serve_cat(engine, ciphertext, 1000)
+    session = engine._R1FSEngine__rpc_session
+    with tempfile.TemporaryDirectory() as folder:
+      out_path = engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False)
+      n_calls = session.post.call_count
+      engine._R1FSEngine__pin_add = mock.Mock(return_value="pinned QmFolder recursively")
+
+      self.assertEqual(engine.get_file("QmFolder", local_folder=folder, pin=True, show_logs=False), out_path)
+      engine._R1FSEngine__pin_add.assert_called_once_with("QmFolder")
+      self.assertEqual(session.post.call_count, n_calls)
+
+  def test_get_file_replaces_previous_download(self):
+    content = os.urandom(4096)
+    engine, path, ciphertext = self._added_ciphertext(content)
+    self._serve_cat(engine, ciphertext, 1000)
+    with tempfile.TemporaryDirectory() as folder:
+      os.makedirs(os.path.join(folder, "QmFolder"))
+      with open(os.path.join(folder, "QmFolder", "stale.bin"), "wb") as f:
+        f.write(b"stale")
+
+      # a reader of the previous download keeps its open file across the swap
+      with open(os.path.join(folder, "QmFolder", "stale.bin"), "rb") as reader:
+        engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False)
+        self.assertEqual(reader.read(), b"stale")
+
+      self.assertEqual(os.listdir(folder), ["QmFolder"])
+      self.assertEqual(os.listdir(os.path.join(folder, "QmFolder")), [os.path.basename(path)])
+
+  def test_get_file_swap_failure_keeps_the_original_error(self):
+    engine, _, ciphertext = self._added_ciphertext(os.urandom(4096))
+    self._serve_cat(engine, ciphertext, 1000)
+    with tempfile.TemporaryDirectory() as folder:
+      os.makedirs(os.path.join(folder, "QmFolder"))
+      with mock.patch("ratio1.ipfs.r1fs.os.rename", side_effect=PermissionError("busy")):
+        with self.assertRaisesRegex(PermissionError, "busy"):
+          engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False)
+      self.assertEqual(os.listdir(folder), ["QmFolder"])
+
+  def test_get_file_folder_keeps_umask_permissions(self):
+    engine, _, ciphertext = self._added_ciphertext(os.urandom(4096))
+    self._serve_cat(engine, ciphertext, 1000)
+    umask = os.umask(0o022)
+    try:
+      with tempfile.TemporaryDirectory() as folder:
+        engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False)
+        self.assertEqual(os.stat(os.path.join(folder, "QmFolder")).st_mode & 0o777, 0o755)
+    finally:
+      os.umask(umask)
+
+  def test_get_file_streamed_rejects_tampered_ciphertext(self):
+    engine, _, ciphertext = self._added_ciphertext(os.urandom(4096))
+    tampered = ciphertext[:-20] + bytes([ciphertext[-20] ^ 1]) + ciphertext[-19:]
+    self._serve_cat(engine, tampered, 1000)
+    with tempfile.TemporaryDirectory() as folder:
+      self.assertIsNone(engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False))
+      self.assertEqual(os.listdir(folder), [])
+
+  def test_get_many_downloads_every_cid(self):
+    content = os.urandom(4096)
+    engine, path, ciphertext = self._added_ciphertext(content)
+    self._serve_cat(engine, ciphertext, 1000)
+    with tempfile.TemporaryDirectory() as folder:
+      paths = engine.get_many(["QmFolder", "QmFolder"], local_folder=folder, pin=False, show_logs=False)
+      self.assertEqual(list(paths), ["QmFolder"])
+      with open(paths["QmFolder"], "rb") as f:
+        self.assertEqual(f.read(), content)
+
+    engine.get_file = mock.Mock(side_effect=ValueError("bad cid"))
+    self.assertEqual(engine.get_many(["QmBad"], show_logs=False), {"QmBad": None})
+    with self.assertRaisesRegex(ValueError, "bad cid"):
+      engine.get_many(["QmBad"], raise_on_error=True, show_logs=False)
+
+  def test_get_file_falls_back_to_ipfs_get(self):
+    content = os.urandom(4096)
+    engine, path, ciphertext = self._added_ciphertext(content)
+    engine._R1FSEngine__rpc_session.post.side_effect = ConnectionError("refused")
+
+    def ipfs_get(cmd, **kwargs):
+      os.makedirs(cmd[-1])
+      with open(os.path.join(cmd[-1], "cipher.bin"), "wb") as f:
+        f.write(ciphertext)
+      return ""
+
+    engine._R1FSEngine__run_command = ipfs_get
+    # head reads shorter than the header, ending before / inside the tag, or covering all
+    cases = [(IPFSCt.ONE_SHOT_CIPHER_MAX_SIZE, IPFSCt.DOWNLOAD_HEAD_READ_SIZE), (IPFSCt.ONE_SHOT_CIPHER_MAX_SIZE, 20)]
+    cases += [(1024, head_size) for head_size in [20, 1000, len(ciphertext) - 8, IPFSCt.DOWNLOAD_HEAD_READ_SIZE]]
+    for one_shot_max, head_size in cases:
+      with self.subTest(one_shot_max=one_shot_max, head_size=head_size), tempfile.TemporaryDirectory() as folder, \
+           mock.patch.object(IPFSCt, "ONE_SHOT_CIPHER_MAX_SIZE", one_shot_max), \
+           mock.patch.object(IPFSCt, "DOWNLOAD_HEAD_READ_SIZE", head_size), \
+           mock.patch.object(IPFSCt, "CIPHER_CHUNK_SIZE", 1000):
+        out_path = engine.get_file("QmFolder", local_folder=folder, pin=False, show_logs=False)
+        self.assertEqual(os.path.basename(out_path), os.path.basename(path))
+        with open(out_path, "rb") as f:
+          self.assertEqual(f.read(), content)
+        self.assertEqual(os.listdir(os.path.dirname(out_path)), [os.path.basename(path)])
+
+
+  def test_get_file_fallback_rejects_unwrapped_file(self):
+    engine, _, ciphertext = self._added_ciphertext(os.urandom(100))
+    engine._R1FSEngine__rpc_session.post.side_effect = ConnectionError("refused")
+
+    def ipfs_get(cmd, **kwargs):
+      with open(cmd[-1], "wb") as f:
+        f.write(ciphertext)
+      return ""
+
+    engine._R1FSEngine__run_command = ipfs_get
+    with tempfile.TemporaryDirectory() as folder:
+      self.assertIsNone(engine.get_file("QmFile", local_folder=folder, pin=False, show_logs=False))
+      self.assertEqual(os.listdir(folder), [])
+      with self.assertRaisesRegex(RuntimeError, "to be a directory"):
+        engine.get_file("QmFile", local_folder=folder, pin=False, raise_on_error=True, show_logs=False)
+
+
+class R1FSChunkBufferPoolTests(unittest.TestCase):
+
+  def test_buffers_are_reused_and_sized_for_update_into(self):
+    with mock.patch.object(IPFSCt, "CIPHER_CHUNK_SIZE", 1000):
+      buffer = _borrow_chunk_buffer()
+      self.assertEqual(len(buffer), 1015)
+      _return_chunk_buffer(buffer)
+      self.assertIs(_borrow_chunk_buffer(), buffer)
+      _return_chunk_buffer(buffer)
+    with mock.patch.object(IPFSCt, "CIPHER_CHUNK_SIZE", 2000):
+      self.assertEqual(len(_borrow_chunk_buffer()), 2015)
+
+
+class R1FSPrefetchTests(unittest.TestCase):
+
+  def test_prefetch_keeps_order(self):
+    chunks = [bytes([i]) * 3 for i in range(20)]
+    self.assertEqual(list(_iter_prefetched(iter(chunks), max_pending=2)), chunks)
+
+  def test_prefetch_reraises_producer_errors(self):
+    def chunks():
+      yield b"a"
+      raise ValueError("read failed")
+
+    with self.assertRaisesRegex(ValueError, "read failed"):
+      list(_iter_prefetched(chunks()))
+
+  def test_prefetch_stops_producer_when_consumer_stops(self):
+    closed = []
+
+    def chunks():
+      try:
+        while True:
+          yield b"x"
+      finally:
+        closed.append(True)
+
+    stream = _iter_prefetched(chunks(), max_pending=1)
+    self.assertEqual(next(stream), b"x")
+    stream.close()
+    self.assertEqual(closed, [True])
+
+
+if __name__ == "__main__":
+  unittest.main()
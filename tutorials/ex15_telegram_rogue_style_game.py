@@ -25,1035 +25,1373 @@ from ratio1 import Session, CustomPluginTemplate
 session = Session()  # Uses .ratio1 config or env variables
 
 def reply(plugin: CustomPluginTemplate, message: str, user: str, **kwargs):
-  # --------------------------------------------------
-  # GAME CONSTANTS
-  # --------------------------------------------------
-  GRID_WIDTH = 100
-  GRID_HEIGHT = 100
-  MAX_LEVEL = 10
-
-  # Monster types and their stats
-  MONSTER_TYPES = {
-    "goblin": {
-      "name": "Goblin 👹",
-      "min_level": 1,
-      "max_level": 3,
-      "base_hp": 5,
-      "hp_per_level": 2,
-      "min_damage": 1,
-      "max_damage": 3,
-      "damage_per_level": 1,
-      "xp_reward": 2,
-      "coin_reward": (1, 3)
-    },
-    "orc": {
-      "name": "Orc 👺",
-      "min_level": 4,
-      "max_level": 7,
-      "base_hp": 8,
-      "hp_per_level": 3,
-      "min_damage": 2,
-      "max_damage": 4,
-      "damage_per_level": 1,
-      "xp_reward": 3,
-      "coin_reward": (2, 4)
-    },
-    "demon": {
-      "name": "Demon 👿",
-      "min_level": 8,
-      "max_level": 10,
-      "base_hp": 12,
-      "hp_per_level": 4,
-      "min_damage": 3,
-      "max_damage": 6,
-      "damage_per_level": 2,
-      "xp_reward": 5,
-      "coin_reward": (3, 6)
+  # Build the game constants and helpers on the first message only and reuse them from obj_cache afterwards
+  game = plugin.obj_cache.get("game")
+  if game is None:
+    # --------------------------------------------------
+    # GAME CONSTANTS
+    # --------------------------------------------------
+    GRID_WIDTH = 100
+    GRID_HEIGHT = 100
+    MAX_LEVEL = 10
+
+    # The shared map is kept as NumPy grids (one per tile field) holding these uint8 codes
+    TILE_TYPES = ("EMPTY", "COIN", "TRAP", "MONSTER", "HEALTH")
+    TILE_EMPTY, TILE_COIN, TILE_TRAP, TILE_MONSTER, TILE_HEALTH = range(len(TILE_TYPES))
+    BIOME_TYPES = ("FOREST", "LAVA_CAVES", "ICE_WASTES", "PLAINS")
+    BIOME_EMOJIS = ("🌲", "🌋", "❄️", "🌾")
+
+    # Map view cells by tile code; empty tiles show their biome and monsters their level cluster
+    TILE_VIEW_EMOJIS = ("", "💰 ", "🔥 ", "", "❤️ ")
+    BIOME_VIEW_EMOJIS = tuple(f"{emoji} " for emoji in BIOME_EMOJIS)
+    MONSTER_VIEW_EMOJIS = ("",) + ("👹 ",) * 3 + ("👺 ",) * 3 + ("👿 ",) * (MAX_LEVEL - 6)
+
+    # Monster types and their stats
+    MONSTER_TYPES = {
+      "goblin": {
+        "name": "Goblin 👹",
+        "min_level": 1,
+        "max_level": 3,
+        "base_hp": 5,
+        "hp_per_level": 2,
+        "min_damage": 1,
+        "max_damage": 3,
+        "damage_per_level": 1,
+        "xp_reward": 2,
+        "coin_reward": (1, 3)
+      },
+      "orc": {
+        "name": "Orc 👺",
+        "min_level": 4,
+        "max_level": 7,
+        "base_hp": 8,
+        "hp_per_level": 3,
+        "min_damage": 2,
+        "max_damage": 4,
+        "damage_per_level": 1,
+        "xp_reward": 3,
+        "coin_reward": (2, 4)
+      },
+      "demon": {
+        "name": "Demon 👿",
+        "min_level": 8,
+        "max_level": 10,
+        "base_hp": 12,
+        "hp_per_level": 4,
+        "min_damage": 3,
+        "max_damage": 6,
+        "damage_per_level": 2,
+        "xp_reward": 5,
+        "coin_reward": (3, 6)
+      }
     }
-  }
-
-  # Player stats for each level
-  LEVEL_DATA = {
-    # Level: {max_hp, max_energy, next_level_xp, hp_regen_rate, energy_regen_rate, damage_reduction}
-    # hp_regen_rate and energy_regen_rate are per minute
-    1: {"max_hp": 10, "max_energy": 20, "next_level_xp": 10, "hp_regen_rate": 3, "energy_regen_rate": 6, "damage_reduction": 0.00},
-    2: {"max_hp": 12, "max_energy": 22, "next_level_xp": 25, "hp_regen_rate": 3.6, "energy_regen_rate": 7.2, "damage_reduction": 0.05},
-    3: {"max_hp": 14, "max_energy": 24, "next_level_xp": 45, "hp_regen_rate": 4.2, "energy_regen_rate": 8.4, "damage_reduction": 0.10},
-    4: {"max_hp": 16, "max_energy": 26, "next_level_xp": 70, "hp_regen_rate": 4.8, "energy_regen_rate": 9.6, "damage_reduction": 0.15},
-    5: {"max_hp": 18, "max_energy": 28, "next_level_xp": 100, "hp_regen_rate": 5.4, "energy_regen_rate": 10.8, "damage_reduction": 0.20},
-    6: {"max_hp": 20, "max_energy": 30, "next_level_xp": 140, "hp_regen_rate": 6, "energy_regen_rate": 12, "damage_reduction": 0.25},
-    7: {"max_hp": 22, "max_energy": 32, "next_level_xp": 190, "hp_regen_rate": 6.6, "energy_regen_rate": 13.2, "damage_reduction": 0.30},
-    8: {"max_hp": 24, "max_energy": 34, "next_level_xp": 250, "hp_regen_rate": 7.2, "energy_regen_rate": 14.4, "damage_reduction": 0.35},
-    9: {"max_hp": 26, "max_energy": 36, "next_level_xp": 320, "hp_regen_rate": 7.8, "energy_regen_rate": 15.6, "damage_reduction": 0.40},
-    10: {"max_hp": 28, "max_energy": 40, "next_level_xp": 400, "hp_regen_rate": 9, "energy_regen_rate": 18, "damage_reduction": 0.45},
-  }
 
-  # Energy costs for actions
-  ENERGY_COSTS = {
-    "move": 1,     # Basic movement
-    "attack": 3,   # Fighting a monster
-    "shop": 0,     # Checking the shop (free)
-    "use_item": 2  # Using an item
-  }
+    # Monster type codes stored on the map, 0 meaning that no type was drawn for the tile yet
+    MONSTER_TYPE_CODES = ("",) + tuple(MONSTER_TYPES)
+
+    # Player stats for each level
+    LEVEL_DATA = {
+      # Level: {max_hp, max_energy, next_level_xp, hp_regen_rate, energy_regen_rate, damage_reduction}
+      # hp_regen_rate and energy_regen_rate are per minute
+      1: {"max_hp": 10, "max_energy": 20, "next_level_xp": 10, "hp_regen_rate": 3, "energy_regen_rate": 6, "damage_reduction": 0.00},
+      2: {"max_hp": 12, "max_energy": 22, "next_level_xp": 25, "hp_regen_rate": 3.6, "energy_regen_rate": 7.2, "damage_reduction": 0.05},
+      3: {"max_hp": 14, "max_energy": 24, "next_level_xp": 45, "hp_regen_rate": 4.2, "energy_regen_rate": 8.4, "damage_reduction": 0.10},
+      4: {"max_hp": 16, "max_energy": 26, "next_level_xp": 70, "hp_regen_rate": 4.8, "energy_regen_rate": 9.6, "damage_reduction": 0.15},
+      5: {"max_hp": 18, "max_energy": 28, "next_level_xp": 100, "hp_regen_rate": 5.4, "energy_regen_rate": 10.8, "damage_reduction": 0.20},
+      6: {"max_hp": 20, "max_energy": 30, "next_level_xp": 140, "hp_regen_rate": 6, "energy_regen_rate": 12, "damage_reduction": 0.25},
+      7: {"max_hp": 22, "max_energy": 32, "next_level_xp": 190, "hp_regen_rate": 6.6, "energy_regen_rate": 13.2, "damage_reduction": 0.30},
+      8: {"max_hp": 24, "max_energy": 34, "next_level_xp": 250, "hp_regen_rate": 7.2, "energy_regen_rate": 14.4, "damage_reduction": 0.35},
+      9: {"max_hp": 26, "max_energy": 36, "next_level_xp": 320, "hp_regen_rate": 7.8, "energy_regen_rate": 15.6, "damage_reduction": 0.40},
+      10: {"max_hp": 28, "max_energy": 40, "next_level_xp": 400, "hp_regen_rate": 9, "energy_regen_rate": 18, "damage_reduction": 0.45},
+    }
 
-  # --------------------------------------------------
-  # SHOP FUNCTIONS
-  # --------------------------------------------------
-  # Shop items configuration
-  SHOP_ITEMS = {
-    "health_potion": {
-      "name": "Health Potion 🧪",
-      "description": "Restores 5 health points",
-      "price": 5,
-      "type": "consumable"
-    },
-    "sword": {
-      "name": "Sword ⚔️",
-      "description": "Increases your attack by 1 (reduces monster damage)",
-      "price": 15,
-      "type": "weapon",
-      "attack_bonus": 1
-    },
-    "shield": {
-      "name": "Shield 🛡️",
-      "description": "Adds 10% damage reduction",
-      "price": 20,
-      "type": "armor",
-      "damage_reduction_bonus": 0.1
-    },
-    "amulet": {
-      "name": "Magic Amulet 🔮",
-      "description": "Increases max health by 3",
-      "price": 25,
-      "type": "accessory",
-      "max_health_bonus": 3
-    },
-    "boots": {
-      "name": "Speed Boots 👢",
-      "description": "5% chance to avoid all damage",
-      "price": 30,
-      "type": "accessory",
-      "dodge_chance": 0.05
-    },
-    "map_scroll": {
-      "name": "Map Scroll 📜",
-      "description": "Reveals more of the map when used",
-      "price": 10,
-      "type": "consumable"
-    },
-    "energy_drink": {
-      "name": "Energy Drink 🧃",
-      "description": "Restores 10 energy points",
-      "price": 7,
-      "type": "consumable"
-    },
-    "bomb": {
-      "name": "Bomb 💣",
-      "description": "Deals 5 damage to a monster before combat starts",
-      "price": 15,
-      "type": "consumable"
+    # Energy costs for actions
+    ENERGY_COSTS = {
+      "move": 1,     # Basic movement
+      "attack": 3,   # Fighting a monster
+      "shop": 0,     # Checking the shop (free)
+      "use_item": 2  # Using an item
     }
-  }
 
-  # --------------------------------------------------
-  # HELPER FUNCTIONS
-  # --------------------------------------------------
-  def generate_map():
-    """Creates a 100x100 map with random 'COIN', 'TRAP', 'MONSTER', 'HEALTH', or 'EMPTY' tiles."""
-    plugin.P(f"Starting map generation for a {GRID_WIDTH}x{GRID_HEIGHT} grid")
-    start_time = plugin.time()
-    
-    # Define biomes and their specifications
-    biomes = {
-      "FOREST": {
-        "emoji": "🌲",
-        "description": "A dense forest with healing herbs",
-        "tile_probs": {
-          "COIN": 0.10,
-          "TRAP": 0.05,   # Fewer traps in forest
-          "MONSTER": 0.10,
-          "HEALTH": 0.15, # More health tiles in forest
-          "EMPTY": 0.60
-        }
+    # Movement commands mapped to directions, and directions to (dx, dy) steps
+    DIRECTION_ALIASES = {
+      "n": "up", "s": "down", "e": "right", "w": "left",
+      "north": "up", "south": "down", "east": "right", "west": "left"
+    }
+    DIRECTION_DELTAS = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+
+    # --------------------------------------------------
+    # SHOP FUNCTIONS
+    # --------------------------------------------------
+    # Shop items configuration
+    SHOP_ITEMS = {
+      "health_potion": {
+        "name": "Health Potion 🧪",
+        "description": "Restores 5 health points",
+        "price": 5,
+        "type": "consumable"
       },
-      "LAVA_CAVES": {
-        "emoji": "🌋",
-        "description": "Hot caves with dangerous traps but valuable treasures",
-        "tile_probs": {
-          "COIN": 0.15,   # More treasures in caves
-          "TRAP": 0.20,   # More traps in caves
-          "MONSTER": 0.15,
-          "HEALTH": 0.05,
-          "EMPTY": 0.45
-        }
+      "sword": {
+        "name": "Sword ⚔️",
+        "description": "Increases your attack by 1 (reduces monster damage)",
+        "price": 15,
+        "type": "weapon",
+        "attack_bonus": 1
       },
-      "ICE_WASTES": {
-        "emoji": "❄️",
-        "description": "Frozen wasteland that slows movement",
-        "tile_probs": {
-          "COIN": 0.10,
-          "TRAP": 0.10,
-          "MONSTER": 0.15,
-          "HEALTH": 0.05,
-          "EMPTY": 0.60
-        },
-        "energy_multiplier": 1.5  # Movement costs more energy here
+      "shield": {
+        "name": "Shield 🛡️",
+        "description": "Adds 10% damage reduction",
+        "price": 20,
+        "type": "armor",
+        "damage_reduction_bonus": 0.1
       },
-      "PLAINS": {  # Default biome
-        "emoji": "🌾",
-        "description": "Flat plains with balanced features",
-        "tile_probs": {
-          "COIN": 0.10,
-          "TRAP": 0.10,
-          "MONSTER": 0.10,
-          "HEALTH": 0.05,
-          "EMPTY": 0.65
-        }
+      "amulet": {
+        "name": "Magic Amulet 🔮",
+        "description": "Increases max health by 3",
+        "price": 25,
+        "type": "accessory",
+        "max_health_bonus": 3
+      },
+      "boots": {
+        "name": "Speed Boots 👢",
+        "description": "5% chance to avoid all damage",
+        "price": 30,
+        "type": "accessory",
+        "dodge_chance": 0.05
+      },
+      "map_scroll": {
+        "name": "Map Scroll 📜",
+        "description": "Reveals more of the map when used",
+        "price": 10,
+        "type": "consumable"
+      },
+      "energy_drink": {
+        "name": "Energy Drink 🧃",
+        "description": "Restores 10 energy points",
+        "price": 7,
+        "type": "consumable"
+      },
+      "bomb": {
+        "name": "Bomb 💣",
+        "description": "Deals 5 damage to a monster before combat starts",
+        "price": 15,
+        "type": "consumable"
       }
     }
-    
-    # Generate biome regions using noise (simplified with basic division)
-    plugin.P("Generating biome regions...")
-    
-    new_map = []
-    plugin.P("Starting to populate map rows...")
-    
-    # Track tile distribution for logging
-    tile_counts = {"COIN": 0, "TRAP": 0, "MONSTER": 0, "HEALTH": 0, "EMPTY": 0}
-    biome_counts = {biome: 0 for biome in biomes}
-    monster_level_counts = {}
-    
-    for y in plugin.np.arange(0, GRID_HEIGHT):
-      if y % 10 == 0:
-        plugin.P(f"Generating row {y}/{GRID_HEIGHT}...")
-        
-      row = []
-      for x in plugin.np.arange(0, GRID_WIDTH):
-        # Determine biome based on location in the map (simple division into quadrants)
-        if x < GRID_WIDTH/2 and y < GRID_HEIGHT/2:
-          biome_type = "FOREST"
-        elif x >= GRID_WIDTH/2 and y < GRID_HEIGHT/2:
-          biome_type = "LAVA_CAVES"
-        elif x < GRID_WIDTH/2 and y >= GRID_HEIGHT/2:
-          biome_type = "ICE_WASTES"
-        else:
-          biome_type = "PLAINS"
-        
-        biome_counts[biome_type] += 1
-        biome_data = biomes[biome_type]
-        
-        # Use biome-specific tile probabilities
-        probs = biome_data["tile_probs"]
-        tile_type = plugin.np.random.choice(
-            ["COIN", "TRAP", "MONSTER", "HEALTH", "EMPTY"],
-            p=[probs["COIN"], probs["TRAP"], probs["MONSTER"], probs["HEALTH"], probs["EMPTY"]]
-        )
-        tile_counts[tile_type] += 1
-        
-        # For monsters, calculate level with bias towards lower levels
-        monster_level = 1
-        if tile_type == "MONSTER":
-          # Calculate distance from center as a percentage (0-1)
-          center_x, center_y = GRID_WIDTH // 2, GRID_HEIGHT // 2
-          dx, dy = x - center_x, y - center_y
-          distance = plugin.np.sqrt(dx*dx + dy*dy)
-          max_distance = plugin.np.sqrt(center_x*center_x + center_y*center_y)
-          distance_percent = distance / max_distance
-          
-          # Apply a pyramid distribution for monster levels
-          # Use random number with weighted probability
-          rand = plugin.np.random.random()
-          
-          # Probability weights for each level (must sum to 1.0)
-          level_weights = {
-            1: 0.30,  # 30% chance for level 1
-            2: 0.20,  # 20% chance for level 2
-            3: 0.15,  # 15% chance for level 3
-            4: 0.10,  # 10% chance for level 4
-            5: 0.08,  # 8% chance for level 5
-            6: 0.07,  # 7% chance for level 6
-            7: 0.05,  # 5% chance for level 7
-            8: 0.03,  # 3% chance for level 8
-            9: 0.02   # 2% chance for level 9
-          }
-          
-          # Determine monster level based on random number and weights
-          cumulative_prob = 0
-          monster_level = 1  # Default to level 1
-          for level, weight in level_weights.items():
-            cumulative_prob += weight
-            if rand <= cumulative_prob:
-              monster_level = level
-              break
-          
-          # Track monster level distribution
-          if monster_level not in monster_level_counts:
-            monster_level_counts[monster_level] = 0
-          monster_level_counts[monster_level] += 1
-        
-        row.append({
-            "type": tile_type,
-            "visible": False,
-            "monster_level": monster_level if tile_type == "MONSTER" else 0,
-            "monster_type": get_monster_type_for_level(monster_level) if tile_type == "MONSTER" else "",
-            "biome": biome_type,
-            "biome_emoji": biome_data["emoji"]
-        })
-      new_map.append(row)
-    
-    # Set starting point to empty and visible
-    new_map[0][0] = {"type": "EMPTY", "visible": True, "monster_level": 0, "biome": "PLAINS", "biome_emoji": biomes["PLAINS"]["emoji"]}
-    
-    # Log tile distribution statistics
-    total_tiles = GRID_WIDTH * GRID_HEIGHT
-    plugin.P(f"Map generation complete! Generated {total_tiles} tiles in {plugin.time() - start_time:.2f} seconds")
-    plugin.P(f"Tile distribution summary:")
-    for tile_type, count in tile_counts.items():
-      percentage = (count / total_tiles) * 100
-      plugin.P(f"  {tile_type}: {count} tiles ({percentage:.2f}%)")
-    
-    # Log biome distribution
-    plugin.P(f"\nBiome distribution:")
-    for biome_type, count in biome_counts.items():
-      percentage = (count / total_tiles) * 100
-      plugin.P(f"  {biome_type}: {count} tiles ({percentage:.2f}%)")
-    
-    if monster_level_counts:
-      plugin.P(f"\nMonster level distribution:")
-      total_monsters = tile_counts["MONSTER"]
-      for level in sorted(monster_level_counts.keys()):
-        count = monster_level_counts[level]
-        percentage = (count / total_monsters) * 100
-        plugin.P(f"  Level {level}: {count} monsters ({percentage:.2f}%)")
-    
-    return new_map
-
-  def find_random_empty_spot(game_map):
-    """
-    Finds a random empty spot on the map.
-    Returns tuple of (x, y) coordinates or (0, 0) if no empty spots found.
-    """
-    empty_spots = []
-    for y in range(GRID_HEIGHT):
-      for x in range(GRID_WIDTH):
-        if game_map[y][x]["type"] == "EMPTY":
-          empty_spots.append((x, y))
-    
-    if empty_spots:
-      # Convert empty_spots to numpy array for random choice
-      empty_spots_array = plugin.np.array(empty_spots)
-      random_index = plugin.np.random.randint(0, len(empty_spots))
-      return tuple(empty_spots_array[random_index])
-    
-    return (0, 0)  # Fallback to origin if no empty spots found
 
-  def create_new_player():
-    """Creates a new player dict with default stats."""
-    level_1_data = LEVEL_DATA[1]
-    
-    # Find random empty spot for initial spawn
-    spawn_x, spawn_y = find_random_empty_spot(plugin.obj_cache["shared_map"])
-    
-    # Make spawn location and surroundings visible
-    plugin.obj_cache["shared_map"][spawn_y][spawn_x]["visible"] = True
-    
-    # Reveal surroundings around the spawn point
-    for dy in range(-1, 2):
-      for dx in range(-1, 2):
-        nx, ny = spawn_x + dx, spawn_y + dy
-        if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
-          plugin.obj_cache["shared_map"][ny][nx]["visible"] = True
-    
-    return {
-        "position": (spawn_x, spawn_y),
-        "previous_position": (spawn_x, spawn_y),  # Initialize previous position
-        "coins": 0,
-        "health": level_1_data["max_hp"],
-        "max_health": level_1_data["max_hp"],
-        "energy": level_1_data["max_energy"],
-        "max_energy": level_1_data["max_energy"],
-        "damage_reduction": level_1_data["damage_reduction"],
-        "attack": 0,
-        "dodge_chance": 0,
-        "level": 1,
-        "xp": 0,
-        "next_level_xp": level_1_data["next_level_xp"],
-        "hp_regen_rate": level_1_data["hp_regen_rate"],
-        "energy_regen_rate": level_1_data["energy_regen_rate"],
-        "last_update_time": plugin.time(),  # Track last update for regeneration with correct function
-        "last_message_time": plugin.time(),  # Track when the player last sent a message
-        "status": "exploring",  # Player's current state: exploring, fighting, recovering
-        "status_since": plugin.time(),  # When the current status was set
-        "inventory": {
-            "health_potion": 0,
-            "map_scroll": 0,
-            "energy_drink": 0,
-            "bomb": 0
+    # --------------------------------------------------
+    # HELPER FUNCTIONS
+    # --------------------------------------------------
+    def generate_map():
+      """
+      Creates a 100x100 map with random 'COIN', 'TRAP', 'MONSTER', 'HEALTH', or 'EMPTY' tiles.
+      The map is a dict of (GRID_HEIGHT, GRID_WIDTH) NumPy grids: uint8 codes for "type",
+      "monster_level", "monster_type" and "biome", and a bool "visible" grid.
+      """
+      plugin.P(f"Starting map generation for a {GRID_WIDTH}x{GRID_HEIGHT} grid")
+      start_time = plugin.time()
+    
+      # Define biomes and their specifications
+      biomes = {
+        "FOREST": {
+          "emoji": "🌲",
+          "description": "A dense forest with healing herbs",
+          "tile_probs": {
+            "COIN": 0.10,
+            "TRAP": 0.05,   # Fewer traps in forest
+            "MONSTER": 0.10,
+            "HEALTH": 0.15, # More health tiles in forest
+            "EMPTY": 0.60
+          }
+        },
+        "LAVA_CAVES": {
+          "emoji": "🌋",
+          "description": "Hot caves with dangerous traps but valuable treasures",
+          "tile_probs": {
+            "COIN": 0.15,   # More treasures in caves
+            "TRAP": 0.20,   # More traps in caves
+            "MONSTER": 0.15,
+            "HEALTH": 0.05,
+            "EMPTY": 0.45
+          }
+        },
+        "ICE_WASTES": {
+          "emoji": "❄️",
+          "description": "Frozen wasteland that slows movement",
+          "tile_probs": {
+            "COIN": 0.10,
+            "TRAP": 0.10,
+            "MONSTER": 0.15,
+            "HEALTH": 0.05,
+            "EMPTY": 0.60
+          },
+          "energy_multiplier": 1.5  # Movement costs more energy here
         },
-        "equipment": {
-            "weapon": None,
-            "armor": None,
-            "accessory": []
+        "PLAINS": {  # Default biome
+          "emoji": "🌾",
+          "description": "Flat plains with balanced features",
+          "tile_probs": {
+            "COIN": 0.10,
+            "TRAP": 0.10,
+            "MONSTER": 0.10,
+            "HEALTH": 0.05,
+            "EMPTY": 0.65
+          }
         }
-    }
-
-  def handle_fight_command(player, game_map):
-    """
-    Handles the /fight command when a player decides to fight a monster.
-    Initiates combat with a monster at the player's current position.
-    """
-    # Only allow fighting if the player is in "prepare_to_fight" status
-    if player["status"] != "prepare_to_fight":
-      return "There's nothing to fight here!"
-    
-    # Get player's position and monster level
-    x, y = player["position"]
-    monster_level = game_map[y][x]["monster_level"]
-    
-    # Get or generate monster type
-    if "monster_type" not in game_map[y][x]:
-      game_map[y][x]["monster_type"] = get_monster_type_for_level(monster_level)
+      }
     
-    monster_type = game_map[y][x]["monster_type"]
-    monster_name = MONSTER_TYPES[monster_type]["name"]
+      # Generate biome regions using noise (simplified with basic division)
+      plugin.P("Generating biome regions...")
+      half_w, half_h = (GRID_WIDTH + 1) // 2, (GRID_HEIGHT + 1) // 2
+      # Simple division into quadrants as (biome, rows, columns)
+      quadrants = [
+        ("FOREST", slice(0, half_h), slice(0, half_w)),
+        ("LAVA_CAVES", slice(0, half_h), slice(half_w, GRID_WIDTH)),
+        ("ICE_WASTES", slice(half_h, GRID_HEIGHT), slice(0, half_w)),
+        ("PLAINS", slice(half_h, GRID_HEIGHT), slice(half_w, GRID_WIDTH)),
+      ]
+
+      # Own generator for the map draws, leaving the global NumPy random state untouched
+      rng = plugin.np.random.default_rng()
+
+      def sample_codes(codes, weights, size):
+        """Draws `size` codes with the given weights by inverting their cumulative distribution."""
+        cumulative = plugin.np.cumsum(weights)
+        cumulative[-1] = 1.0  # Float rounding must not leave draws past the last code
+        draws = plugin.np.searchsorted(cumulative, rng.random(size), side="right")
+        return plugin.np.asarray(codes, dtype=plugin.np.uint8)[draws]
+
+      # Draw all the tiles of a biome with one vectorized call instead of one call per tile
+      plugin.P("Drawing the map tiles...")
+      type_grid = plugin.np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=plugin.np.uint8)
+      biome_grid = plugin.np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=plugin.np.uint8)
+      for biome_type, rows, cols in quadrants:
+        probs = biomes[biome_type]["tile_probs"]
+        region = type_grid[rows, cols]
+        region[:] = sample_codes(
+          [TILE_TYPES.index(tile_type) for tile_type in probs], list(probs.values()), region.shape
+        )
+        biome_grid[rows, cols] = BIOME_TYPES.index(biome_type)
+
+      # Pyramid distribution for monster levels, biased towards lower levels
+      # Probability weights for each level (must sum to 1.0)
+      level_weights = {
+        1: 0.30,  # 30% chance for level 1
+        2: 0.20,  # 20% chance for level 2
+        3: 0.15,  # 15% chance for level 3
+        4: 0.10,  # 10% chance for level 4
+        5: 0.08,  # 8% chance for level 5
+        6: 0.07,  # 7% chance for level 6
+        7: 0.05,  # 5% chance for level 7
+        8: 0.03,  # 3% chance for level 8
+        9: 0.02   # 2% chance for level 9
+      }
+      monster_mask = type_grid == TILE_MONSTER
+      level_grid = plugin.np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=plugin.np.uint8)
+      level_grid[monster_mask] = sample_codes(
+        list(level_weights), list(level_weights.values()), int(monster_mask.sum())
+      )
+
+      # Each monster gets one of the types whose level range covers its level
+      monster_type_grid = plugin.np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=plugin.np.uint8)
+      for level in level_weights:
+        level_mask = level_grid == level
+        suitable_codes = [
+          MONSTER_TYPE_CODES.index(monster_type) for monster_type, stats in MONSTER_TYPES.items()
+          if stats["min_level"] <= level <= stats["max_level"]
+        ] or [MONSTER_TYPE_CODES.index("goblin")]
+        monster_type_grid[level_mask] = rng.choice(suitable_codes, size=int(level_mask.sum()))
+
+      # Track tile distribution for logging
+      tile_counts = dict(zip(TILE_TYPES, plugin.np.bincount(type_grid.ravel(), minlength=len(TILE_TYPES)).tolist()))
+      biome_counts = dict(zip(BIOME_TYPES, plugin.np.bincount(biome_grid.ravel(), minlength=len(BIOME_TYPES)).tolist()))
+      levels, counts = plugin.np.unique(level_grid[monster_mask], return_counts=True)
+      monster_level_counts = dict(zip(levels.tolist(), counts.tolist()))
+
+      new_map = {
+        "type": type_grid,
+        "visible": plugin.np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=bool),
+        "monster_level": level_grid,
+        "monster_type": monster_type_grid,
+        "biome": biome_grid,
+      }
     
-    # Store the monster_type in player data for combat consistency
-    player["current_monster_type"] = monster_type
+      # Set starting point to empty and visible
+      type_grid[0, 0], level_grid[0, 0], monster_type_grid[0, 0] = TILE_EMPTY, 0, 0
+      biome_grid[0, 0] = BIOME_TYPES.index("PLAINS")
+      new_map["visible"][0, 0] = True
     
-    # Consume energy for combat
-    player["energy"] -= ENERGY_COSTS["attack"]
+      # Log tile distribution statistics
+      total_tiles = GRID_WIDTH * GRID_HEIGHT
+      plugin.P(f"Map generation complete! Generated {total_tiles} tiles in {plugin.time() - start_time:.2f} seconds")
+      plugin.P(f"Tile distribution summary:")
+      for tile_type, count in tile_counts.items():
+        percentage = (count / total_tiles) * 100
+        plugin.P(f"  {tile_type}: {count} tiles ({percentage:.2f}%)")
+    
+      # Log biome distribution
+      plugin.P(f"\nBiome distribution:")
+      for biome_type, count in biome_counts.items():
+        percentage = (count / total_tiles) * 100
+        plugin.P(f"  {biome_type}: {count} tiles ({percentage:.2f}%)")
+    
+      if monster_level_counts:
+        plugin.P(f"\nMonster level distribution:")
+        total_monsters = tile_counts["MONSTER"]
+        for level in sorted(monster_level_counts.keys()):
+          count = monster_level_counts[level]
+          percentage = (count / total_monsters) * 100
+          plugin.P(f"  Level {level}: {count} monsters ({percentage:.2f}%)")
+    
+      return new_map
+
+    def find_random_empty_spot(game_map):
+      """
+      Finds a random empty spot on the map.
+      Returns tuple of (x, y) coordinates or (0, 0) if no empty spots found.
+      """
+      empty_spots = plugin.np.flatnonzero(game_map["type"] == TILE_EMPTY)
+    
+      if empty_spots.size:
+        # Flat indices are row-major, so divmod by the width gives (y, x)
+        y, x = divmod(int(empty_spots[plugin.np.random.randint(0, empty_spots.size)]), GRID_WIDTH)
+        return (x, y)
+    
+      return (0, 0)  # Fallback to origin if no empty spots found
+
+    def create_new_player(player=None):
+      """
+      Creates a new player dict with default stats.
+
+      When `player` is given (a restart via /start) it is reset in place, reusing
+      the player, inventory and equipment dicts instead of allocating new ones.
+      """
+      level_1_data = LEVEL_DATA[1]
+    
+      # Find random empty spot for initial spawn
+      spawn_x, spawn_y = find_random_empty_spot(plugin.obj_cache["shared_map"])
+    
+      # Make spawn location and surroundings visible
+      plugin.obj_cache["shared_map"]["visible"][max(0, spawn_y - 1):spawn_y + 2, max(0, spawn_x - 1):spawn_x + 2] = True
+
+      if player is None:
+        player, inventory, equipment = {}, {}, {"accessory": []}
+      else:
+        inventory, equipment = player["inventory"], player["equipment"]
+        equipment["accessory"].clear()
+        player.clear()
+      #end if
+      inventory.update(health_potion=0, map_scroll=0, energy_drink=0, bomb=0)
+      equipment.update(weapon=None, armor=None)
+
+      now = plugin.time()
+      player.update(
+          x=spawn_x,
+          y=spawn_y,
+          prev_x=spawn_x,  # Initialize previous position
+          prev_y=spawn_y,
+          coins=0,
+          health=level_1_data["max_hp"],
+          max_health=level_1_data["max_hp"],
+          energy=level_1_data["max_energy"],
+          max_energy=level_1_data["max_energy"],
+          damage_reduction=level_1_data["damage_reduction"],
+          attack=0,
+          dodge_chance=0,
+          level=1,
+          xp=0,
+          next_level_xp=level_1_data["next_level_xp"],
+          hp_regen_rate=level_1_data["hp_regen_rate"],
+          energy_regen_rate=level_1_data["energy_regen_rate"],
+          last_update_time=now,  # Track last update for regeneration with correct function
+          last_message_time=now,  # Track when the player last sent a message
+          status="exploring",  # Player's current state: exploring, fighting, recovering
+          status_since=now,  # When the current status was set
+          inventory=inventory,
+          equipment=equipment,
+      )
+      return player
+
+    def handle_fight_command(player, game_map, user_id):
+      """
+      Handles the /fight command when a player decides to fight a monster.
+      Initiates combat with a monster at the player's current position.
+      """
+      # Only allow fighting if the player is in "prepare_to_fight" status
+      if player["status"] != "prepare_to_fight":
+        return "There's nothing to fight here!"
+    
+      # Get player's position and monster level
+      x, y = player["x"], player["y"]
+      monster_level = int(game_map["monster_level"][y, x])
+    
+      # Get or generate monster type
+      monster_type = get_tile_monster_type(game_map, x, y)
+      monster_name = MONSTER_TYPES[monster_type]["name"]
+    
+      # Store the monster_type in player data for combat consistency
+      player["current_monster_type"] = monster_type
     
-    # Set player status to fighting to prevent the timer-based combat initiation
-    player = update_player_status(player, "fighting")
+      # Consume energy for combat
+      player["energy"] -= ENERGY_COSTS["attack"]
     
-    # Initialize combat session manually
-    # Find user_id by looking for this player object in the users cache
-    user_id = None
-    for uid, p in plugin.obj_cache.get("users", {}).items():
-      if p is player:
-        user_id = uid
-        break
+      # Set player status to fighting to prevent the timer-based combat initiation
+      player = update_player_status(player, "fighting")
     
-    if user_id and "combat" not in plugin.obj_cache:
-      plugin.obj_cache["combat"] = {}
-      
-    if user_id:
-      plugin.obj_cache["combat"][user_id] = {
+      # Initialize combat session manually
+      plugin.obj_cache.setdefault("combat", {})[user_id] = {
         "monster": create_monster_of_type(monster_type, monster_level),
         "last_round_time": plugin.time(),
         "round_number": 0,
         "initial_player_health": player["health"]
       }
     
-    return f"⚔️ You decide to fight the {monster_name}!\nCombat will proceed automatically."
+      return f"⚔️ You decide to fight the {monster_name}!\nCombat will proceed automatically."
 
-  def handle_flee_command(player, game_map):
-    """
-    Handles the /flee command when a player decides to flee from a monster.
-    Moves player back to previous position and sets status to exploring.
-    """
-    # Allow fleeing if player is in prepare_to_fight or fighting status
-    if player["status"] != "prepare_to_fight" and player["status"] != "fighting":
-      return "You're not in danger! No need to flee."
-    
-    # Get monster info at current position
-    x, y = player["position"]
-    monster_level = game_map[y][x]["monster_level"]
+    def handle_flee_command(player, game_map):
+      """
+      Handles the /flee command when a player decides to flee from a monster.
+      Moves player back to previous position and sets status to exploring.
+      """
+      # Allow fleeing if player is in prepare_to_fight or fighting status
+      if player["status"] != "prepare_to_fight" and player["status"] != "fighting":
+        return "You're not in danger! No need to flee."
     
-    # Get or generate monster type
-    if "monster_type" not in game_map[y][x]:
-      game_map[y][x]["monster_type"] = get_monster_type_for_level(monster_level)
+      # Get monster info at current position
+      x, y = player["x"], player["y"]
     
-    monster_type = game_map[y][x]["monster_type"]
-    monster_name = MONSTER_TYPES[monster_type]["name"]
+      # Get or generate monster type
+      monster_type = get_tile_monster_type(game_map, x, y)
+      monster_name = MONSTER_TYPES[monster_type]["name"]
     
-    # Get biome information for energy cost
-    biome_type = game_map[y][x].get("biome", "PLAINS")
+      # Get biome information for energy cost
+      biome_type = BIOME_TYPES[game_map["biome"][y, x]]
     
-    # Small energy cost for fleeing, adjusted by biome
-    flee_energy_cost = 1
+      # Small energy cost for fleeing, adjusted by biome
+      flee_energy_cost = 1
     
-    # Define biomes and their energy multipliers (reference)
-    biomes = {
-      "FOREST": { "energy_multiplier": 1.0 },
-      "LAVA_CAVES": { "energy_multiplier": 1.2 },
-      "ICE_WASTES": { "energy_multiplier": 1.5 },
-      "PLAINS": { "energy_multiplier": 1.0 }
-    }
+      # Define biomes and their energy multipliers (reference)
+      biomes = {
+        "FOREST": { "energy_multiplier": 1.0 },
+        "LAVA_CAVES": { "energy_multiplier": 1.2 },
+        "ICE_WASTES": { "energy_multiplier": 1.5 },
+        "PLAINS": { "energy_multiplier": 1.0 }
+      }
     
-    # Apply biome-specific energy multiplier
-    if biome_type in biomes:
-      energy_multiplier = biomes[biome_type].get("energy_multiplier", 1.0)
-      flee_energy_cost = int(flee_energy_cost * energy_multiplier)
+      # Apply biome-specific energy multiplier
+      if biome_type in biomes:
+        energy_multiplier = biomes[biome_type].get("energy_multiplier", 1.0)
+        flee_energy_cost = int(flee_energy_cost * energy_multiplier)
     
-    # Apply flee action
-    if player["energy"] < flee_energy_cost:
-      # If not enough energy, player still flees but with consequences
-      player["energy"] = 0
-      player = update_player_status(player, "recovering")
-    else:
-      player["energy"] -= flee_energy_cost
-      player = update_player_status(player, "exploring")
+      # Apply flee action
+      if player["energy"] < flee_energy_cost:
+        # If not enough energy, player still flees but with consequences
+        player["energy"] = 0
+        player = update_player_status(player, "recovering")
+      else:
+        player["energy"] -= flee_energy_cost
+        player = update_player_status(player, "exploring")
     
-    # Move player back to previous position
-    old_pos = player["position"]
-    player["position"] = player["previous_position"]
+      # Move player back to previous position
+      old_x, old_y = player["x"], player["y"]
+      player["x"], player["y"] = player["prev_x"], player["prev_y"]
     
-    # Ensure the monster remains on the tile player fled from
-    # (this is important to preserve the game state)
-    if game_map[old_pos[1]][old_pos[0]]["type"] == "MONSTER":
-      # Monster remains on the tile
-      pass
+      # Ensure the monster remains on the tile player fled from
+      # (this is important to preserve the game state)
+      if game_map["type"][old_y, old_x] == TILE_MONSTER:
+        # Monster remains on the tile
+        pass
     
-    # Reveal surroundings at the new position
-    reveal_surroundings(player, game_map)
+      # Reveal surroundings at the new position
+      reveal_surroundings(player, game_map)
     
-    # Generate map view from new position
-    map_view = visualize_map(player, game_map)
+      # Generate map view from new position
+      map_view = visualize_map(player, game_map)
     
-    return f"{map_view}\n\n💨 You wisely decide to flee from the {monster_name}!\nYou return to your previous position at {player['position']}.\nEnergy: -{flee_energy_cost}"
-
-  def check_health(player):
-    """Checks if the player's health is below 0 and returns a restart message if true."""
-    if player["health"] <= 0:
-      return True, "You have died! Game over.\nUse /start to play again."
-    return False, ""
+      return f"{map_view}\n\n💨 You wisely decide to flee from the {monster_name}!\nYou return to your previous position at ({player['x']}, {player['y']}).\nEnergy: -{flee_energy_cost}"
 
-
-  def reveal_surroundings(player, game_map):
-    """Reveals the tiles around the player."""
-    x, y = player["position"]
-    for dy in range(-1, 2):
-      for dx in range(-1, 2):
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
-          game_map[ny][nx]["visible"] = True
-
-  def reveal_extended_map(player, game_map):
-    """Reveals a larger portion of the map (used by map scroll)."""
-    x, y = player["position"]
-    for dy in range(-3, 4):
-      for dx in range(-3, 4):
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
-          game_map[ny][nx]["visible"] = True
-
-  def check_exploration_progress(game_map):
-    """Calculates the percentage of the map that has been explored (for informational purposes only)."""
-    total_tiles = GRID_WIDTH * GRID_HEIGHT
-    visible_tiles = sum(1 for row in game_map for tile in row if tile["visible"])
-    return (visible_tiles / total_tiles) * 100
-
-  def visualize_map(player, game_map):
-    """Creates a visual representation of the nearby map."""
-    x, y = player["position"]
-    view_distance = 2
-    
-    # Get status emoji for the player
-    player_emoji = "🧙"  # Default player emoji
-    if player["status"] == "fighting":
-      player_emoji = "⚔️"  # Fighting emoji
-    elif player["status"] == "recovering":
-      player_emoji = "💤"  # Recovering emoji
-    elif player["status"] == "prepare_to_fight":
-      player_emoji = "⚠️"  # Warning emoji for prepare_to_fight
-    
-    # Get player's current biome
-    current_tile = game_map[y][x]
-    current_biome = current_tile.get("biome", "PLAINS")
-    biome_emoji = current_tile.get("biome_emoji", "🌾")
+    def check_health(player):
+      """Checks if the player's health is below 0 and returns a restart message if true."""
+      if player["health"] <= 0:
+        return True, "You have died! Game over.\nUse /start to play again."
+      return False, ""
+
+
+    def random_int(low, high):
+      """
+      Returns a random int in [low, high) like `np.random.randint`, but from a scalar float draw.
+      Plugin code cannot import `random` and a scalar `randint` call costs ~4x more than `random()`.
+      """
+      return low + int(plugin.np.random.random() * (high - low))
+
+    def reveal_surroundings(player, game_map):
+      """Reveals the tiles around the player."""
+      x, y = player["x"], player["y"]
+      # Slices stop at the grid edges on their own, so only the lower bounds need clamping
+      game_map["visible"][max(0, y - 1):y + 2, max(0, x - 1):x + 2] = True
+
+    def reveal_extended_map(player, game_map):
+      """Reveals a larger portion of the map (used by map scroll)."""
+      x, y = player["x"], player["y"]
+      game_map["visible"][max(0, y - 3):y + 4, max(0, x - 3):x + 4] = True
+
+    def check_exploration_progress(game_map):
+      """Calculates the percentage of the map that has been explored (for informational purposes only)."""
+      total_tiles = GRID_WIDTH * GRID_HEIGHT
+      visible_tiles = int(plugin.np.count_nonzero(game_map["visible"]))
+      return (visible_tiles / total_tiles) * 100
+
+    def visualize_map(player, game_map):
+      """Creates a visual representation of the nearby map."""
+      x, y = player["x"], player["y"]
+      view_distance = 2
+    
+      # Get status emoji for the player
+      player_emoji = "🧙"  # Default player emoji
+      if player["status"] == "fighting":
+        player_emoji = "⚔️"  # Fighting emoji
+      elif player["status"] == "recovering":
+        player_emoji = "💤"  # Recovering emoji
+      elif player["status"] == "prepare_to_fight":
+        player_emoji = "⚠️"  # Warning emoji for prepare_to_fight
+    
+      # Get player's current biome
+      current_biome = BIOME_TYPES[game_map["biome"][y, x]]
+      biome_emoji = BIOME_EMOJIS[game_map["biome"][y, x]]
       
-    map_view = f"🗺️ Your location: ({x}, {y}) | Status: {player_emoji} {player['status'].capitalize()}\n"
-    map_view += f"Biome: {biome_emoji} {current_biome.replace('_', ' ')}\n\n"
-
-    for ny in range(max(0, y - view_distance), min(GRID_HEIGHT, y + view_distance + 1)):
-      for nx in range(max(0, x - view_distance), min(GRID_WIDTH, x + view_distance + 1)):
-        if (nx, ny) == (x, y):
-          map_view += f"{player_emoji} "  # Player with status-specific emoji
-        elif game_map[ny][nx]["visible"]:
-          tile_type = game_map[ny][nx]["type"]
-          # Get biome information
-          biome_type = game_map[ny][nx].get("biome", "PLAINS")
-          biome_emoji = game_map[ny][nx].get("biome_emoji", "")
-          
-          # Add a small indicator of biome to the background
-          if tile_type == "COIN":
-            map_view += "💰 "
-          elif tile_type == "TRAP":
-            map_view += "🔥 "
-          elif tile_type == "MONSTER":
-            # Different monster emoji based on level clusters
-            monster_level = game_map[ny][nx]["monster_level"]
-            if monster_level <= 3:
-                map_view += "👹 "  # Levels 1-3: Goblin
-            elif monster_level <= 6:
-                map_view += "👺 "  # Levels 4-6: Orc
-            elif monster_level <= 9:
-                map_view += "👿 "  # Levels 7-9: Demon
-          elif tile_type == "HEALTH":
-            map_view += "❤️ "
-          else:
-            # For empty tiles, show the biome background
-            map_view += f"{biome_emoji} "
-        else:
-          map_view += "⬛ "  # Unexplored
-      map_view += "\n"
-
-    # Add map exploration stats
-    exploration = check_exploration_progress(game_map)
-    map_view += f"Map Exploration: {int(exploration)}%"
+      map_view = f"🗺️ Your location: ({x}, {y}) | Status: {player_emoji} {player['status'].capitalize()}\n"
+      map_view += f"Biome: {biome_emoji} {current_biome.replace('_', ' ')}\n\n"
+
+      # Slice the view window once and read it back as plain lists
+      y0, y1 = max(0, y - view_distance), min(GRID_HEIGHT, y + view_distance + 1)
+      x0, x1 = max(0, x - view_distance), min(GRID_WIDTH, x + view_distance + 1)
+      window = zip(
+        game_map["type"][y0:y1, x0:x1].tolist(),
+        game_map["visible"][y0:y1, x0:x1].tolist(),
+        game_map["monster_level"][y0:y1, x0:x1].tolist(),
+        game_map["biome"][y0:y1, x0:x1].tolist(),
+      )
+      rows = []
+      for ny, (types, visible, levels, biomes) in enumerate(window, y0):
+        rows.append("".join(
+          f"{player_emoji} " if (nx, ny) == (x, y)  # Player with status-specific emoji
+          else "⬛ " if not is_visible  # Unexplored
+          else TILE_VIEW_EMOJIS[tile_type] or (
+            MONSTER_VIEW_EMOJIS[level] if tile_type == TILE_MONSTER else BIOME_VIEW_EMOJIS[biome]
+          )
+          for nx, (tile_type, is_visible, level, biome) in enumerate(zip(types, visible, levels, biomes), x0)
+        ))
+      map_view += "\n".join(rows) + "\n"
+
+      # Add map exploration stats
+      exploration = check_exploration_progress(game_map)
+      map_view += f"Map Exploration: {int(exploration)}%"
+    
+      return map_view
+
+    def move_player(player, direction, game_map):
+      """
+      Moves the player, applies tile effects, and returns a response message.
+      Checks for and consumes energy for different actions.
+      """
+      # Check if player is in combat
+      if player["status"] == "fighting":
+        return "You cannot move while in combat! You must defeat the monster first."
+
+      # Check if player is in prepare_to_fight state
+      if player["status"] == "prepare_to_fight":
+        return "You are facing a monster! Use /fight to engage or /flee to retreat."
+
+      # Check if player is recovering
+      if player["status"] == "recovering":
+        return "You cannot move while recovering! Wait until you are fully healed and energized."
+
+      # Check if player is not exploring
+      if player["status"] != "exploring":
+        return "You can only move while exploring!"
+
+      # Store current position as previous position before moving
+      prev_x, prev_y = player["x"], player["y"]
+      player["prev_x"], player["prev_y"] = prev_x, prev_y
+    
+      # Get the current biome of the player before moving
+      prev_biome_type = BIOME_TYPES[game_map["biome"][prev_y, prev_x]]
+    
+      delta = DIRECTION_DELTAS.get(direction)
+      if delta is None:
+        return "You cannot move that way!"
+      x, y = prev_x + delta[0], prev_y + delta[1]
+      if not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT):
+        return "You cannot move that way!"
+
+      # Check what's on the tile we're moving to
+      tile_type = game_map["type"][y, x]
+    
+      # Calculate energy cost for this move
+      energy_cost = ENERGY_COSTS["move"]
+    
+      # Adjust energy cost based on biome
+      biome_type = BIOME_TYPES[game_map["biome"][y, x]]
+      biome_message = ""
+    
+      # Define biomes and their specifications (reference to match generate_map)
+      biomes = {
+        "FOREST": {
+          "emoji": "🌲",
+          "description": "A dense forest with healing herbs",
+          "energy_multiplier": 1.0
+        },
+        "LAVA_CAVES": {
+          "emoji": "🌋",
+          "description": "Hot caves with dangerous traps but valuable treasures",
+          "energy_multiplier": 1.2  # Slightly more energy in hot caves
+        },
+        "ICE_WASTES": {
+          "emoji": "❄️",
+          "description": "Frozen wasteland that slows movement",
+          "energy_multiplier": 1.5  # Movement costs more energy here
+        },
+        "PLAINS": {  # Default biome
+          "emoji": "🌾",
+          "description": "Flat plains with balanced features",
+          "energy_multiplier": 1.0
+        }
+      }
     
-    return map_view
-
-  def move_player(player, direction, game_map):
-    """
-    Moves the player, applies tile effects, and returns a response message.
-    Checks for and consumes energy for different actions.
-    """
-    # Check if player is in combat
-    if player["status"] == "fighting":
-      return "You cannot move while in combat! You must defeat the monster first."
-
-    # Check if player is in prepare_to_fight state
-    if player["status"] == "prepare_to_fight":
-      return "You are facing a monster! Use /fight to engage or /flee to retreat."
-
-    # Check if player is recovering
-    if player["status"] == "recovering":
-      return "You cannot move while recovering! Wait until you are fully healed and energized."
-
-    # Check if player is not exploring
-    if player["status"] != "exploring":
-      return "You can only move while exploring!"
-
-    # Store current position as previous position before moving
-    prev_x, prev_y = player["position"]
-    player["previous_position"] = (prev_x, prev_y)
-    
-    # Get the current biome of the player before moving
-    prev_biome_type = game_map[prev_y][prev_x].get("biome", "PLAINS")
-    
-    x, y = player["position"]
-
-    if direction == "up" and y > 0:
-      y -= 1
-    elif direction == "down" and y < GRID_HEIGHT - 1:
-      y += 1
-    elif direction == "left" and x > 0:
-      x -= 1
-    elif direction == "right" and x < GRID_WIDTH - 1:
-      x += 1
-    else:
-      return "You cannot move that way!"
-
-    # Check what's on the tile we're moving to
-    new_tile = game_map[y][x]
+      # Apply biome-specific energy multiplier
+      if biome_type in biomes:
+        biome_data = biomes[biome_type]
+        energy_multiplier = biome_data.get("energy_multiplier", 1.0)
+        energy_cost = int(energy_cost * energy_multiplier)
+      
+        # Add biome message ONLY if the player is entering a different biome
+        if biome_type != prev_biome_type:
+          biome_message = f"\nYou've entered {biome_data['emoji']} {biome_type.replace('_', ' ')}! {biome_data['description']}."
     
-    # Calculate energy cost for this move
-    energy_cost = ENERGY_COSTS["move"]
+      # Check if player has enough energy for the move
+      if player["energy"] < energy_cost:
+        # Set player status to recovering if they're too exhausted to move
+        player = update_player_status(player, "recovering")
+        return f"You are too exhausted to move! Energy: {int(player['energy'])}/{player['max_energy']}\nWait for your energy to regenerate."
     
-    # Adjust energy cost based on biome
-    biome_type = new_tile.get("biome", "PLAINS")
-    biome_message = ""
+      # Consume energy
+      player["energy"] -= energy_cost
     
-    # Define biomes and their specifications (reference to match generate_map)
-    biomes = {
-      "FOREST": {
-        "emoji": "🌲",
-        "description": "A dense forest with healing herbs",
-        "energy_multiplier": 1.0
-      },
-      "LAVA_CAVES": {
-        "emoji": "🌋",
-        "description": "Hot caves with dangerous traps but valuable treasures",
-        "energy_multiplier": 1.2  # Slightly more energy in hot caves
-      },
-      "ICE_WASTES": {
-        "emoji": "❄️",
-        "description": "Frozen wasteland that slows movement",
-        "energy_multiplier": 1.5  # Movement costs more energy here
-      },
-      "PLAINS": {  # Default biome
-        "emoji": "🌾",
-        "description": "Flat plains with balanced features",
-        "energy_multiplier": 1.0
-      }
-    }
+      # Actually move the player
+      player["x"], player["y"] = x, y
+      reveal_surroundings(player, game_map)
+
+      # Basic movement message
+      msg = f"You moved {direction} to ({x},{y}). Energy: -{energy_cost} "
     
-    # Apply biome-specific energy multiplier
-    if biome_type in biomes:
-      biome_data = biomes[biome_type]
-      energy_multiplier = biome_data.get("energy_multiplier", 1.0)
-      energy_cost = int(energy_cost * energy_multiplier)
-      
-      # Add biome message ONLY if the player is entering a different biome
-      if biome_type != prev_biome_type:
-        biome_message = f"\nYou've entered {biome_data['emoji']} {biome_type.replace('_', ' ')}! {biome_data['description']}."
-    
-    # Check if player has enough energy for the move
-    if player["energy"] < energy_cost:
-      # Set player status to recovering if they're too exhausted to move
-      player = update_player_status(player, "recovering")
-      return f"You are too exhausted to move! Energy: {int(player['energy'])}/{player['max_energy']}\nWait for your energy to regenerate."
-    
-    # Consume energy
-    player["energy"] -= energy_cost
-    
-    # Actually move the player
-    player["position"] = (x, y)
-    tile = game_map[y][x]
-    tile["visible"] = True
-    reveal_surroundings(player, game_map)
-
-    # Basic movement message
-    msg = f"You moved {direction} to ({x},{y}). Energy: -{energy_cost} "
-    
-    if biome_message:
-      msg += biome_message
-    
-    if tile["type"] == "COIN":
-      base_coins = plugin.np.random.randint(1, 3)
-      player["coins"] += base_coins
-      tile["type"] = "EMPTY"
-      msg += f"\nYou found {base_coins} coin(s)! "
-
-    elif tile["type"] == "TRAP":
-      if player["dodge_chance"] > 0 and plugin.np.random.random() < player["dodge_chance"]:
-        msg += "\nYou nimbly avoided a trap! "
-      else:
-        base_damage = plugin.np.random.randint(1, 3)
-        damage = max(1, base_damage)
-        player["health"] -= damage
-        msg += f"\nYou triggered a trap! Health -{damage}. "
-
-    elif tile["type"] == "MONSTER":
-      # Instead of instant combat, initiate prepare_to_fight state
-      monster_level = tile["monster_level"]
-      monster_type = tile.get("monster_type", get_monster_type_for_level(monster_level))
+      if biome_message:
+        msg += biome_message
+    
+      if tile_type == TILE_COIN:
+        base_coins = random_int(1, 3)
+        player["coins"] += base_coins
+        game_map["type"][y, x] = TILE_EMPTY
+        msg += f"\nYou found {base_coins} coin(s)! "
+
+      elif tile_type == TILE_TRAP:
+        if player["dodge_chance"] > 0 and plugin.np.random.random() < player["dodge_chance"]:
+          msg += "\nYou nimbly avoided a trap! "
+        else:
+          base_damage = random_int(1, 3)
+          damage = max(1, base_damage)
+          player["health"] -= damage
+          msg += f"\nYou triggered a trap! Health -{damage}. "
+
+      elif tile_type == TILE_MONSTER:
+        # Instead of instant combat, initiate prepare_to_fight state
+        monster_level = int(game_map["monster_level"][y, x])
+        monster_type = get_tile_monster_type(game_map, x, y)
       
-      # Store the monster type in the tile for consistency
-      tile["monster_type"] = monster_type
+        # Get monster info based on type
+        monster_info = MONSTER_TYPES[monster_type]
+        monster_name = monster_info["name"]
       
-      # Get monster info based on type
-      monster_info = MONSTER_TYPES[monster_type]
-      monster_name = monster_info["name"]
+        # Calculate monster stats
+        hp = monster_info["base_hp"] + (monster_level - 1) * monster_info["hp_per_level"]
+        min_damage = monster_info["min_damage"] + (monster_level - 1) * monster_info["damage_per_level"]
+        max_damage = monster_info["max_damage"] + (monster_level - 1) * monster_info["damage_per_level"]
       
-      # Calculate monster stats
-      hp = monster_info["base_hp"] + (monster_level - 1) * monster_info["hp_per_level"]
-      min_damage = monster_info["min_damage"] + (monster_level - 1) * monster_info["damage_per_level"]
-      max_damage = monster_info["max_damage"] + (monster_level - 1) * monster_info["damage_per_level"]
+        # Store the monster type for combat consistency
+        player["current_monster_type"] = monster_type
       
-      # Store the monster type for combat consistency
-      player["current_monster_type"] = monster_type
-      
-      # Set player status to prepare_to_fight
-      player = update_player_status(player, "prepare_to_fight")
-
-
-      msg += f"\n⚠️⚠️⚠️ You encountered a level {monster_level} {monster_name}!⚠️⚠️⚠️\n\n"
-      msg += f"Monster Stats:\n"
-      msg += f"❤️ HP: {hp}\n"
-      msg += f"⚔️ Damage: {min_damage}-{max_damage}\n"
-      msg += f"✨ XP Reward: {monster_info['xp_reward'] * monster_level}\n"
-      msg += f"💰 Coin Reward: {monster_info['coin_reward'][0] * monster_level}-{monster_info['coin_reward'][1] * monster_level}\n\n"
-      msg += f"You have 5 seconds to decide:\n"
-      msg += f"/fight - Attack the monster\n"
-      msg += f"/flee - Return to your previous position"
-
-    elif tile["type"] == "HEALTH":
-      heal_amount = plugin.np.random.randint(2, 5)
-      player["health"] = min(player["max_health"], player["health"] + heal_amount)
-      msg += f"You found a health potion! Health +{heal_amount}. "
-      tile["type"] = "EMPTY"
-
-    is_dead, death_msg = check_health(player)
-    if is_dead:
-      return death_msg
-
-    map_view = visualize_map(player, game_map)
-    stats = f"Health: {int(player['health'])}/{player['max_health']}, Energy: {int(player['energy'])}/{player['max_energy']}, Coins: {player['coins']}"
-    return f"{map_view}\n{msg}\n{stats}"
-
-  def display_shop(player):
-    """Displays the shop menu with available items."""
-    shop_text = "🏪 SHOP 🏪\n\n"
-    shop_text += f"Your coins: {player['coins']} 💰\n\n"
-    shop_text += "Available Items:\n"
-
-    for item_id, item in SHOP_ITEMS.items():
-      can_afford = "✅" if player["coins"] >= item["price"] else "❌"
-      shop_text += f"{item['name']} - {item['price']} coins {can_afford}\n"
-      shop_text += f"  {item['description']}\n"
-
-    shop_text += "\nTo purchase an item, use /buy <item_name>"
-    shop_text += "\nYou can use spaces or underscores in item names (e.g., 'map scroll' or 'map_scroll')"
-    shop_text += "\nAvailable items: health_potion, sword, shield, amulet, boots, map_scroll, energy_drink, bomb"
-    return shop_text
-
-  def buy_item(player, item_id):
-    """Process the purchase of an item."""
-    if item_id not in SHOP_ITEMS:
-      return f"Item '{item_id}' not found in the shop."
-
-    item = SHOP_ITEMS[item_id]
-
-    # Check if player has enough coins
-    if player["coins"] < item["price"]:
-      return f"You don't have enough coins. You need {item['price']} coins but only have {player['coins']}."
-
-    # Process the purchase based on item type
-    if item["type"] == "consumable":
-      player["inventory"][item_id] += 1
-      msg = f"You purchased {item['name']}. It's in your inventory."
-
-    elif item["type"] == "weapon":
-      # Replace existing weapon
-      old_weapon = player["equipment"]["weapon"]
-      if old_weapon:
-        # Remove old weapon bonuses
-        player["attack"] -= SHOP_ITEMS[old_weapon]["attack_bonus"]
-
-      player["equipment"]["weapon"] = item_id
-      player["attack"] += item["attack_bonus"]
-      msg = f"You equipped {item['name']}! Your attack is now {player['attack']}."
-
-    elif item["type"] == "armor":
-      # Replace existing armor
-      old_armor = player["equipment"]["armor"]
-      if old_armor:
-        # Remove old armor bonuses
-        player["damage_reduction"] -= SHOP_ITEMS[old_armor]["damage_reduction_bonus"]
-
-      player["equipment"]["armor"] = item_id
-      player["damage_reduction"] += item["damage_reduction_bonus"]
-      msg = f"You equipped {item['name']}! Your damage reduction is now {int(player['damage_reduction'] * 100)}%."
-
-    elif item["type"] == "accessory":
-      # Add to accessories (allowing multiple)
-      if item_id in player["equipment"]["accessory"]:
-        return f"You already have {item['name']}."
-
-      player["equipment"]["accessory"].append(item_id)
-
-      # Apply accessory bonuses
-      if "max_health_bonus" in item:
-        player["max_health"] += item["max_health_bonus"]
-        msg = f"You equipped {item['name']}! Your max health is now {player['max_health']}."
-      elif "dodge_chance" in item:
-        player["dodge_chance"] += item["dodge_chance"]
-        msg = f"You equipped {item['name']}! Your dodge chance is now {int(player['dodge_chance'] * 100)}%."
-      else:
-        msg = f"You equipped {item['name']}!"
+        # Set player status to prepare_to_fight
+        player = update_player_status(player, "prepare_to_fight")
+
+
+        msg += f"\n⚠️⚠️⚠️ You encountered a level {monster_level} {monster_name}!⚠️⚠️⚠️\n\n"
+        msg += f"Monster Stats:\n"
+        msg += f"❤️ HP: {hp}\n"
+        msg += f"⚔️ Damage: {min_damage}-{max_damage}\n"
+        msg += f"✨ XP Reward: {monster_info['xp_reward'] * monster_level}\n"
+        msg += f"💰 Coin Reward: {monster_info['coin_reward'][0] * monster_level}-{monster_info['coin_reward'][1] * monster_level}\n\n"
+        msg += f"You have 5 seconds to decide:\n"
+        msg += f"/fight - Attack the monster\n"
+        msg += f"/flee - Return to your previous position"
+
+      elif tile_type == TILE_HEALTH:
+        heal_amount = random_int(2, 5)
+        player["health"] = min(player["max_health"], player["health"] + heal_amount)
+        msg += f"You found a health potion! Health +{heal_amount}. "
+        game_map["type"][y, x] = TILE_EMPTY
+
+      is_dead, death_msg = check_health(player)
+      if is_dead:
+        return death_msg
+
+      map_view = visualize_map(player, game_map)
+      stats = f"Health: {int(player['health'])}/{player['max_health']}, Energy: {int(player['energy'])}/{player['max_energy']}, Coins: {player['coins']}"
+      return f"{map_view}\n{msg}\n{stats}"
+
+    def display_shop(player):
+      """Displays the shop menu with available items."""
+      shop_text = "🏪 SHOP 🏪\n\n"
+      shop_text += f"Your coins: {player['coins']} 💰\n\n"
+      shop_text += "Available Items:\n"
+
+      for item_id, item in SHOP_ITEMS.items():
+        can_afford = "✅" if player["coins"] >= item["price"] else "❌"
+        shop_text += f"{item['name']} - {item['price']} coins {can_afford}\n"
+        shop_text += f"  {item['description']}\n"
+
+      shop_text += "\nTo purchase an item, use /buy <item_name>"
+      shop_text += "\nYou can use spaces or underscores in item names (e.g., 'map scroll' or 'map_scroll')"
+      shop_text += "\nAvailable items: health_potion, sword, shield, amulet, boots, map_scroll, energy_drink, bomb"
+      return shop_text
+
+    def buy_item(player, item_id):
+      """Process the purchase of an item."""
+      if item_id not in SHOP_ITEMS:
+        return f"Item '{item_id}' not found in the shop."
+
+      item = SHOP_ITEMS[item_id]
+
+      # Check if player has enough coins
+      if player["coins"] < item["price"]:
+        return f"You don't have enough coins. You need {item['price']} coins but only have {player['coins']}."
+
+      # Process the purchase based on item type
+      if item["type"] == "consumable":
+        player["inventory"][item_id] += 1
+        msg = f"You purchased {item['name']}. It's in your inventory."
+
+      elif item["type"] == "weapon":
+        # Replace existing weapon
+        old_weapon = player["equipment"]["weapon"]
+        if old_weapon:
+          # Remove old weapon bonuses
+          player["attack"] -= SHOP_ITEMS[old_weapon]["attack_bonus"]
+
+        player["equipment"]["weapon"] = item_id
+        player["attack"] += item["attack_bonus"]
+        msg = f"You equipped {item['name']}! Your attack is now {player['attack']}."
+
+      elif item["type"] == "armor":
+        # Replace existing armor
+        old_armor = player["equipment"]["armor"]
+        if old_armor:
+          # Remove old armor bonuses
+          player["damage_reduction"] -= SHOP_ITEMS[old_armor]["damage_reduction_bonus"]
+
+        player["equipment"]["armor"] = item_id
+        player["damage_reduction"] += item["damage_reduction_bonus"]
+        msg = f"You equipped {item['name']}! Your damage reduction is now {int(player['damage_reduction'] * 100)}%."
+
+      elif item["type"] == "accessory":
+        # Add to accessories (allowing multiple)
+        if item_id in player["equipment"]["accessory"]:
+          return f"You already have {item['name']}."
+
+        player["equipment"]["accessory"].append(item_id)
+
+        # Apply accessory bonuses
+        if "max_health_bonus" in item:
+          player["max_health"] += item["max_health_bonus"]
+          msg = f"You equipped {item['name']}! Your max health is now {player['max_health']}."
+        elif "dodge_chance" in item:
+          player["dodge_chance"] += item["dodge_chance"]
+          msg = f"You equipped {item['name']}! Your dodge chance is now {int(player['dodge_chance'] * 100)}%."
+        else:
+          msg = f"You equipped {item['name']}!"
 
-    # Deduct coins
-    player["coins"] -= item["price"]
+      # Deduct coins
+      player["coins"] -= item["price"]
 
-    return f"{msg}\nYou have {player['coins']} coins remaining."
+      return f"{msg}\nYou have {player['coins']} coins remaining."
 
-  def use_item(player, item_id, game_map):
-    """Use a consumable item from inventory."""
-    # Check if player has the item
-    if item_id not in player["inventory"] or player["inventory"][item_id] <= 0:
-      return f"You don't have any {item_id} in your inventory."
+    def use_item(player, item_id, game_map):
+      """Use a consumable item from inventory."""
+      # Check if player has the item
+      if item_id not in player["inventory"] or player["inventory"][item_id] <= 0:
+        return f"You don't have any {item_id} in your inventory."
       
-    # Check if player has enough energy to use an item
-    if player["energy"] < ENERGY_COSTS["use_item"]:
-      player = update_player_status(player, "recovering")
-      return f"You don't have enough energy to use this item. Energy: {int(player['energy'])}/{player['max_energy']}"
-    
-    # Consume energy for using the item
-    player["energy"] -= ENERGY_COSTS["use_item"]
-
-    if item_id == "health_potion":
-      if player["health"] >= player["max_health"]:
-        # Refund energy if potion wasn't used
-        player["energy"] += ENERGY_COSTS["use_item"]
-        return "Your health is already full!"
-
-      # Use health potion
-      heal_amount = 5
-      old_health = player["health"]
-      player["health"] = min(player["max_health"], player["health"] + heal_amount)
-      player["inventory"][item_id] -= 1
+      # Check if player has enough energy to use an item
+      if player["energy"] < ENERGY_COSTS["use_item"]:
+        player = update_player_status(player, "recovering")
+        return f"You don't have enough energy to use this item. Energy: {int(player['energy'])}/{player['max_energy']}"
+    
+      # Consume energy for using the item
+      player["energy"] -= ENERGY_COSTS["use_item"]
+
+      if item_id == "health_potion":
+        if player["health"] >= player["max_health"]:
+          # Refund energy if potion wasn't used
+          player["energy"] += ENERGY_COSTS["use_item"]
+          return "Your health is already full!"
+
+        # Use health potion
+        heal_amount = 5
+        old_health = player["health"]
+        player["health"] = min(player["max_health"], player["health"] + heal_amount)
+        player["inventory"][item_id] -= 1
       
-      # Set player status to recovering when using a health potion
-      player = update_player_status(player, "recovering")
+        # Set player status to recovering when using a health potion
+        player = update_player_status(player, "recovering")
 
-      return f"You used a Health Potion. Health: {int(old_health)} → {int(player['health'])}\nEnergy: -{ENERGY_COSTS['use_item']}"
+        return f"You used a Health Potion. Health: {int(old_health)} → {int(player['health'])}\nEnergy: -{ENERGY_COSTS['use_item']}"
+
+      elif item_id == "map_scroll":
+        # Use map scroll to reveal a larger area
+        reveal_extended_map(player, game_map)
+        player["inventory"][item_id] -= 1
+
+        map_view = visualize_map(player, game_map)
+        return f"You used a Map Scroll and revealed more of the map! Energy: -{ENERGY_COSTS['use_item']}\n\n{map_view}"
+
+      elif item_id == "energy_drink":
+        # Use energy drink to restore energy
+        player["energy"] += 10
+        player["inventory"][item_id] -= 1
+        return "You used an Energy Drink. Energy: +10"
+
+      elif item_id == "bomb":
+        # Store the bomb usage flag for use in the combat session
+        player["bomb_used"] = True
+        player["inventory"][item_id] -= 1
+        return "You set a Bomb that will deal 5 damage to the monster when combat starts!"
+
+      return f"Cannot use {item_id}."
+
+    def display_help():
+      """Returns extended help instructions."""
+      help_text = ("Welcome to Shadowborn!\n"
+                   "Instructions:\n"
+                   "- All players explore the SAME dungeon map together!\n"
+                   "- Explore the dungeon using movement commands:\n"
+                   "  • N or north - Move North\n"
+                   "  • S or south - Move South\n"
+                   "  • W or west - Move West\n"
+                   "  • E or east - Move East\n"
+                   "  • 'go north', 'go south', etc. - Move in specified direction\n"
+                   "- Check your stats with /status to see health, coins, XP, level, attack, and equipment.\n"
+                   "- Defeat monsters to earn XP and level up.\n"
+                   "- Collect coins and visit the shop (/shop) to buy upgrades using /buy.\n"
+                   "- Use consumable items from your inventory with /use.\n"
+                   "- View the map with /map.\n"
+                   "- Complete quests and explore the vast map with other players.\n"
+                   "\nMap Biomes:\n"
+                   "The world is divided into distinct regions, each with unique characteristics:\n"
+                   "- 🌲 Forest: Dense woods with abundant health pickups. Normal movement cost.\n"
+                   "- 🌋 Lava Caves: Dangerous areas with more traps but valuable treasures. Slightly increased movement cost.\n"
+                   "- ❄️ Ice Wastes: Frozen lands where movement is difficult, requiring 50% more energy to traverse.\n"
+                   "- 🌾 Plains: Balanced areas with no special effects. Standard movement cost.\n"
+                   "\nMonster Encounters:\n"
+                   "- When encountering a monster, you have 5 seconds to decide what to do.\n"
+                   "- Use /fight to engage in battle, or /flee to return to your previous position.\n"
+                   "- If you don't respond within 5 seconds, battle starts automatically.\n"
+                   "- Use a Bomb before combat to deal initial damage to the monster.\n"
+                   "\nPlayer Status System:\n"
+                   "Your character can be in one of four states that affect gameplay:\n"
+                   "- Exploring: Normal movement with standard regeneration rates.\n"
+                   "- Prepare to Fight: You've encountered a monster and must decide to fight or flee.\n"
+                   "- Fighting: Engaged in combat with reduced health regeneration.\n"
+                   "- Recovering: Resting with increased health and energy regeneration.\n"
+                   "Your status changes automatically based on your actions, but you can also set it manually.\n"
+                   "\nConsumable Items:\n"
+                   "- Health Potion (🧪): Restores 5 health points\n"
+                   "- Map Scroll (📜): Reveals a larger area of the map\n"
+                   "- Energy Drink (🧃): Restores 10 energy points\n"
+                   "- Bomb (💣): Deals 5 damage to a monster before combat starts\n"
+                   "\nAvailable Commands:\n"
+                   "Note: All commands can be used both with and without the leading slash.\n"
+                   "1. /start  - Restart your character (keeps the shared map).\n"
+                   "2. N/S/W/E or north/south/west/east - Move your character in the specified direction.\n"
+                   "3. 'go north', 'go south', etc. - Alternative way to move in the specified direction.\n"
+                   "4. /status - Display your current stats (health, coins, level, XP, attack, and equipment).\n"
+                   "5. /map    - View the map of your surroundings.\n"
+                   "6. /shop   - Visit the shop to browse and buy upgrades/items.\n"
+                   "7. /buy <item_name> - Purchase an item from the shop. You can use spaces in item names (e.g., 'map scroll').\n"
+                   "8. /use <item_name> - Use a consumable item from your inventory. You can use spaces in item names (e.g., 'energy drink').\n"
+                   "9. /fight  - Engage in combat with a monster you've encountered.\n"
+                   "10. /flee   - Retreat from a monster encounter back to your previous position.\n"
+                   "11. /help   - Display help information.\n"
+                   "12. /wiki   - Access the game's knowledge base with additional information and tips.\n"
+                   "\nGame Initialization:\n"
+                   "The game world needs to be initialized before anyone can play.\n"
+                   "- /init   - Initialize the game world (admin only, can only be used once).")
+      return help_text
+
+    def update_player_status(player, new_status):
+      """
+      Updates a player's status and records when it changed.
+      """
+      if new_status not in ["exploring", "fighting", "recovering", "prepare_to_fight"]:
+        plugin.P(f"Warning: Invalid status '{new_status}' being set. Defaulting to 'exploring'")
+        new_status = "exploring"
+
+      if player["status"] != new_status:
+        player["status"] = new_status
+        player["status_since"] = plugin.time()
+        plugin.P(f"Player status changed to {new_status}")
+
+      return player
+
+    def get_monster_type_for_level(level):
+      """
+      Returns an appropriate monster type for the given level.
+      """
+      suitable_monsters = [
+          monster_type for monster_type, stats in MONSTER_TYPES.items()
+          if stats["min_level"] <= level <= stats["max_level"]
+      ]
+      if not suitable_monsters:
+          return "goblin"  # Default to goblin if no suitable monster found
+    
+      # Use randint instead of choice for selecting from the list
+      random_index = random_int(0, len(suitable_monsters))
+      return suitable_monsters[random_index]
+
+    def get_tile_monster_type(game_map, x, y):
+      """
+      Returns the monster type stored on a map tile, drawing one for its level if the tile has none yet.
+      """
+      code = game_map["monster_type"][y, x]
+      if code == 0:
+        code = MONSTER_TYPE_CODES.index(get_monster_type_for_level(int(game_map["monster_level"][y, x])))
+        game_map["monster_type"][y, x] = code
+      return MONSTER_TYPE_CODES[code]
+
+    def get_monster_id_for_level(level):
+      """
+      Returns an appropriate monster type name for the given level.
+      This function is kept for backward compatibility but now returns
+      the monster type name directly instead of an ID.
+      """
+      return get_monster_type_for_level(level)
 
-    elif item_id == "map_scroll":
-      # Use map scroll to reveal a larger area
-      reveal_extended_map(player, game_map)
-      player["inventory"][item_id] -= 1
+  
+    def create_monster_of_type(monster_type, level):
+      """
+      Creates a new monster of a specific type with appropriate level.
+      """
+      # Fallback if monster_type doesn't exist in MONSTER_TYPES
+      if monster_type not in MONSTER_TYPES:
+        return create_monster(level)
+
+      stats = MONSTER_TYPES[monster_type]
+
+      # Calculate monster stats based on level
+      hp = stats["base_hp"] + (level - 1) * stats["hp_per_level"]
+      min_damage = stats["min_damage"] + (level - 1) * stats["damage_per_level"]
+      max_damage = stats["max_damage"] + (level - 1) * stats["damage_per_level"]
+
+      return {
+        "type": monster_type,
+        "name": stats["name"],
+        "level": level,
+        "hp": hp,
+        "max_hp": hp,
+        "min_damage": min_damage,
+        "max_damage": max_damage,
+        "xp_reward": stats["xp_reward"] * level,
+        "coin_reward": (stats["coin_reward"][0] * level, stats["coin_reward"][1] * level)
+      }
+
+    def create_monster(level):
+      """
+      Creates a new monster of appropriate level.
+      """
+      monster_type = get_monster_type_for_level(level)
+      stats = MONSTER_TYPES[monster_type]
+    
+      # Calculate monster stats based on level
+      hp = stats["base_hp"] + (level - 1) * stats["hp_per_level"]
+      min_damage = stats["min_damage"] + (level - 1) * stats["damage_per_level"]
+      max_damage = stats["max_damage"] + (level - 1) * stats["damage_per_level"]
+    
+      return {
+        "type": monster_type,
+        "name": stats["name"],
+        "level": level,
+        "hp": hp,
+        "max_hp": hp,
+        "min_damage": min_damage,
+        "max_damage": max_damage,
+        "xp_reward": stats["xp_reward"] * level,
+        "coin_reward": (stats["coin_reward"][0] * level, stats["coin_reward"][1] * level)
+      }
 
+    # --------------------------------------------------
+    # COMMAND HANDLERS
+    # Each one takes (player, parts, user_id, game_map) and returns the reply text
+    # --------------------------------------------------
+    def handle_start(player, parts, user_id, game_map):
+      """Sends the welcome message and restarts the character of the user (keeps the shared map)."""
+      # First send welcome message and initialization notification
+      welcome_message = ("Welcome to Shadowborn!\n" 
+                        "This is an epic roguelike adventure where you explore a dangerous dungeon, defeat monsters, collect coins, earn XP, and purchase upgrades from the shop.\n" 
+                        "Your goal is to explore the vast map and complete quests.\n"
+                        "All players share the same map - you'll see changes made by other players!\n\n"
+                        "⏳ Initializing your character... Please wait a moment as your hero materializes in the world... ⏳\n\n"
+                        "Use N/S/E/W, north/south/east/west, 'go north', 'go south', 'go east', 'go west'. to move around, status to check your stats, and shop to buy upgrades.\n"
+                        "Commands can be used with or without the leading slash (e.g., /status or status).\n\n"
+                        "For more detailed instructions, use help or /help."
+                        "To discover our world use wiki or /wiki.")
+
+      # Send the welcome message first
+      plugin.send_message_to_user(user_id, welcome_message)
+
+      # Now create the player
+      # Reset the existing character in place (the users cache already holds it)
+      player = create_new_player(player)
+
+      # Generate the map view
       map_view = visualize_map(player, game_map)
-      return f"You used a Map Scroll and revealed more of the map! Energy: -{ENERGY_COSTS['use_item']}\n\n{map_view}"
-
-    elif item_id == "energy_drink":
-      # Use energy drink to restore energy
-      player["energy"] += 10
-      player["inventory"][item_id] -= 1
-      return "You used an Energy Drink. Energy: +10"
-
-    elif item_id == "bomb":
-      # Check if player is in combat or about to enter combat
-      x, y = player["position"]
-
-      # Store the bomb usage flag for use in the combat session
-      player["bomb_used"] = True
-      player["inventory"][item_id] -= 1
-      return "You set a Bomb that will deal 5 damage to the monster when combat starts!"
-
-    return f"Cannot use {item_id}."
-
-  def display_help():
-    """Returns extended help instructions."""
-    help_text = ("Welcome to Shadowborn!\n"
-                 "Instructions:\n"
-                 "- All players explore the SAME dungeon map together!\n"
-                 "- Explore the dungeon using movement commands:\n"
-                 "  • N or north - Move North\n"
-                 "  • S or south - Move South\n"
-                 "  • W or west - Move West\n"
-                 "  • E or east - Move East\n"
-                 "  • 'go north', 'go south', etc. - Move in specified direction\n"
-                 "- Check your stats with /status to see health, coins, XP, level, attack, and equipment.\n"
-                 "- Defeat monsters to earn XP and level up.\n"
-                 "- Collect coins and visit the shop (/shop) to buy upgrades using /buy.\n"
-                 "- Use consumable items from your inventory with /use.\n"
-                 "- View the map with /map.\n"
-                 "- Complete quests and explore the vast map with other players.\n"
-                 "\nMap Biomes:\n"
-                 "The world is divided into distinct regions, each with unique characteristics:\n"
-                 "- 🌲 Forest: Dense woods with abundant health pickups. Normal movement cost.\n"
-                 "- 🌋 Lava Caves: Dangerous areas with more traps but valuable treasures. Slightly increased movement cost.\n"
-                 "- ❄️ Ice Wastes: Frozen lands where movement is difficult, requiring 50% more energy to traverse.\n"
-                 "- 🌾 Plains: Balanced areas with no special effects. Standard movement cost.\n"
-                 "\nMonster Encounters:\n"
-                 "- When encountering a monster, you have 5 seconds to decide what to do.\n"
-                 "- Use /fight to engage in battle, or /flee to return to your previous position.\n"
-                 "- If you don't respond within 5 seconds, battle starts automatically.\n"
-                 "- Use a Bomb before combat to deal initial damage to the monster.\n"
-                 "\nPlayer Status System:\n"
-                 "Your character can be in one of four states that affect gameplay:\n"
-                 "- Exploring: Normal movement with standard regeneration rates.\n"
-                 "- Prepare to Fight: You've encountered a monster and must decide to fight or flee.\n"
-                 "- Fighting: Engaged in combat with reduced health regeneration.\n"
-                 "- Recovering: Resting with increased health and energy regeneration.\n"
-                 "Your status changes automatically based on your actions, but you can also set it manually.\n"
-                 "\nConsumable Items:\n"
-                 "- Health Potion (🧪): Restores 5 health points\n"
-                 "- Map Scroll (📜): Reveals a larger area of the map\n"
-                 "- Energy Drink (🧃): Restores 10 energy points\n"
-                 "- Bomb (💣): Deals 5 damage to a monster before combat starts\n"
-                 "\nAvailable Commands:\n"
-                 "Note: All commands can be used both with and without the leading slash.\n"
-                 "1. /start  - Restart your character (keeps the shared map).\n"
-                 "2. N/S/W/E or north/south/west/east - Move your character in the specified direction.\n"
-                 "3. 'go north', 'go south', etc. - Alternative way to move in the specified direction.\n"
-                 "4. /status - Display your current stats (health, coins, level, XP, attack, and equipment).\n"
-                 "5. /map    - View the map of your surroundings.\n"
-                 "6. /shop   - Visit the shop to browse and buy upgrades/items.\n"
-                 "7. /buy <item_name> - Purchase an item from the shop. You can use spaces in item names (e.g., 'map scroll').\n"
-                 "8. /use <item_name> - Use a consumable item from your inventory. You can use spaces in item names (e.g., 'energy drink').\n"
-                 "9. /fight  - Engage in combat with a monster you've encountered.\n"
-                 "10. /flee   - Retreat from a monster encounter back to your previous position.\n"
-                 "11. /help   - Display help information.\n"
-                 "12. /wiki   - Access the game's knowledge base with additional information and tips.\n"
-                 "\nGame Initialization:\n"
-                 "The game world needs to be initialized before anyone can play.\n"
-                 "- /init   - Initialize the game world (admin only, can only be used once).")
-    return help_text
 
-  def update_player_status(player, new_status):
-    """
-    Updates a player's status and records when it changed.
-    """
-    if new_status not in ["exploring", "fighting", "recovering", "prepare_to_fight"]:
-      plugin.P(f"Warning: Invalid status '{new_status}' being set. Defaulting to 'exploring'")
-      new_status = "exploring"
+      # Return the map view as a separate message
+      return f"✅ Character initialization complete! Your adventure begins now!\n\n{map_view}"
+
+    def handle_status(player, parts, user_id, game_map):
+      """Displays the current stats, inventory and equipment of the player."""
+      p = player
+      x, y = p["x"], p["y"]
+    
+      # Get biome information for current position
+      current_biome = BIOME_TYPES[game_map["biome"][y, x]]
+      biome_emoji = BIOME_EMOJIS[game_map["biome"][y, x]]
+
+      # Calculate total stats including equipment bonuses
+      total_attack = p["attack"]
+      total_damage_reduction = p["damage_reduction"]
+      total_max_health = 0
+      total_dodge = p["dodge_chance"]
+
+      # Get equipment bonuses
+      for slot, item_id in p["equipment"].items():
+        if slot == "accessory":
+          # Handle multiple accessories
+          for acc_id in item_id:
+            if acc_id and acc_id in SHOP_ITEMS:
+              item = SHOP_ITEMS[acc_id]
+              if "attack_bonus" in item:
+                total_attack += item["attack_bonus"]
+              if "damage_reduction" in item:
+                total_damage_reduction += item["damage_reduction"]
+              if "max_health_bonus" in item:
+                total_max_health += item["max_health_bonus"]
+              if "dodge_chance" in item:
+                total_dodge += item["dodge_chance"]
+        else:
+          # Handle single equipment items (weapon, armor)
+          if item_id and item_id in SHOP_ITEMS:
+            item = SHOP_ITEMS[item_id]
+            if "attack_bonus" in item:
+              total_attack += item["attack_bonus"]
+            if "damage_reduction" in item:
+              total_damage_reduction += item["damage_reduction"]
+            if "max_health_bonus" in item:
+              total_max_health += item["max_health_bonus"]
+            if "dodge_chance" in item:
+              total_dodge += item["dodge_chance"]
 
-    if player["status"] != new_status:
-      player["status"] = new_status
-      player["status_since"] = plugin.time()
-      plugin.P(f"Player status changed to {new_status}")
+      # Format damage reduction and dodge chance as percentages
+      damage_reduction_percent = int(total_damage_reduction * 100)
+      dodge_percent = int(total_dodge * 100)
+
+      # Calculate how long the player has been in their current status
+      status_duration = int(plugin.time() - p["status_since"])
+      minutes, seconds = divmod(status_duration, 60)
+    
+      # Get status emoji and formatted status name
+      status_emoji = "🔍"
+      status_display = "Exploring"
+    
+      if p["status"] == "fighting":
+        status_emoji = "⚔️"
+        status_display = "Fighting"
+      elif p["status"] == "recovering":
+        status_emoji = "💤"
+        status_display = "Recovering"
+      elif p["status"] == "prepare_to_fight":
+        status_emoji = "⚠️"
+        status_display = "Deciding to Fight"
+    
+      # Build equipment list
+      equipment_list = []
+      if p["equipment"]["weapon"]:
+        equipment_list.append(f"Weapon: {SHOP_ITEMS[p['equipment']['weapon']]['name']}")
+      if p["equipment"]["armor"]:
+        equipment_list.append(f"Armor: {SHOP_ITEMS[p['equipment']['armor']]['name']}")
+      for accessory in p["equipment"]["accessory"]:
+        equipment_list.append(f"Accessory: {SHOP_ITEMS[accessory]['name']}")
+
+      equipment_str = "\n".join(equipment_list) if equipment_list else "None"
+
+      # Build inventory list
+      inventory_list = []
+      for item_id, count in p["inventory"].items():
+        if count > 0:
+          if item_id in SHOP_ITEMS:
+            inventory_list.append(f"{SHOP_ITEMS[item_id]['name']}: {count}")
+          else:
+            inventory_list.append(f"{item_id}: {count}")
 
-    return player
+      inventory_str = "\n".join(inventory_list) if inventory_list else "Empty"
 
-  def get_monster_type_for_level(level):
-    """
-    Returns an appropriate monster type for the given level.
-    """
-    suitable_monsters = [
-        monster_type for monster_type, stats in MONSTER_TYPES.items()
-        if stats["min_level"] <= level <= stats["max_level"]
-    ]
-    if not suitable_monsters:
-        return "goblin"  # Default to goblin if no suitable monster found
+      # Define biomes and their specifications (reference)
+      biomes = {
+        "FOREST": {
+          "emoji": "🌲",
+          "description": "A dense forest with healing herbs",
+          "energy_multiplier": 1.0
+        },
+        "LAVA_CAVES": {
+          "emoji": "🌋",
+          "description": "Hot caves with dangerous traps but valuable treasures",
+          "energy_multiplier": 1.2
+        },
+        "ICE_WASTES": {
+          "emoji": "❄️",
+          "description": "Frozen wasteland that slows movement",
+          "energy_multiplier": 1.5
+        },
+        "PLAINS": {
+          "emoji": "🌾",
+          "description": "Flat plains with balanced features",
+          "energy_multiplier": 1.0
+        }
+      }
     
-    # Use randint instead of choice for selecting from the list
-    random_index = plugin.np.random.randint(0, len(suitable_monsters))
-    return suitable_monsters[random_index]
-
-  def get_monster_id_for_level(level):
-    """
-    Returns an appropriate monster type name for the given level.
-    This function is kept for backward compatibility but now returns
-    the monster type name directly instead of an ID.
-    """
-    return get_monster_type_for_level(level)
-
-  
-  def create_monster_of_type(monster_type, level):
-    """
-    Creates a new monster of a specific type with appropriate level.
-    """
-    # Fallback if monster_type doesn't exist in MONSTER_TYPES
-    if monster_type not in MONSTER_TYPES:
-      return create_monster(level)
-
-    stats = MONSTER_TYPES[monster_type]
-
-    # Calculate monster stats based on level
-    hp = stats["base_hp"] + (level - 1) * stats["hp_per_level"]
-    min_damage = stats["min_damage"] + (level - 1) * stats["damage_per_level"]
-    max_damage = stats["max_damage"] + (level - 1) * stats["damage_per_level"]
-
-    return {
-      "type": monster_type,
-      "name": stats["name"],
-      "level": level,
-      "hp": hp,
-      "max_hp": hp,
-      "min_damage": min_damage,
-      "max_damage": max_damage,
-      "xp_reward": stats["xp_reward"] * level,
-      "coin_reward": (stats["coin_reward"][0] * level, stats["coin_reward"][1] * level)
+      # Get biome effects description
+      biome_effects = ""
+      if current_biome in biomes:
+        biome_data = biomes[current_biome]
+        if biome_data.get("energy_multiplier", 1.0) > 1.0:
+          biome_effects = f"(Movement Energy: x{biome_data['energy_multiplier']})"
+
+      status_message = (f"📊 STATUS 📊\n"
+                       f"🗺️ Position: ({x}, {y})\n"
+                       f"🌍 Biome: {biome_emoji} {current_biome.replace('_', ' ')} {biome_effects}\n"
+                       f"👤 Status: {status_emoji} {status_display} ({minutes}m {seconds}s)\n"
+                       f"❤️ Health: {int(p['health'])}/{p['max_health']} (Regen: {p['hp_regen_rate']:.1f}/min)\n"
+                       f"⚡ Energy: {int(p['energy'])}/{p['max_energy']} (Regen: {p['energy_regen_rate']:.1f}/min)\n"
+                       f"💰 Coins: {p['coins']}\n"
+                       f"📊 Level: {p['level']} (XP: {p['xp']}/{p['next_level_xp']})\n"
+                       f"⚔️ Attack: {total_attack}\n"
+                       f"🛡️ Damage Reduction: {damage_reduction_percent}%\n"
+                       f"👟 Dodge Chance: {dodge_percent}%\n\n"
+                       f"🎒 INVENTORY:\n{inventory_str}\n\n"
+                       f"🧥 EQUIPMENT:\n{equipment_str}")
+
+      return status_message
+
+    def handle_map(player, parts, user_id, game_map):
+      """Displays the map around the player."""
+      return visualize_map(player, game_map)
+
+    def handle_shop(player, parts, user_id, game_map):
+      """Displays the shop menu."""
+      return display_shop(player)
+
+    def handle_buy(player, parts, user_id, game_map):
+      """Buys the item named after the command."""
+      if len(parts) < 2:
+        return "Usage: /buy <item_name>\nUse /shop to see available items.\nYou can use spaces in item names (e.g., 'map scroll')"
+
+      # Join all words after 'buy' and convert spaces to underscores to match item_id format
+      item_id = '_'.join(parts[1:]).lower()
+      return buy_item(player, item_id)
+
+    def handle_use(player, parts, user_id, game_map):
+      """Uses the inventory item named after the command."""
+      if len(parts) < 2:
+        return "Usage: /use <item_name>\nItems you can use: health_potion, map_scroll, energy_drink, bomb\nYou can use spaces in item names (e.g., 'energy drink')"
+
+      # Join all words after 'use' and convert spaces to underscores to match item_id format
+      item_id = '_'.join(parts[1:]).lower()
+      return use_item(player, item_id, game_map)
+
+    def handle_help(player, parts, user_id, game_map):
+      """Displays the extended help."""
+      return display_help()
+
+    def handle_wiki(player, parts, user_id, game_map):
+      """Displays the game's knowledge base."""
+      wiki_text = (
+        "📚 SHADOWBORN WIKI 📚\n\n"
+        "🎯 MONSTER TYPES & LEVELS:\n"
+        "1. 👹 Goblin (Levels 1-3)\n"
+        "   • Base HP: 5\n"
+        "   • Damage: 1-3\n"
+        "   • XP Reward: 2\n"
+        "   • Coin Reward: 1-3\n\n"
+        "2. 👺 Orc (Levels 4-6)\n"
+        "   • Base HP: 8\n"
+        "   • Damage: 2-4\n"
+        "   • XP Reward: 3\n"
+        "   • Coin Reward: 2-4\n\n"
+        "3. 👿 Demon (Levels 7-9)\n"
+        "   • Base HP: 12\n"
+        "   • Damage: 3-6\n"
+        "   • XP Reward: 5\n"
+        "   • Coin Reward: 3-6\n\n"
+        "📊 MONSTER LEVEL DISTRIBUTION:\n"
+        "• Level 1: 30% (Most Common)\n"
+        "• Level 2: 20%\n"
+        "• Level 3: 15%\n"
+        "• Level 4: 10%\n"
+        "• Level 5: 8%\n"
+        "• Level 6: 7%\n"
+        "• Level 7: 5%\n"
+        "• Level 8: 3%\n"
+        "• Level 9: 2% (Rarest)\n\n"
+        "⚔️ COMBAT MECHANICS:\n"
+        "• Combat starts automatically when moving onto a monster tile\n"
+        "• Each combat round takes 5 seconds\n"
+        "• Energy cost for combat: 3\n"
+        "• Dodge chance reduces incoming damage to 0\n"
+        "• Damage reduction reduces incoming damage by percentage\n\n"
+        "💫 PLAYER STATUS EFFECTS:\n"
+        "1. Exploring (🔍)\n"
+        "   • Normal health and energy regeneration\n"
+        "   • Standard movement speed\n\n"
+        "2. Fighting (⚔️)\n"
+        "   • Reduced health regeneration (50%)\n"
+        "   • Normal energy regeneration\n"
+        "   • Cannot move until combat ends\n\n"
+        "3. Recovering (💤)\n"
+        "   • Increased health regeneration (150%)\n"
+        "   • Increased energy regeneration (150%)\n"
+        "   • Cannot move until fully healed\n\n"
+        "🎒 INVENTORY ITEMS:\n"
+        "• Health Potion (🧪): Restores 5 HP\n"
+        "• Map Scroll (📜): Reveals larger area\n"
+        "• Energy Drink (🧃): Restores 10 energy points\n"
+        "• Bomb (💣): Deals 5 damage to a monster before combat starts\n\n"
+        "🛍️ SHOP ITEMS:\n"
+        "• Health Potion: 5 coins\n"
+        "• Sword (⚔️): +1 Attack, 15 coins\n"
+        "• Shield (🛡️): +10% Damage Reduction, 20 coins\n"
+        "• Magic Amulet (🔮): +3 Max Health, 25 coins\n"
+        "• Speed Boots (👢): +5% Dodge Chance, 30 coins\n"
+        "• Map Scroll: 10 coins\n"
+        "• Energy Drink: 7 coins\n"
+        "• Bomb: 15 coins\n\n"
+        "💡 TIPS:\n"
+        "• Use /status to check your stats\n"
+        "• Use /map to view your surroundings\n"
+        "• Higher level monsters give better rewards\n"
+        "• Always keep some health potions for emergencies\n"
+        "• Use map scrolls to plan your route\n"
+        "• Consider your energy before engaging in combat"
+      )
+      return wiki_text
+
+    def handle_botstatus(player, parts, user_id, game_map):
+      """Displays technical information about the bot and the shared map."""
+      # Show bot status information
+      if "bot_status" not in plugin.obj_cache:
+        return "Bot status information not available."
+    
+      status = plugin.obj_cache["bot_status"]
+      current_time = plugin.time()
+    
+      # Calculate uptime
+      uptime_seconds = current_time - status.get("creation_time", current_time)
+      minutes, seconds = divmod(uptime_seconds, 60)
+      hours, minutes = divmod(minutes, 60)
+    
+      # Check if the world is initialized
+      initialization_status = "✅ Initialized" if status.get("initialized", False) else "❌ Not Initialized"
+    
+      # Calculate map statistics if available
+      map_stats = ""
+      if "shared_map" in plugin.obj_cache:
+        total_tiles = GRID_WIDTH * GRID_HEIGHT
+        visible_tiles = int(plugin.np.count_nonzero(plugin.obj_cache["shared_map"]["visible"]))
+        exploration_percentage = (visible_tiles / total_tiles) * 100
+      
+        # Count different tile types
+        tile_type_grid = plugin.obj_cache["shared_map"]["type"]
+        tile_counts = dict(zip(TILE_TYPES, plugin.np.bincount(tile_type_grid.ravel(), minlength=len(TILE_TYPES)).tolist()))
+      
+        map_stats = (f"\n\n🗺️ MAP STATISTICS:\n"
+                    f"Map Size: {GRID_WIDTH}×{GRID_HEIGHT} ({total_tiles} tiles)\n"
+                    f"Explored: {visible_tiles} tiles ({exploration_percentage:.1f}%)\n"
+                    f"Coins remaining: {tile_counts['COIN']}\n"
+                    f"Monsters remaining: {tile_counts['MONSTER']}\n"
+                    f"Health pickups remaining: {tile_counts['HEALTH']}")
+    
+      # Count users
+      user_count = len(plugin.obj_cache.get("users", {}))
+      active_users = sum(1 for user in plugin.obj_cache.get("users", {}).values() if user is not None)
+    
+      # Format status message
+      status_message = (f"🤖 BOT STATUS 🤖\n\n"
+                       f"Status: {status['status']}\n"
+                       f"Initialization: {initialization_status}\n"
+                       f"Uptime: {int(hours)}h {int(minutes)}m {int(seconds)}s\n"
+                       f"Map Generation Time: {status.get('map_generation_time', 'N/A'):.2f}s\n\n"
+                       f"👥 USERS:\n"
+                       f"Total Users: {user_count}\n"
+                       f"Active Players: {active_users}"
+                       f"{map_stats}")
+    
+      return status_message
+
+    def handle_fight(player, parts, user_id, game_map):
+      """Engages the monster the player has encountered."""
+      return handle_fight_command(player, game_map, user_id)
+
+    def handle_flee(player, parts, user_id, game_map):
+      """Flees from the monster and drops the combat session of the user."""
+      response = handle_flee_command(player, game_map)
+    
+      # Clean up combat session if user was in combat
+      plugin.obj_cache.get("combat", {}).pop(user_id, None)
+    
+      return response
+
+    COMMAND_HANDLERS = {
+      "start": handle_start,
+      "status": handle_status,
+      "map": handle_map,
+      "shop": handle_shop,
+      "buy": handle_buy,
+      "use": handle_use,
+      "help": handle_help,
+      "wiki": handle_wiki,
+      "botstatus": handle_botstatus,
+      "fight": handle_fight,
+      "flee": handle_flee,
     }
 
-  def create_monster(level):
-    """
-    Creates a new monster of appropriate level.
-    """
-    monster_type = get_monster_type_for_level(level)
-    stats = MONSTER_TYPES[monster_type]
-    
-    # Calculate monster stats based on level
-    hp = stats["base_hp"] + (level - 1) * stats["hp_per_level"]
-    min_damage = stats["min_damage"] + (level - 1) * stats["damage_per_level"]
-    max_damage = stats["max_damage"] + (level - 1) * stats["damage_per_level"]
-    
-    return {
-      "type": monster_type,
-      "name": stats["name"],
-      "level": level,
-      "hp": hp,
-      "max_hp": hp,
-      "min_damage": min_damage,
-      "max_damage": max_damage,
-      "xp_reward": stats["xp_reward"] * level,
-      "coin_reward": (stats["coin_reward"][0] * level, stats["coin_reward"][1] * level)
+    game = {
+      "DIRECTION_ALIASES": DIRECTION_ALIASES,
+      "COMMAND_HANDLERS": COMMAND_HANDLERS,
+      "generate_map": generate_map,
+      "create_new_player": create_new_player,
+      "move_player": move_player,
     }
+    plugin.obj_cache["game"] = game
+  #end if
+
+  DIRECTION_ALIASES, COMMAND_HANDLERS = game["DIRECTION_ALIASES"], game["COMMAND_HANDLERS"]
+  generate_map, create_new_player, move_player = game["generate_map"], game["create_new_player"], game["move_player"]
 
   # --------------------------------------------------
   text = (message or "").strip().lower()
@@ -1153,396 +1491,48 @@ def reply(plugin: CustomPluginTemplate, message: str, user: str, **kwargs):
   game_map = plugin.obj_cache["shared_map"]
 
   # ---------------------------
-  # Ensure users dictionary exists
-  # ---------------------------
-  if "users" not in plugin.obj_cache:
-    plugin.obj_cache["users"] = {}
-
-  # ---------------------------
-  # Ensure player data exists
+  # Ensure users dictionary and player data exist
   # ---------------------------
-  if user_id not in plugin.obj_cache["users"] or plugin.obj_cache["users"][user_id] is None:
-    plugin.obj_cache["users"][user_id] = create_new_player()
-
-  player = plugin.obj_cache["users"][user_id]
+  users = plugin.obj_cache.setdefault("users", {})
+  player = users.get(user_id)
+  if player is None:
+    player = create_new_player()
+    users[user_id] = player
   
   # Update the last message time for the player
   player["last_message_time"] = current_time
 
   # ---------------------------
-  # NSEW Controls Processing
-  # ---------------------------
-  # Check if this is a single-letter NSEW command
-  if command in ["n", "s", "e", "w"]:
-    # Map NSEW to directions
-    direction_map = {"n": "up", "s": "down", "e": "right", "w": "left"}
-    direction = direction_map[command]
-    return move_player(plugin.obj_cache["users"][user_id], direction, plugin.obj_cache["shared_map"])
-
-  # ---------------------------
-  # Full compass direction commands (north, south, east, west)
-  # ---------------------------
-  if command in ["north", "south", "east", "west"]:
-    # Map compass directions to up/down/left/right
-    direction_map = {"north": "up", "south": "down", "east": "right", "west": "left"}
-    direction = direction_map[command]
-    return move_player(plugin.obj_cache["users"][user_id], direction, plugin.obj_cache["shared_map"])
-
-  # ---------------------------
-  # 'Go direction' commands (go north, go south, go east, go west)
+  # Movement commands: N/S/E/W, north/south/east/west and 'go <direction>'
   # ---------------------------
   if command == "go" and len(parts) > 1:
-    compass_direction = parts[1].lower()
-    if compass_direction in ["north", "south", "east", "west"]:
-      direction_map = {"north": "up", "south": "down", "east": "right", "west": "left"}
-      direction = direction_map[compass_direction]
-      return move_player(plugin.obj_cache["users"][user_id], direction, plugin.obj_cache["shared_map"])
-    elif compass_direction in ["n", "s", "e", "w"]:
-      direction_map = {"n": "up", "s": "down", "e": "right", "w": "left"}
-      direction = direction_map[compass_direction]
-      return move_player(plugin.obj_cache["users"][user_id], direction, plugin.obj_cache["shared_map"])
-    else:
-      return f"Invalid direction: {compass_direction}. Use north, south, east, or west."
+    if parts[1] not in DIRECTION_ALIASES:
+      return f"Invalid direction: {parts[1]}. Use north, south, east, or west."
+    command = parts[1]
 
-  # Process commands with or without slash
-  if command_without_slash == "start":
-    # First send welcome message and initialization notification
-    welcome_message = ("Welcome to Shadowborn!\n" 
-                      "This is an epic roguelike adventure where you explore a dangerous dungeon, defeat monsters, collect coins, earn XP, and purchase upgrades from the shop.\n" 
-                      "Your goal is to explore the vast map and complete quests.\n"
-                      "All players share the same map - you'll see changes made by other players!\n\n"
-                      "⏳ Initializing your character... Please wait a moment as your hero materializes in the world... ⏳\n\n"
-                      "Use N/S/E/W, north/south/east/west, 'go north', 'go south', 'go east', 'go west'. to move around, status to check your stats, and shop to buy upgrades.\n"
-                      "Commands can be used with or without the leading slash (e.g., /status or status).\n\n"
-                      "For more detailed instructions, use help or /help."
-                      "To discover our world use wiki or /wiki.")
-
-    # Send the welcome message first
-    plugin.send_message_to_user(user_id, welcome_message)
-
-    # Now create the player
-    plugin.obj_cache["users"][user_id] = create_new_player()
-
-    # Generate the map view
-    map_view = visualize_map(plugin.obj_cache["users"][user_id], plugin.obj_cache["shared_map"])
-
-    # Return the map view as a separate message
-    return f"✅ Character initialization complete! Your adventure begins now!\n\n{map_view}"
-
-  elif command_without_slash == "status":
-    p = plugin.obj_cache["users"][user_id]
-    x, y = p["position"]
-    
-    # Get biome information for current position
-    current_tile = game_map[y][x]
-    current_biome = current_tile.get("biome", "PLAINS")
-    biome_emoji = current_tile.get("biome_emoji", "🌾")
-
-    # Calculate total stats including equipment bonuses
-    total_attack = p["attack"]
-    total_damage_reduction = p["damage_reduction"]
-    total_max_health = 0
-    total_dodge = p["dodge_chance"]
-
-    # Get equipment bonuses
-    for slot, item_id in p["equipment"].items():
-      if slot == "accessory":
-        # Handle multiple accessories
-        for acc_id in item_id:
-          if acc_id and acc_id in SHOP_ITEMS:
-            item = SHOP_ITEMS[acc_id]
-            if "attack_bonus" in item:
-              total_attack += item["attack_bonus"]
-            if "damage_reduction" in item:
-              total_damage_reduction += item["damage_reduction"]
-            if "max_health_bonus" in item:
-              total_max_health += item["max_health_bonus"]
-            if "dodge_chance" in item:
-              total_dodge += item["dodge_chance"]
-      else:
-        # Handle single equipment items (weapon, armor)
-        if item_id and item_id in SHOP_ITEMS:
-          item = SHOP_ITEMS[item_id]
-          if "attack_bonus" in item:
-            total_attack += item["attack_bonus"]
-          if "damage_reduction" in item:
-            total_damage_reduction += item["damage_reduction"]
-          if "max_health_bonus" in item:
-            total_max_health += item["max_health_bonus"]
-          if "dodge_chance" in item:
-            total_dodge += item["dodge_chance"]
-
-    # Format damage reduction and dodge chance as percentages
-    damage_reduction_percent = int(total_damage_reduction * 100)
-    dodge_percent = int(total_dodge * 100)
-
-    # Calculate how long the player has been in their current status
-    status_duration = int(plugin.time() - p["status_since"])
-    minutes, seconds = divmod(status_duration, 60)
-    
-    # Get status emoji and formatted status name
-    status_emoji = "🔍"
-    status_display = "Exploring"
-    
-    if p["status"] == "fighting":
-      status_emoji = "⚔️"
-      status_display = "Fighting"
-    elif p["status"] == "recovering":
-      status_emoji = "💤"
-      status_display = "Recovering"
-    elif p["status"] == "prepare_to_fight":
-      status_emoji = "⚠️"
-      status_display = "Deciding to Fight"
-    
-    # Build equipment list
-    equipment_list = []
-    if p["equipment"]["weapon"]:
-      equipment_list.append(f"Weapon: {SHOP_ITEMS[p['equipment']['weapon']]['name']}")
-    if p["equipment"]["armor"]:
-      equipment_list.append(f"Armor: {SHOP_ITEMS[p['equipment']['armor']]['name']}")
-    for accessory in p["equipment"]["accessory"]:
-      equipment_list.append(f"Accessory: {SHOP_ITEMS[accessory]['name']}")
-
-    equipment_str = "\n".join(equipment_list) if equipment_list else "None"
-
-    # Build inventory list
-    inventory_list = []
-    for item_id, count in p["inventory"].items():
-      if count > 0:
-        if item_id in SHOP_ITEMS:
-          inventory_list.append(f"{SHOP_ITEMS[item_id]['name']}: {count}")
-        else:
-          inventory_list.append(f"{item_id}: {count}")
+  direction = DIRECTION_ALIASES.get(command)
+  if direction is not None:
+    return move_player(player, direction, game_map)
 
-    inventory_str = "\n".join(inventory_list) if inventory_list else "Empty"
+  # Process commands with or without slash
+  handler = COMMAND_HANDLERS.get(command_without_slash)
+  if handler is not None:
+    return handler(player, parts, user_id, game_map)
+
+  return ("Commands:\n"
+          "/start or start - Restart your character (keeps the shared map)\n" 
+          "N/S/W/E or north/south/west/east - Move your character in the specified direction\n"
+          "'go north', 'go south', etc. - Alternative way to move in the specified direction\n"
+          "/status or status - Display your current stats: position, health, coins, level, XP, damage reduction, and kills\n" 
+          "/map or map - Reveal the map of your surroundings\n"
+          "/shop or shop - Visit the shop to buy upgrades and items\n" 
+          "/buy or buy <item_name> - Purchase an item from the shop. You can use spaces in item names (e.g., 'map scroll')\n" 
+          "/use or use <item_name> - Use a consumable item from your inventory. You can use spaces in item names (e.g., 'energy drink')\n"
+          "/fight or fight - Engage in combat with a monster you've encountered\n"
+          "/flee or flee - Retreat from a monster encounter back to your previous position\n"
+          "/wiki or wiki - Access the game's knowledge base with additional information and tips\n"
+          "/help or help - Display this help message")
 
-    # Define biomes and their specifications (reference)
-    biomes = {
-      "FOREST": {
-        "emoji": "🌲",
-        "description": "A dense forest with healing herbs",
-        "energy_multiplier": 1.0
-      },
-      "LAVA_CAVES": {
-        "emoji": "🌋",
-        "description": "Hot caves with dangerous traps but valuable treasures",
-        "energy_multiplier": 1.2
-      },
-      "ICE_WASTES": {
-        "emoji": "❄️",
-        "description": "Frozen wasteland that slows movement",
-        "energy_multiplier": 1.5
-      },
-      "PLAINS": {
-        "emoji": "🌾",
-        "description": "Flat plains with balanced features",
-        "energy_multiplier": 1.0
-      }
-    }
-    
-    # Get biome effects description
-    biome_effects = ""
-    if current_biome in biomes:
-      biome_data = biomes[current_biome]
-      if biome_data.get("energy_multiplier", 1.0) > 1.0:
-        biome_effects = f"(Movement Energy: x{biome_data['energy_multiplier']})"
-
-    status_message = (f"📊 STATUS 📊\n"
-                     f"🗺️ Position: ({x}, {y})\n"
-                     f"🌍 Biome: {biome_emoji} {current_biome.replace('_', ' ')} {biome_effects}\n"
-                     f"👤 Status: {status_emoji} {status_display} ({minutes}m {seconds}s)\n"
-                     f"❤️ Health: {int(p['health'])}/{p['max_health']} (Regen: {p['hp_regen_rate']:.1f}/min)\n"
-                     f"⚡ Energy: {int(p['energy'])}/{p['max_energy']} (Regen: {p['energy_regen_rate']:.1f}/min)\n"
-                     f"💰 Coins: {p['coins']}\n"
-                     f"📊 Level: {p['level']} (XP: {p['xp']}/{p['next_level_xp']})\n"
-                     f"⚔️ Attack: {total_attack}\n"
-                     f"🛡️ Damage Reduction: {damage_reduction_percent}%\n"
-                     f"👟 Dodge Chance: {dodge_percent}%\n\n"
-                     f"🎒 INVENTORY:\n{inventory_str}\n\n"
-                     f"🧥 EQUIPMENT:\n{equipment_str}")
-
-    return status_message
-
-  elif command_without_slash == "map":
-    return visualize_map(plugin.obj_cache["users"][user_id], plugin.obj_cache["shared_map"])
-
-  elif command_without_slash == "shop":
-    return display_shop(player)
-
-  elif command_without_slash == "buy":
-    if len(parts) < 2:
-      return "Usage: /buy <item_name>\nUse /shop to see available items.\nYou can use spaces in item names (e.g., 'map scroll')"
-
-    # Join all words after 'buy' and convert spaces to underscores to match item_id format
-    item_id = '_'.join(parts[1:]).lower()
-    return buy_item(player, item_id)
-
-  elif command_without_slash == "use":
-    if len(parts) < 2:
-      return "Usage: /use <item_name>\nItems you can use: health_potion, map_scroll, energy_drink, bomb\nYou can use spaces in item names (e.g., 'energy drink')"
-
-    # Join all words after 'use' and convert spaces to underscores to match item_id format
-    item_id = '_'.join(parts[1:]).lower()
-    return use_item(player, item_id, game_map)
-
-  elif command_without_slash == "help":
-    return display_help()
-
-  elif command in ["/wiki", "wiki"]:
-    wiki_text = (
-      "📚 SHADOWBORN WIKI 📚\n\n"
-      "🎯 MONSTER TYPES & LEVELS:\n"
-      "1. 👹 Goblin (Levels 1-3)\n"
-      "   • Base HP: 5\n"
-      "   • Damage: 1-3\n"
-      "   • XP Reward: 2\n"
-      "   • Coin Reward: 1-3\n\n"
-      "2. 👺 Orc (Levels 4-6)\n"
-      "   • Base HP: 8\n"
-      "   • Damage: 2-4\n"
-      "   • XP Reward: 3\n"
-      "   • Coin Reward: 2-4\n\n"
-      "3. 👿 Demon (Levels 7-9)\n"
-      "   • Base HP: 12\n"
-      "   • Damage: 3-6\n"
-      "   • XP Reward: 5\n"
-      "   • Coin Reward: 3-6\n\n"
-      "📊 MONSTER LEVEL DISTRIBUTION:\n"
-      "• Level 1: 30% (Most Common)\n"
-      "• Level 2: 20%\n"
-      "• Level 3: 15%\n"
-      "• Level 4: 10%\n"
-      "• Level 5: 8%\n"
-      "• Level 6: 7%\n"
-      "• Level 7: 5%\n"
-      "• Level 8: 3%\n"
-      "• Level 9: 2% (Rarest)\n\n"
-      "⚔️ COMBAT MECHANICS:\n"
-      "• Combat starts automatically when moving onto a monster tile\n"
-      "• Each combat round takes 5 seconds\n"
-      "• Energy cost for combat: 3\n"
-      "• Dodge chance reduces incoming damage to 0\n"
-      "• Damage reduction reduces incoming damage by percentage\n\n"
-      "💫 PLAYER STATUS EFFECTS:\n"
-      "1. Exploring (🔍)\n"
-      "   • Normal health and energy regeneration\n"
-      "   • Standard movement speed\n\n"
-      "2. Fighting (⚔️)\n"
-      "   • Reduced health regeneration (50%)\n"
-      "   • Normal energy regeneration\n"
-      "   • Cannot move until combat ends\n\n"
-      "3. Recovering (💤)\n"
-      "   • Increased health regeneration (150%)\n"
-      "   • Increased energy regeneration (150%)\n"
-      "   • Cannot move until fully healed\n\n"
-      "🎒 INVENTORY ITEMS:\n"
-      "• Health Potion (🧪): Restores 5 HP\n"
-      "• Map Scroll (📜): Reveals larger area\n"
-      "• Energy Drink (🧃): Restores 10 energy points\n"
-      "• Bomb (💣): Deals 5 damage to a monster before combat starts\n\n"
-      "🛍️ SHOP ITEMS:\n"
-      "• Health Potion: 5 coins\n"
-      "• Sword (⚔️): +1 Attack, 15 coins\n"
-      "• Shield (🛡️): +10% Damage Reduction, 20 coins\n"
-      "• Magic Amulet (🔮): +3 Max Health, 25 coins\n"
-      "• Speed Boots (👢): +5% Dodge Chance, 30 coins\n"
-      "• Map Scroll: 10 coins\n"
-      "• Energy Drink: 7 coins\n"
-      "• Bomb: 15 coins\n\n"
-      "💡 TIPS:\n"
-      "• Use /status to check your stats\n"
-      "• Use /map to view your surroundings\n"
-      "• Higher level monsters give better rewards\n"
-      "• Always keep some health potions for emergencies\n"
-      "• Use map scrolls to plan your route\n"
-      "• Consider your energy before engaging in combat"
-    )
-    return wiki_text
-
-  elif command_without_slash == "botstatus":
-    # Show bot status information
-    if "bot_status" not in plugin.obj_cache:
-      return "Bot status information not available."
-    
-    status = plugin.obj_cache["bot_status"]
-    current_time = plugin.time()
-    
-    # Calculate uptime
-    uptime_seconds = current_time - status.get("creation_time", current_time)
-    minutes, seconds = divmod(uptime_seconds, 60)
-    hours, minutes = divmod(minutes, 60)
-    
-    # Check if the world is initialized
-    initialization_status = "✅ Initialized" if status.get("initialized", False) else "❌ Not Initialized"
-    
-    # Calculate map statistics if available
-    map_stats = ""
-    if "shared_map" in plugin.obj_cache:
-      total_tiles = GRID_WIDTH * GRID_HEIGHT
-      visible_tiles = sum(1 for row in plugin.obj_cache["shared_map"] for tile in row if tile["visible"])
-      exploration_percentage = (visible_tiles / total_tiles) * 100
-      
-      # Count different tile types
-      tile_counts = {"COIN": 0, "TRAP": 0, "MONSTER": 0, "HEALTH": 0, "EMPTY": 0}
-      for row in plugin.obj_cache["shared_map"]:
-        for tile in row:
-          if tile["type"] in tile_counts:
-            tile_counts[tile["type"]] += 1
-      
-      map_stats = (f"\n\n🗺️ MAP STATISTICS:\n"
-                  f"Map Size: {GRID_WIDTH}×{GRID_HEIGHT} ({total_tiles} tiles)\n"
-                  f"Explored: {visible_tiles} tiles ({exploration_percentage:.1f}%)\n"
-                  f"Coins remaining: {tile_counts['COIN']}\n"
-                  f"Monsters remaining: {tile_counts['MONSTER']}\n"
-                  f"Health pickups remaining: {tile_counts['HEALTH']}")
-    
-    # Count users
-    user_count = len(plugin.obj_cache.get("users", {}))
-    active_users = sum(1 for user in plugin.obj_cache.get("users", {}).values() if user is not None)
-    
-    # Format status message
-    status_message = (f"🤖 BOT STATUS 🤖\n\n"
-                     f"Status: {status['status']}\n"
-                     f"Initialization: {initialization_status}\n"
-                     f"Uptime: {int(hours)}h {int(minutes)}m {int(seconds)}s\n"
-                     f"Map Generation Time: {status.get('map_generation_time', 'N/A'):.2f}s\n\n"
-                     f"👥 USERS:\n"
-                     f"Total Users: {user_count}\n"
-                     f"Active Players: {active_users}"
-                     f"{map_stats}")
-    
-    return status_message
-
-  elif command_without_slash == "fight":
-    response = handle_fight_command(player, game_map)
-    # Make sure we save the updated player state back to the cache
-    plugin.obj_cache["users"][user_id] = player
-    return response
-
-  elif command_without_slash == "flee":
-    response = handle_flee_command(player, game_map)
-    
-    # Clean up combat session if user was in combat
-    if user_id in plugin.obj_cache.get("combat", {}):
-      del plugin.obj_cache["combat"][user_id]
-    
-    return response
-    
-  else:
-    return ("Commands:\n"
-            "/start or start - Restart your character (keeps the shared map)\n" 
-            "N/S/W/E or north/south/west/east - Move your character in the specified direction\n"
-            "'go north', 'go south', etc. - Alternative way to move in the specified direction\n"
-            "/status or status - Display your current stats: position, health, coins, level, XP, damage reduction, and kills\n" 
-            "/map or map - Reveal the map of your surroundings\n"
-            "/shop or shop - Visit the shop to buy upgrades and items\n" 
-            "/buy or buy <item_name> - Purchase an item from the shop. You can use spaces in item names (e.g., 'map scroll')\n" 
-            "/use or use <item_name> - Use a consumable item from your inventory. You can use spaces in item names (e.g., 'energy drink')\n"
-            "/fight or fight - Engage in combat with a monster you've encountered\n"
-            "/flee or flee - Retreat from a monster encounter back to your previous position\n"
-            "/wiki or wiki - Access the game's knowledge base with additional information and tips\n"
-            "/help or help - Display this help message"
-            + ("\n/init or init - Initialize the game world (admin only)" if not plugin.obj_cache["bot_status"]["initialized"] else ""))
 
 # --------------------------------------------------
 # PROCESSING HANDLER
@@ -1561,6 +1551,10 @@ def loop_processing(plugin):
   MAX_LEVEL = 10
   COMBAT_DECISION_TIME = 5  # Seconds player has to decide to fight or flee
 
+  # Tile type codes of the shared map grids (same as in `reply`)
+  TILE_TYPES = ("EMPTY", "COIN", "TRAP", "MONSTER", "HEALTH")
+  TILE_EMPTY, TILE_COIN, TILE_TRAP, TILE_MONSTER, TILE_HEALTH = range(len(TILE_TYPES))
+
   # Monster types and their stats
   MONSTER_TYPES = {
     "goblin": {
@@ -1644,7 +1638,7 @@ def loop_processing(plugin):
   def check_exploration_progress(game_map):
     """Calculates the percentage of the map that has been explored (for informational purposes only)."""
     total_tiles = GRID_WIDTH * GRID_HEIGHT
-    visible_tiles = sum(1 for row in game_map for tile in row if tile["visible"])
+    visible_tiles = int(plugin.np.count_nonzero(game_map["visible"]))
     return (visible_tiles / total_tiles) * 100
 
   def find_random_empty_spot(game_map):
@@ -1652,28 +1646,20 @@ def loop_processing(plugin):
     Finds a random empty spot on the map.
     Returns tuple of (x, y) coordinates or (0, 0) if no empty spots found.
     """
-    empty_spots = []
-    for y in range(GRID_HEIGHT):
-      for x in range(GRID_WIDTH):
-        if game_map[y][x]["type"] == "EMPTY":
-          empty_spots.append((x, y))
-      
-    if empty_spots:
-      # Convert empty_spots to numpy array for random choice
-      empty_spots_array = plugin.np.array(empty_spots)
-      random_index = plugin.np.random.randint(0, len(empty_spots))
-      return tuple(empty_spots_array[random_index])
+    empty_spots = plugin.np.flatnonzero(game_map["type"] == TILE_EMPTY)
+    
+    if empty_spots.size:
+      # Flat indices are row-major, so divmod by the width gives (y, x)
+      y, x = divmod(int(empty_spots[plugin.np.random.randint(0, empty_spots.size)]), GRID_WIDTH)
+      return (x, y)
     
     return (0, 0)  # Fallback to origin if no empty spots found
   
   def reveal_surroundings(player, game_map):
     """Reveals the tiles around the player."""
-    x, y = player["position"]
-    for dy in range(-1, 2):
-      for dx in range(-1, 2):
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
-          game_map[ny][nx]["visible"] = True
+    x, y = player["x"], player["y"]
+    # Slices stop at the grid edges on their own, so only the lower bounds need clamping
+    game_map["visible"][max(0, y - 1):y + 2, max(0, x - 1):x + 2] = True
 
     
   def update_player_status(player, new_status):
@@ -1863,9 +1849,9 @@ def loop_processing(plugin):
         total_health_lost = combat_session["initial_player_health"] - player["health"]
         
         # Clear the monster tile
-        x, y = player["position"]
-        game_map[y][x]["type"] = "EMPTY"
-        game_map[y][x]["monster_level"] = 0
+        x, y = player["x"], player["y"]
+        game_map["type"][y, x] = TILE_EMPTY
+        game_map["monster_level"][y, x] = 0
         
         # Set player back to exploring
         player = update_player_status(player, "exploring")
@@ -1911,9 +1897,9 @@ def loop_processing(plugin):
       total_health_lost = combat_session["initial_player_health"] - player["health"]
       
       # Clear the monster tile
-      x, y = player["position"]
-      game_map[y][x]["type"] = "EMPTY"
-      game_map[y][x]["monster_level"] = 0
+      x, y = player["x"], player["y"]
+      game_map["type"][y, x] = TILE_EMPTY
+      game_map["monster_level"][y, x] = 0
       
       # Set player back to exploring
       player = update_player_status(player, "exploring")
@@ -1969,8 +1955,8 @@ def loop_processing(plugin):
         
         # Find random empty spot for respawn
         respawn_x, respawn_y = find_random_empty_spot(game_map)
-        player["position"] = (respawn_x, respawn_y)
-        game_map[respawn_y][respawn_x]["visible"] = True
+        player["x"], player["y"] = respawn_x, respawn_y
+        game_map["visible"][respawn_y, respawn_x] = True
         reveal_surroundings(player, game_map)
         
         # Set status to recovering
@@ -2069,8 +2055,8 @@ def loop_processing(plugin):
           plugin.send_message_to_user(user_id, "⏱️ Time's up! You couldn't decide in time. The monster attacks!")
           
           # Get player position and create monster for combat
-          x, y = player["position"]
-          monster_level = plugin.obj_cache["shared_map"][y][x]["monster_level"]
+          x, y = player["x"], player["y"]
+          monster_level = int(plugin.obj_cache["shared_map"]["monster_level"][y, x])
           
           # Set player to fighting status
           update_player_status(player, "fighting")
@@ -2099,8 +2085,8 @@ def loop_processing(plugin):
         # Initialize or get combat session
         if user_id not in plugin.obj_cache["combat"]:
           # Get player's position and monster level
-          x, y = player["position"]
-          monster_level = plugin.obj_cache["shared_map"][y][x]["monster_level"]
+          x, y = player["x"], player["y"]
+          monster_level = int(plugin.obj_cache["shared_map"]["monster_level"][y, x])
           
           # Create new combat session using the stored monster type if available
           if "current_monster_type" in player:
@@ -0,0 +1,77 @@
+"""
+Micro-benchmark for the uncached core of `_EVMMixin.is_valid_evm_address`.
+
+Compares the current `bytes.fromhex` check against a lane-parallel (SWAR) check
+implemented over a single 320-bit Python int, a compiled regex `fullmatch` and a
+`str.translate` deletion table. Pure-Python SWAR needs ~10 big-int operations which
+costs more than the single C-level `bytes.fromhex` scan; the regex and translate
+scans are C-level too but still slower, so the SDK keeps `bytes.fromhex`
+(behind `lru_cache`).
+
+Usage:
+  python xperimental/eth/evm_address_validation_bench.py
+"""
+import re
+import timeit
+
+from ratio1.bc.evm import _is_valid_evm_address_cached
+
+N_ITERS = 200_000
+
+LANES = 40
+ONES = int.from_bytes(b"\x01" * LANES, "big")
+HIGH_BITS = 0x80 * ONES
+LOWER_BIT = 0x20 * ONES
+
+_HEX40 = re.compile(r"[0-9a-fA-F]{40}").fullmatch
+_HEX_DELETE_TABLE = str.maketrans("", "", "0123456789abcdefABCDEF")
+
+
+def is_hex40_fromhex(address):
+  try:
+    return len(bytes.fromhex(address[2:])) == 20
+  except ValueError:
+    return False
+
+
+def is_hex40_regex(address):
+  return _HEX40(address, 2) is not None
+
+
+def is_hex40_translate(address):
+  hex_part = address[2:]
+  return len(hex_part) == 40 and not hex_part.translate(_HEX_DELETE_TABLE)
+
+
+def is_hex40_swar(address):
+  raw = address[2:].encode("ascii", "replace")
+  if len(raw) != LANES:
+    return False
+  word = int.from_bytes(raw, "big")
+  if word & HIGH_BITS:
+    return False
+  lower = word | LOWER_BIT
+  # per lane: '0' <= c <= '9'  or  'a' <= (c | 0x20) <= 'f'
+  digits = ((word + (0x80 - 0x30) * ONES) & ~(word + (0x80 - 0x3A) * ONES)) & HIGH_BITS
+  letters = ((lower + (0x80 - 0x61) * ONES) & ~(lower + (0x80 - 0x67) * ONES)) & HIGH_BITS
+  return (digits | letters) == HIGH_BITS
+
+
+if __name__ == '__main__':
+  samples = ["0x" + "aB" * 20, "0x" + "ag" * 20, "0x" + "/:" * 20, "0x" + "@G" * 20]
+  for fn in [is_hex40_fromhex, is_hex40_regex, is_hex40_translate, is_hex40_swar]:
+    results = [fn(s) for s in samples]
+    assert results == [True, False, False, False], (fn.__name__, results)
+  #endfor sanity checks
+
+  address = samples[0]
+  candidates = {
+    "fromhex": lambda: is_hex40_fromhex(address),
+    "regex": lambda: is_hex40_regex(address),
+    "translate": lambda: is_hex40_translate(address),
+    "swar": lambda: is_hex40_swar(address),
+    "sdk (lru_cache hit)": lambda: _is_valid_evm_address_cached(address),
+  }
+  for name, fn in candidates.items():
+    elapsed = timeit.timeit(fn, number=N_ITERS)
+    print("{:>20}: {:7.1f} ns/call".format(name, elapsed / N_ITERS * 1e9))
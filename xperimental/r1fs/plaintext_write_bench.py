@@ -0,0 +1,60 @@
+"""
+Micro-benchmark for writing the decrypted plaintext in `R1FSEngine.get_file`.
+
+Compares the SDK loop (`update_into` a reused 4 MB buffer, one `write` per chunk)
+with staging the whole plaintext in a preallocated `bytearray` and writing it with a
+single `write`. With 4 MB chunks there are only ~32 writes for 128 MB, so the
+syscalls saved by staging are negligible. Staging instead faults in a buffer as
+large as the file and is typically 1.3-1.8x slower. It would also keep unverified
+plaintext of the whole file in memory. The SDK keeps the chunked writes.
+
+Usage:
+  python xperimental/r1fs/plaintext_write_bench.py
+"""
+import os
+import shutil
+import tempfile
+import timeit
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+N_ITERS = 5
+DATA_SIZE = 128 * 1024 * 1024
+CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def write_chunked(key, nonce, ciphertext, out_buffer, path):
+  decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).decryptor()
+  with open(path, "wb") as fout:
+    for start in range(0, len(ciphertext), CHUNK_SIZE):
+      n_plain = decryptor.update_into(ciphertext[start:start + CHUNK_SIZE], out_buffer)
+      fout.write(out_buffer[:n_plain])
+  return
+
+
+def write_staged(key, nonce, ciphertext, path):
+  decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).decryptor()
+  staged = memoryview(bytearray(len(ciphertext) + 15))
+  offset = 0
+  for start in range(0, len(ciphertext), CHUNK_SIZE):
+    offset += decryptor.update_into(ciphertext[start:start + CHUNK_SIZE], staged[offset:])
+  with open(path, "wb") as fout:
+    fout.write(staged[:offset])
+  return
+
+
+if __name__ == '__main__':
+  key, nonce = os.urandom(32), os.urandom(12)
+  ciphertext = memoryview(os.urandom(DATA_SIZE))
+  out_buffer = memoryview(bytearray(CHUNK_SIZE + 15))
+  folder = tempfile.mkdtemp()
+  try:
+    candidates = {
+      "chunked writes": lambda: write_chunked(key, nonce, ciphertext, out_buffer, os.path.join(folder, "chunked")),
+      "staged write": lambda: write_staged(key, nonce, ciphertext, os.path.join(folder, "staged")),
+    }
+    for name, fn in candidates.items():
+      elapsed = timeit.timeit(fn, number=N_ITERS)
+      print("{:>16}: {:7.1f} ms per {} MB".format(name, elapsed / N_ITERS * 1e3, DATA_SIZE // (1024 * 1024)))
+  finally:
+    shutil.rmtree(folder)
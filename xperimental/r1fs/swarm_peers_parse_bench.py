@@ -0,0 +1,70 @@
+"""
+Micro-benchmark for parsing the swarm peer list (`R1FSEngine._get_swarm_peers`).
+
+The SDK reads the peers from the daemon RPC (`/api/v0/swarm/peers`, JSON) instead
+of the `ipfs swarm peers` CLI. This compares, for a 1000-peer swarm:
+
+- `cli str`: the former `text=True` output with `.strip().split("\\n")`
+- `cli bytes`: bytes output with `splitlines()` and an ASCII decode per line
+- `rpc json`/`rpc orjson`: decoding the RPC body and building the same lines
+
+One bulk decode beats a decode per line, so the bytes variant is ~2x slower than the
+str one. All of these take tens to hundreds of microseconds, while a CLI process spawn
+takes tens of milliseconds, which is why the SDK queries the RPC.
+
+Usage:
+  python xperimental/r1fs/swarm_peers_parse_bench.py
+"""
+import json
+import timeit
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+N_ITERS = 500
+N_PEERS = 1000
+
+PEERS = [
+  {"Addr": "/ip4/10.0.{}.{}/tcp/4001".format(i // 256, i % 256), "Peer": "12D3KooW{:044d}".format(i)}
+  for i in range(N_PEERS)
+]
+CLI_TEXT = "".join("{}/p2p/{}\n".format(p["Addr"], p["Peer"]) for p in PEERS)
+CLI_BYTES = CLI_TEXT.encode("ascii")
+RPC_BODY = json.dumps({"Peers": PEERS}).encode("utf-8")
+
+
+def parse_cli_str():
+  return CLI_BYTES.decode("utf-8").strip().split("\n")
+
+
+def parse_cli_bytes():
+  return [line.decode("ascii") for line in CLI_BYTES.splitlines() if line]
+
+
+def _peer_lines(data):
+  return [f'{peer.get("Addr", "")}/p2p/{peer.get("Peer", "")}' for peer in (data.get("Peers") or [])]
+
+
+def parse_rpc_json():
+  return _peer_lines(json.loads(RPC_BODY))
+
+
+def parse_rpc_orjson():
+  return _peer_lines(orjson.loads(RPC_BODY))
+
+
+if __name__ == '__main__':
+  candidates = {
+    "cli str": parse_cli_str,
+    "cli bytes": parse_cli_bytes,
+    "rpc json": parse_rpc_json,
+  }
+  if orjson is not None:
+    candidates["rpc orjson"] = parse_rpc_orjson
+  expected = parse_cli_str()
+  for name, fn in candidates.items():
+    assert fn() == expected, name
+    elapsed = timeit.timeit(fn, number=N_ITERS)
+    print("{:>12}: {:7.1f} us per {} peers".format(name, elapsed / N_ITERS * 1e6, N_PEERS))